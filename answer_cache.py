@@ -0,0 +1,183 @@
+import asyncio
+import hashlib
+import re
+import sqlite3
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+WHITESPACE = re.compile(r'\s+')
+TRAILING_PUNCTUATION = re.compile(r'[\s?!.。？！¿¡]+$')
+
+def normalize_question(question):
+    """Normalize a question so trivially different phrasings share a cache entry"""
+    text = unicodedata.normalize("NFKC", question).lower().strip()
+    text = WHITESPACE.sub(" ", text)
+    return TRAILING_PUNCTUATION.sub("", text).lstrip("¿¡ ")
+
+def make_cache_key(question, lang_code, kb_version):
+    """Cache key for a question, its resolved language and the knowledge base version"""
+    raw = f"{kb_version}\x1f{lang_code}\x1f{normalize_question(question)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class AnswerCache:
+    """LRU + TTL cache of Gemini answers with an optional SQLite tier.
+
+    Memory hits never wait. The SQLite tier (WAL) runs on a single-thread executor like the
+    reminder and poll stores, and expired rows are purged on open and every purge_interval
+    seconds, which also clears answers for old knowledge base versions once their TTL ends.
+    """
+
+    def __init__(self, max_entries=1000, max_bytes=5 * 1024 * 1024, ttl_seconds=86400, db_path=None,
+                 purge_interval=3600):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.purge_interval = purge_interval
+        self._entries = OrderedDict()  # key -> (answer, stored_at)
+        self.size_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.db = None
+        self._executor = None
+        self._purge_task = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _open_sync(self):
+        db = sqlite3.connect(self.db_path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            "key TEXT PRIMARY KEY, answer TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS idx_answers_stored ON answers (stored_at)")
+        db.commit()
+        self.db = db
+
+    async def open(self):
+        """Open the SQLite tier (if configured), drop expired rows and start the periodic purge"""
+        if self.db_path and self.db is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="answer-db")
+            await self._run(self._open_sync)
+        await self.purge_expired()
+        if self.purge_interval and self._purge_task is None:
+            self._purge_task = asyncio.create_task(self._purge_periodically())
+        return self
+
+    async def _purge_periodically(self):
+        while True:
+            await asyncio.sleep(self.purge_interval)
+            try:
+                await self.purge_expired()
+            except Exception as e:
+                print(f"❌ Answer cache purge failed: {e}")
+
+    @staticmethod
+    def _entry_size(key, answer):
+        return len(key) + len(answer.encode("utf-8"))
+
+    def _expired(self, stored_at, now):
+        return now - stored_at > self.ttl_seconds
+
+    def _remove(self, key):
+        answer, _ = self._entries.pop(key)
+        self.size_bytes -= self._entry_size(key, answer)
+
+    def _store_memory(self, key, answer, stored_at):
+        if key in self._entries:
+            self._remove(key)
+        size = self._entry_size(key, answer)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (answer, stored_at)
+        self.size_bytes += size
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _load_sync(self, key, now):
+        row = self.db.execute("SELECT answer, stored_at FROM answers WHERE key = ?", (key,)).fetchone()
+        if row and self._expired(row[1], now):
+            self.db.execute("DELETE FROM answers WHERE key = ?", (key,))
+            self.db.commit()
+            return None
+        return row
+
+    async def get(self, key):
+        """Return the cached answer for key, or None"""
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            answer, stored_at = entry
+            if not self._expired(stored_at, now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return answer
+            self._remove(key)
+
+        if self.db is not None:
+            row = await self._run(self._load_sync, key, now)
+            if row:
+                answer, stored_at = row
+                self._store_memory(key, answer, stored_at)
+                self.hits += 1
+                self.disk_hits += 1
+                return answer
+
+        self.misses += 1
+        return None
+
+    def _write_sync(self, key, answer, stored_at):
+        self.db.execute(
+            "INSERT OR REPLACE INTO answers (key, answer, stored_at) VALUES (?, ?, ?)",
+            (key, answer, stored_at)
+        )
+        self.db.commit()
+
+    async def put(self, key, answer):
+        """Store an answer in memory and, if configured, on disk"""
+        stored_at = time.time()
+        self._store_memory(key, answer, stored_at)
+        if self.db is not None:
+            await self._run(self._write_sync, key, answer, stored_at)
+
+    def _purge_sync(self, cutoff):
+        deleted = self.db.execute("DELETE FROM answers WHERE stored_at < ?", (cutoff,)).rowcount
+        self.db.commit()
+        return deleted
+
+    async def purge_expired(self):
+        """Drop expired entries from both tiers, returning how many disk rows were deleted"""
+        cutoff = time.time() - self.ttl_seconds
+        for key in [key for key, (_, stored_at) in self._entries.items() if stored_at < cutoff]:
+            self._remove(key)
+        if self.db is not None:
+            return await self._run(self._purge_sync, cutoff)
+        return 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return (self.hits / total * 100) if total else 0.0
+
+    async def close(self):
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            self._purge_task = None
+        if self.db is not None:
+            await self._run(self.db.close)
+            self.db = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
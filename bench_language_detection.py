@@ -0,0 +1,106 @@
+"""
+Benchmark: legacy detect_language vs the fast-path/cached detector
+==================================================================
+
+Runs both detectors over a mixed-language corpus and reports throughput and
+how often they agree. The corpus is cycled so repeated questions (as in a
+busy server) also exercise the LRU cache.
+
+Usage: python bench_language_detection.py [--rounds 20]
+"""
+
+import argparse
+import time
+
+from langdetect import detect_langs
+
+import language_support
+from language_support import LANGUAGE_NAMES, detect_language
+
+CORPUS = [
+    "Hi", "Hello there", "Good morning team", "thanks for the help",
+    "What are the office hours?", "How do pull requests work at CreoWis?",
+    "Can you explain how React hooks work?", "What is the capital of France?",
+    "¿Cuáles son las horas de oficina?", "¿Cómo funcionan los pull requests?",
+    "Quelles sont les heures de bureau?", "Comment allez-vous aujourd'hui?",
+    "Wie sind die Bürozeiten?", "Was ist die Hauptstadt von Frankreich?",
+    "Quali sono gli orari di ufficio?", "Quais são os horários do escritório?",
+    "Wat zijn de kantooruren?", "Mitkä ovat toimiston aukioloajat?",
+    "Каковы часы работы офиса?", "Привіт, як справи?", "Здравейте, как сте?",
+    "オフィスの営業時間は何時ですか？", "フランスの首都は何ですか？",
+    "사무실 운영 시간은 언제인가요?", "办公时间是什么时候？", "法国的首都是哪里？",
+    "कार्यालय के घंटे क्या हैं?", "ساعات العمل في المكتب ما هي؟",
+    "ساعات کاری دفتر چیست؟", "เวลาทำการของสำนักงานคือกี่โมง", "שעות הפעילות של המשרד?",
+    "Ofis çalışma saatleri nedir?", "Jakie są godziny pracy biura?",
+    "Vilka är kontorstiderna?", "What is the weather like and how are you?",
+]
+
+def legacy_detect_language(text):
+    """detect_language as it was before the fast path (for comparison)"""
+    try:
+        english_greetings = [
+            'hi', 'hello', 'hey', 'help', 'thanks', 'thank you', 'yes', 'no',
+            'ok', 'okay', 'sure', 'please', 'sorry', 'excuse me', 'good morning',
+            'good afternoon', 'good evening', 'good night', 'goodbye', 'bye',
+            'how are you', 'nice to meet you', 'see you later'
+        ]
+        text_lower = text.lower().strip()
+        if text_lower in english_greetings:
+            return 'en', 'English'
+        for greeting in english_greetings:
+            if text_lower.startswith(greeting):
+                return 'en', 'English'
+
+        lang_probs = detect_langs(text)
+        detected_lang = lang_probs[0].lang
+        confidence = lang_probs[0].prob
+        if confidence < 0.7 or len(text.split()) < 3:
+            for lang_prob in lang_probs[:2]:
+                if lang_prob.lang == 'en':
+                    return 'en', 'English'
+            if confidence < 0.5:
+                return 'en', 'English'
+        if detected_lang == 'fi':
+            english_indicators = ['the', 'and', 'or', 'is', 'are', 'was', 'were', 'have', 'has', 'had', 'will', 'would', 'can', 'could', 'should', 'what', 'how', 'when', 'where', 'why', 'who']
+            if sum(1 for word in english_indicators if word in text_lower) >= 2:
+                return 'en', 'English'
+        return detected_lang, LANGUAGE_NAMES.get(detected_lang, detected_lang)
+    except Exception:
+        return 'en', 'English'
+
+def run(detector, texts):
+    start = time.perf_counter()
+    results = [detector(text)[0] for text in texts]
+    return results, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    texts = CORPUS * args.rounds
+    detect_language(CORPUS[0])  # load langdetect profiles before timing
+    legacy_detect_language(CORPUS[4])
+
+    legacy_results, legacy_time = run(legacy_detect_language, texts)
+
+    language_support._detect_normalized.cache_clear()
+    cold_results, cold_time = run(detect_language, CORPUS)
+    new_results, new_time = run(detect_language, texts)
+
+    # langdetect reports Chinese as zh-cn / zh-tw; the new detector uses LANGUAGE_NAMES' 'zh'
+    agree = sum(1 for old, new in zip(legacy_results, new_results)
+                if old == new or (old.startswith('zh') and new == 'zh'))
+
+    print(f"📚 Corpus: {len(CORPUS)} distinct texts × {args.rounds} rounds = {len(texts)} detections\n")
+    print(f"🐢 Legacy:            {len(texts) / legacy_time:>10,.0f} texts/s")
+    print(f"⚡ New (cold cache):  {len(CORPUS) / cold_time:>10,.0f} texts/s")
+    print(f"⚡ New (warm cache):  {len(texts) / new_time:>10,.0f} texts/s")
+    print(f"🤝 Agreement:         {agree / len(texts) * 100:.1f}%")
+
+    for text, old, new in zip(CORPUS, legacy_results, cold_results):
+        if old != new:
+            print(f"   ↔️  '{text}': legacy={old} new={new}")
+
+if __name__ == "__main__":
+    main()
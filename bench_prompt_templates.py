@@ -0,0 +1,115 @@
+"""
+Benchmark: per-request prompt f-string vs precomputed prefix + per-question suffix
+================================================================================
+
+For the real knowledge_base.txt (sent whole) and a synthetic multi-page one
+(sent as retrieved chunks), compares the cost of assembling each /ask prompt
+and the bytes sent per request:
+  - legacy:         one big string rebuilt for every question
+  - prefix+suffix:  system instruction + question prompt, what the bot actually sends
+                    on every request (about the same bytes and input tokens as legacy)
+  - suffix only:    a hypothetical lower bound if the prefix were served from a Gemini
+                    cache. The bot does not do this: the prefix is below the minimum
+                    size Gemini caches, so it is not a saving today.
+
+Usage: python bench_prompt_templates.py [--pages 300] [--rounds 2000]
+"""
+
+import argparse
+import statistics
+import time
+
+from knowledge_store import KnowledgeStore
+from prompts import PromptBuilder
+from retrieval import Retriever
+from synthetic_corpus import StaticStore, build_corpus
+
+QUESTIONS = [
+    ("What are the office hours?", 'en', 'English'),
+    ("How do pull requests work?", 'en', 'English'),
+    ("¿Cuáles son las horas de oficina?", 'es', 'Spanish'),
+    ("Wie funktionieren Pull Requests?", 'de', 'German'),
+    ("オフィスの営業時間は何時ですか？", 'ja', 'Japanese'),
+]
+
+def legacy_create_multilingual_prompt(question, knowledge, detected_lang, lang_name):
+    """create_multilingual_prompt as it was before the prefix/suffix split (for comparison)"""
+    if detected_lang == 'en':
+        return f"""You are CreoBot, a helpful AI assistant for CreoWis Technologies. You can answer any question the user asks.
+
+Company Knowledge (use when relevant):
+{knowledge}
+
+User Question: {question}
+
+Instructions:
+- Answer any question the user asks to the best of your ability
+- If the question is about CreoWis Technologies, use the company knowledge provided
+- For general questions, use your knowledge to provide helpful answers
+- Be professional, friendly, and helpful
+- Keep responses concise but informative
+- If you don't know something, say so honestly"""
+    return f"""You are CreoBot, a helpful AI assistant for CreoWis Technologies. You can answer any question the user asks.
+
+Company Knowledge (use when relevant):
+{knowledge}
+
+User Question: {question}
+
+IMPORTANT INSTRUCTIONS:
+- The user asked their question in {lang_name} ({detected_lang})
+- You MUST respond in {lang_name} ({detected_lang}) - the same language as the user's question
+- Answer any question the user asks to the best of your ability
+- If the question is about CreoWis Technologies, use the company knowledge provided
+- For general questions, use your knowledge to provide helpful answers in {lang_name}
+- Be professional, friendly, and helpful
+- Keep responses concise but informative
+- Maintain the same language throughout your entire response
+- If you don't know something, say so honestly in {lang_name}
+
+Example response format in {lang_name}:
+[Your answer should be entirely in {lang_name}]"""
+
+def per_request_us(func, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for question, lang, name in QUESTIONS:
+            func(question, lang, name)
+        samples.append((time.perf_counter() - start) / len(QUESTIONS) * 1e6)
+    return statistics.median(samples)
+
+def run_case(label, store, rounds):
+    retriever = Retriever(store)
+    builder = PromptBuilder(retriever)
+    builder.build("warm up", 'en', 'English')  # prefix built once per knowledge base version
+
+    def legacy(question, lang, name):
+        return legacy_create_multilingual_prompt(question, retriever.retrieve(question), lang, name)
+
+    legacy_us = per_request_us(legacy, rounds)
+    builder_us = per_request_us(builder.build, rounds)
+
+    legacy_bytes = statistics.mean(len(legacy(*q).encode()) for q in QUESTIONS)
+    prefix, _ = builder.build(*QUESTIONS[0])
+    suffix_bytes = statistics.mean(len(builder.build(*q)[1].encode()) for q in QUESTIONS)
+    prefix_bytes = len(prefix.encode())
+
+    mode = "whole knowledge base in prefix" if retriever.sends_whole_knowledge() else "retrieved chunks in suffix"
+    print(f"📚 {label}: {len(store.text):,} chars ({mode})")
+    print(f"   assembly per request: legacy {legacy_us:8.2f} µs • prefix+suffix {builder_us:8.2f} µs")
+    print(f"   bytes per request:    legacy {legacy_bytes:8,.0f}    • prefix+suffix {prefix_bytes + suffix_bytes:8,.0f}"
+          f"    • suffix only (hypothetical) {suffix_bytes:8,.0f}")
+    print(f"   prefix: {prefix_bytes:,} bytes, built {builder.prefix_builds}x\n")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    run_case("knowledge_base.txt", KnowledgeStore("knowledge_base.txt").load(), args.rounds)
+    run_case(f"synthetic {args.pages}-page knowledge base", StaticStore(build_corpus(args.pages)), max(1, args.rounds // 20))
+
+if __name__ == "__main__":
+    main()
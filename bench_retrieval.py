@@ -0,0 +1,71 @@
+"""
+Benchmark: full-document prompts vs retrieved top-k chunks
+==========================================================
+
+Builds a synthetic knowledge base of a few hundred pages from knowledge_base.txt
+and compares prompt size and prompt-building latency. Pass --live (with
+GEMINI_API_KEY set) to also time real Gemini round trips for both prompts.
+
+Usage: python bench_retrieval.py [--pages 300] [--live]
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from knowledge_store import KnowledgeStore
+from language_support import create_multilingual_prompt
+from retrieval import Retriever, estimate_tokens
+from synthetic_corpus import StaticStore, build_corpus
+
+QUESTIONS = [
+    "What are the office hours?",
+    "How do pull requests work?",
+    "What is the tech stack?",
+    "How are interns onboarded?",
+    "What frontend practices do we follow?",
+]
+
+def time_call(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(samples)
+
+def live_latency(prompt):
+    import google.genai as genai
+    client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+    start = time.perf_counter()
+    client.models.generate_content(model="gemini-2.5-flash", contents=[{'parts': [{'text': prompt}]}])
+    return (time.perf_counter() - start) * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--live", action="store_true")
+    args = parser.parse_args()
+
+    store = StaticStore(build_corpus(args.pages))
+    retriever = Retriever(store)
+    retriever.retrieve("warm up")  # build the index once, as the bot does on first use
+
+    print(f"📚 Knowledge base: {len(store.sections)} sections, {len(store.text):,} chars (~{estimate_tokens(store.text):,} tokens)\n")
+    print(f"{'question':<40} {'full tokens':>12} {'top-k tokens':>13} {'full ms':>9} {'top-k ms':>9}")
+
+    for question in QUESTIONS:
+        full_prompt, full_ms = time_call(
+            lambda: create_multilingual_prompt(question, store.text, 'en', 'English'), args.repeat)
+        topk_prompt, topk_ms = time_call(
+            lambda: create_multilingual_prompt(question, retriever.retrieve(question), 'en', 'English'), args.repeat)
+        print(f"{question:<40} {estimate_tokens(full_prompt):>12,} {estimate_tokens(topk_prompt):>13,} "
+              f"{full_ms:>9.3f} {topk_ms:>9.3f}")
+
+        if args.live:
+            print(f"   🌐 Gemini latency: full {live_latency(full_prompt):.0f} ms • top-k {live_latency(topk_prompt):.0f} ms")
+
+if __name__ == "__main__":
+    main()
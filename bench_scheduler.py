@@ -0,0 +1,90 @@
+"""
+Benchmark: one sleeping task per reminder vs the heap-based TimerScheduler
+==========================================================================
+
+Measures memory held by N pending timers in each model, then fires N
+timers spread over a short window through the scheduler and reports how
+late they were dispatched.
+
+Usage: python bench_scheduler.py [--items 100000] [--window 3]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from scheduler import TimerScheduler
+
+async def noop(_):
+    pass
+
+async def sleeping_reminder(delay, reminder_id):
+    await asyncio.sleep(delay)
+    await noop(reminder_id)
+
+async def measure_tasks(items):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks = [asyncio.create_task(sleeping_reminder(3600, i)) for i in range(items)]
+    await asyncio.sleep(0)  # let every task reach its sleep
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return used
+
+async def measure_scheduler(items):
+    scheduler = TimerScheduler()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    due = time.time() + 3600
+    for i in range(items):
+        scheduler.schedule(i, due + i, noop, i)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used
+
+async def measure_accuracy(items, window):
+    scheduler = TimerScheduler(batch_size=500)
+    lateness = []
+    start = time.time() + 0.5
+
+    async def record(due):
+        lateness.append((time.time() - due) * 1000)
+
+    insert_started = time.perf_counter()
+    for i in range(items):
+        due = start + window * i / items
+        scheduler.schedule(i, due, record, due)
+    insert_ms = (time.perf_counter() - insert_started) * 1000
+
+    scheduler.start()
+    while len(lateness) < items:
+        await asyncio.sleep(0.1)
+    await scheduler.stop()
+
+    lateness.sort()
+    return insert_ms, lateness
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--window", type=float, default=3.0)
+    args = parser.parse_args()
+
+    task_bytes = await measure_tasks(args.items)
+    heap_bytes = await measure_scheduler(args.items)
+    print(f"💾 Memory for {args.items:,} pending timers")
+    print(f"   one task each:   {task_bytes / 1024 / 1024:8.1f} MB ({task_bytes / args.items:.0f} B/item)")
+    print(f"   TimerScheduler:  {heap_bytes / 1024 / 1024:8.1f} MB ({heap_bytes / args.items:.0f} B/item)")
+
+    insert_ms, lateness = await measure_accuracy(args.items, args.window)
+    print(f"\n⏱️ {args.items:,} timers over {args.window:.0f}s (inserted in {insert_ms:.0f} ms)")
+    print(f"   lateness p50 {statistics.median(lateness):.2f} ms • "
+          f"p99 {lateness[int(len(lateness) * 0.99) - 1]:.2f} ms • max {lateness[-1]:.2f} ms")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""
+Benchmark: legacy parse_time_input vs the compiled-grammar time parser
+=====================================================================
+
+Parses a mix of reminder/poll time inputs with both parsers and reports
+throughput. The legacy parser only understands single "<number><unit>"
+durations and bare minutes, so it rejects the compound and absolute inputs.
+
+Usage: python bench_time_parser.py [--rounds 20000]
+"""
+
+import argparse
+import re
+import time
+from datetime import datetime, UTC
+from zoneinfo import ZoneInfo
+
+from time_parser import parse_time_input
+
+INPUTS = [
+    "5m", "30s", "2h", "1d", "10 minutes", "2 hours", "120", "45",
+    "1h30m", "2d 4h", "1 hour and 15 minutes", "14:30", "9pm", "tomorrow 9am",
+    "2026-10-20 14:30", "2026-10-20T09:00 Europe/Berlin", "17:00 UTC", "not a time",
+]
+
+def legacy_parse_time_input(time_str):
+    """parse_time_input as it was before the time parser module (for comparison)"""
+    time_str = time_str.lower().strip()
+    pattern = r'^(\d+)\s*(s|sec|second|seconds|m|min|minute|minutes|h|hr|hour|hours|d|day|days)$'
+    match = re.match(pattern, time_str)
+    if match:
+        number = int(match.group(1))
+        unit = match.group(2)
+        if unit in ['s', 'sec', 'second', 'seconds']:
+            return number
+        elif unit in ['m', 'min', 'minute', 'minutes']:
+            return number * 60
+        elif unit in ['h', 'hr', 'hour', 'hours']:
+            return number * 3600
+        elif unit in ['d', 'day', 'days']:
+            return number * 86400
+    try:
+        minutes = int(time_str)
+        if 1 <= minutes <= 10080:
+            return minutes * 60
+    except ValueError:
+        pass
+    return None
+
+def run(parse, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in INPUTS:
+            parse(text)
+    elapsed = time.perf_counter() - started
+    return rounds * len(INPUTS) / elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20000)
+    args = parser.parse_args()
+
+    now = datetime(2026, 10, 18, 10, 0, tzinfo=UTC)
+    berlin = ZoneInfo("Europe/Berlin")
+    legacy_ok = sum(legacy_parse_time_input(text) is not None for text in INPUTS)
+    new_ok = sum(parse_time_input(text, now, berlin) is not None for text in INPUTS)
+
+    legacy_rate = run(legacy_parse_time_input, args.rounds)
+    new_rate = run(lambda text: parse_time_input(text, now, berlin), args.rounds)
+
+    print(f"⏱️ {len(INPUTS)} inputs × {args.rounds:,} rounds")
+    print(f"   legacy parser:   {legacy_rate:12,.0f} parses/s • understands {legacy_ok}/{len(INPUTS)} inputs")
+    print(f"   compiled parser: {new_rate:12,.0f} parses/s • understands {new_ok}/{len(INPUTS)} inputs")
+
+    durations = [text for text in INPUTS if legacy_parse_time_input(text) is not None]
+    legacy_rate = run_subset(legacy_parse_time_input, durations, args.rounds)
+    new_rate = run_subset(lambda text: parse_time_input(text, now, berlin), durations, args.rounds)
+    print(f"\n⏱️ Inputs both understand ({len(durations)} simple durations)")
+    print(f"   legacy parser:   {legacy_rate:12,.0f} parses/s")
+    print(f"   compiled parser: {new_rate:12,.0f} parses/s ({new_rate / legacy_rate:.2f}x)")
+
+def run_subset(parse, inputs, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in inputs:
+            parse(text)
+    return rounds * len(inputs) / (time.perf_counter() - started)
+
+if __name__ == "__main__":
+    main()
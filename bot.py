@@ -1,35 +1,306 @@
-import discord
-from discord import app_commands
-import google.genai as genai
+import time
+import contextlib
+
+# Time the heavy imports so slow cold starts show up in the startup report
+import_timings = {}
+
+@contextlib.contextmanager
+def timed_import(name):
+    start = time.perf_counter()
+    yield
+    import_timings[name] = (time.perf_counter() - start) * 1000
+
+startup_started = time.perf_counter()
+
+with timed_import("discord"):
+    import discord
+    from discord import app_commands
+with timed_import("google.genai"):
+    import google.genai as genai
+with timed_import("aiohttp"):
+    import aiohttp
+with timed_import("langdetect"):
+    from language_support import detect_language, get_language_flag, LANGUAGE_NAMES, start_detector_warm_up
 import os
 import asyncio
-import aiohttp
 import json
-import re
 from datetime import datetime, timedelta, UTC
 from dotenv import load_dotenv
-from prompts import build_prompt
-from language_support import detect_language, create_multilingual_prompt, get_language_flag, LANGUAGE_NAMES
+from prompts import PromptBuilder
+from knowledge_store import KnowledgeStore
+from retrieval import Retriever
+from answer_cache import AnswerCache, make_cache_key
+from semantic_cache import SemanticCache
+from message_utils import split_message, send_long_message, send_paginated
+from http_client import HttpClient
+from weather_cache import WeatherCache
+from reminder_store import ReminderStore, due_at
+from scheduler import TimerScheduler
+from channel_batcher import ChannelBatcher
+from user_cache import UserCache
+from single_flight import SingleFlight
+from rate_limiter import RateLimiter, parse_rate
+from recurrence import parse_recurrence, next_fire, describe_recurrence
+from time_parser import parse_time_input, parse_timezone, canonical_timezone_name
+from poll_tally import PollTally, ThrottledRefresher
+from poll_store import PollStore, poll_ends_at
+from poll_view import PollView
 
 load_dotenv()
 
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "4"))
+# Identical concurrent /ask calls always share one Gemini call. A window > 0 also makes each
+# cache miss wait that many seconds first, trading added latency for merging more near-simultaneous asks
+ASK_COALESCE_WINDOW = float(os.getenv("ASK_COALESCE_WINDOW", "0"))
+ASK_STREAMING = os.getenv("ASK_STREAMING", "false").lower() in ("1", "true", "yes")
+STREAM_EDIT_INTERVAL = float(os.getenv("STREAM_EDIT_INTERVAL", "1.0"))
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+WEATHER_TIMEOUT = float(os.getenv("WEATHER_TIMEOUT", "5"))
+WEATHER_CACHE_TTL = int(os.getenv("WEATHER_CACHE_TTL", "600"))  # OpenWeatherMap updates about every 10 minutes
+WEATHER_NEGATIVE_CACHE_TTL = int(os.getenv("WEATHER_NEGATIVE_CACHE_TTL", "300"))
+REMINDER_DB_PATH = os.getenv("REMINDER_DB_PATH", "reminders.db")
+REMINDER_BATCH_WINDOW = float(os.getenv("REMINDER_BATCH_WINDOW", "0.5"))
+REMINDER_CHANNEL_INTERVAL = float(os.getenv("REMINDER_CHANNEL_INTERVAL", "1.0"))
+POLL_EDIT_INTERVAL = float(os.getenv("POLL_EDIT_INTERVAL", "2.0"))
+POLL_DB_PATH = os.getenv("POLL_DB_PATH", "polls.db")
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "3600"))
+USER_CACHE_NEGATIVE_TTL = float(os.getenv("USER_CACHE_NEGATIVE_TTL", "300"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "5000"))
+# Rate limits as "requests/seconds" (empty or 0 disables), checked before calling Gemini or OpenWeatherMap
+RATE_LIMIT_ASK_USER = parse_rate(os.getenv("RATE_LIMIT_ASK_USER", "5/60"))
+RATE_LIMIT_ASK_GUILD = parse_rate(os.getenv("RATE_LIMIT_ASK_GUILD", "30/60"))
+RATE_LIMIT_GEMINI = parse_rate(os.getenv("RATE_LIMIT_GEMINI", "60/60"))
+RATE_LIMIT_WEATHER_USER = parse_rate(os.getenv("RATE_LIMIT_WEATHER_USER", "10/60"))
+RATE_LIMIT_WEATHER_GUILD = parse_rate(os.getenv("RATE_LIMIT_WEATHER_GUILD", "60/60"))
+RATE_LIMIT_WEATHER_API = parse_rate(os.getenv("RATE_LIMIT_WEATHER_API", "60/60"))  # OpenWeatherMap free tier
+RATE_LIMIT_MAX_BUCKETS = int(os.getenv("RATE_LIMIT_MAX_BUCKETS", "10000"))
+REMINDERS_PER_PAGE = 10
+LONG_ANSWER_MODE = os.getenv("LONG_ANSWER_MODE", "messages").lower()  # "messages" or "pages"
+KNOWLEDGE_RELOAD_INTERVAL = float(os.getenv("KNOWLEDGE_RELOAD_INTERVAL", "5"))
+RETRIEVAL_TOP_K = int(os.getenv("RETRIEVAL_TOP_K", "4"))
+RETRIEVAL_TOKEN_BUDGET = int(os.getenv("RETRIEVAL_TOKEN_BUDGET", "1500"))
+ANSWER_CACHE_TTL = int(os.getenv("ANSWER_CACHE_TTL", "86400"))
+ANSWER_CACHE_MAX_ENTRIES = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "1000"))
+ANSWER_CACHE_MAX_MB = float(os.getenv("ANSWER_CACHE_MAX_MB", "5"))
+ANSWER_CACHE_DB = os.getenv("ANSWER_CACHE_DB")  # e.g. answer_cache.db to keep answers across restarts
+ANSWER_CACHE_PURGE_INTERVAL = float(os.getenv("ANSWER_CACHE_PURGE_INTERVAL", "3600"))
+# Off by default: hashed n-gram similarity can't tell a paraphrase from a one-word change of meaning
+# ("staging" vs "production"), so only enable it with a threshold that matches near-identical wording
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "0"))  # 0 disables
+
+# Load langdetect's profiles in the background while we connect to Discord
+start_detector_warm_up()
 
 # Configure Gemini with the new API
 client_genai = genai.Client(api_key=GEMINI_API_KEY)
 
-# Store active reminders (in production, use a database)
-active_reminders = {}
+# Bound how many Gemini generations run at once; extra /ask calls wait their turn
+gemini_semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+gemini_metrics = {
+    'in_flight': 0,
+    'queued': 0,
+    'max_queued': 0,
+    'completed': 0,
+    'failed': 0,
+    'last_ttft_ms': None
+}
+
+# Token buckets per user, guild and upstream API so one user can't burn the shared quota
+rate_limiter = RateLimiter({
+    'ask_user': RATE_LIMIT_ASK_USER,
+    'ask_guild': RATE_LIMIT_ASK_GUILD,
+    'gemini_api': RATE_LIMIT_GEMINI,
+    'weather_user': RATE_LIMIT_WEATHER_USER,
+    'weather_guild': RATE_LIMIT_WEATHER_GUILD,
+    'weather_api': RATE_LIMIT_WEATHER_API
+}, max_buckets=RATE_LIMIT_MAX_BUCKETS)
+
+async def reject_if_rate_limited(interaction, command):
+    """Take a token for this user, guild and API; reply and return True if any bucket is empty"""
+    api = 'gemini_api' if command == 'ask' else f'{command}_api'
+    retry_after = rate_limiter.acquire(
+        (f'{command}_user', interaction.user.id),
+        (f'{command}_guild', interaction.guild_id),
+        (api, command)
+    )
+    if not retry_after:
+        return False
+    print(f"🚦 Rate limited /{command} for {interaction.user} ({retry_after:.1f}s)")
+    await interaction.followup.send(
+        f"⏳ **Slow down!**\n\nToo many requests right now. Please try again in {max(1, round(retry_after))} seconds."
+    )
+    return True
+
+# Concurrent /ask calls for the same question, language and knowledge base version share one generation
+ask_flights = SingleFlight(window=ASK_COALESCE_WINDOW)
+
+# A single heap-based timer drives reminder delivery and poll endings
+scheduler = TimerScheduler()
+
+# Running polls (and their tallies) persisted in SQLite, looked up by message ID in O(1)
+poll_store = PollStore(POLL_DB_PATH)
+
+# Vote-button views of running button polls, stopped when the poll ends
+poll_views = {}
+
+# Reminders are persisted in SQLite so they survive restarts and crashes
+reminder_store = ReminderStore(REMINDER_DB_PATH)
+
+# Reminders due together in one channel go out as a single message (Discord allows 10 embeds, 6000 characters)
+reminder_batcher = ChannelBatcher(
+    lambda channel_id, items: send_reminder_batch(channel_id, items),
+    window=REMINDER_BATCH_WINDOW,
+    max_per_message=10,
+    min_interval=REMINDER_CHANNEL_INTERVAL,
+    size=lambda item: len(item[1]),
+    max_size=6000
+)
+
+# One pooled HTTP session shared by the weather client and any other outbound integration
+http_client = HttpClient(
+    limit=HTTP_POOL_LIMIT,
+    limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+    dns_ttl=HTTP_DNS_CACHE_TTL,
+    timeout=HTTP_TIMEOUT,
+    host_timeouts={'api.openweathermap.org': WEATHER_TIMEOUT},
+    max_retries=HTTP_MAX_RETRIES
+)
+
+class BotClient(discord.Client):
+    """discord.Client that also releases shared resources on shutdown"""
+
+    async def close(self):
+        await shutdown_resources()
+        await super().close()
 
 intents = discord.Intents.default()
-client = discord.Client(intents=intents)
+client = BotClient(intents=intents)
 tree = app_commands.CommandTree(client)
 
+# Knowledge base is read once at startup and reloaded by a watcher when the file changes
+knowledge_store = KnowledgeStore("knowledge_base.txt").load()
+
+# Only the knowledge chunks relevant to the question are sent to Gemini
+retriever = Retriever(knowledge_store, top_k=RETRIEVAL_TOP_K, token_budget=RETRIEVAL_TOKEN_BUDGET)
+
+# Instructions (and a small knowledge base) form a fixed prefix rebuilt only when the knowledge base changes
+prompt_builder = PromptBuilder(retriever)
+
+# Repeated questions are answered from cache; the knowledge base version is part of the key
+answer_cache = AnswerCache(
+    max_entries=ANSWER_CACHE_MAX_ENTRIES,
+    max_bytes=int(ANSWER_CACHE_MAX_MB * 1024 * 1024),
+    ttl_seconds=ANSWER_CACHE_TTL,
+    db_path=ANSWER_CACHE_DB,
+    purge_interval=ANSWER_CACHE_PURGE_INTERVAL
+)
+
+# Near-duplicate questions (same language) reuse an earlier answer
+semantic_cache = SemanticCache(
+    threshold=SEMANTIC_CACHE_THRESHOLD,
+    max_entries=SEMANTIC_CACHE_MAX_ENTRIES,
+    ttl_seconds=ANSWER_CACHE_TTL
+)
+
 def load_knowledge():
-    with open("knowledge_base.txt", "r", encoding="utf-8") as f:
-        return f.read()
+    return knowledge_store.text
+
+@contextlib.asynccontextmanager
+async def gemini_slot():
+    """Wait for a free Gemini concurrency slot, tracking queue depth and outcomes"""
+    gemini_metrics['queued'] += 1
+    gemini_metrics['max_queued'] = max(gemini_metrics['max_queued'], gemini_metrics['queued'])
+    waiting = True
+    try:
+        async with gemini_semaphore:
+            gemini_metrics['queued'] -= 1
+            waiting = False
+            gemini_metrics['in_flight'] += 1
+            try:
+                yield
+                gemini_metrics['completed'] += 1
+            except Exception:
+                gemini_metrics['failed'] += 1
+                raise
+            finally:
+                gemini_metrics['in_flight'] -= 1
+    finally:
+        if waiting:
+            # Cancelled while still waiting for a slot
+            gemini_metrics['queued'] -= 1
+
+def gemini_config(system_instruction):
+    """Request config carrying the static prompt prefix as the system instruction"""
+    return genai.types.GenerateContentConfig(system_instruction=system_instruction) if system_instruction else None
+
+async def generate_answer(prompt, system_instruction=None):
+    """Generate a Gemini answer on the async client without blocking the event loop"""
+    async with gemini_slot():
+        response = await client_genai.aio.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=[{'parts': [{'text': prompt}]}],
+            config=gemini_config(system_instruction)
+        )
+        return response.candidates[0].content.parts[0].text
+
+async def stream_answer(interaction, prompt, header="", system_instruction=None):
+    """Stream a Gemini answer into followup messages, editing at most once per STREAM_EDIT_INTERVAL"""
+    async with gemini_slot():
+        started = time.perf_counter()
+        stream = await client_genai.aio.models.generate_content_stream(
+            model=GEMINI_MODEL,
+            contents=[{'parts': [{'text': prompt}]}],
+            config=gemini_config(system_instruction)
+        )
+
+        answer = ""
+        messages = []
+        shown = []
+        last_edit = 0.0
+
+        async def sync_messages(parts):
+            # Edit only parts whose text changed; overflow goes to new messages
+            for i, part in enumerate(parts):
+                if i < len(messages):
+                    if shown[i] != part:
+                        await messages[i].edit(content=part)
+                        shown[i] = part
+                else:
+                    messages.append(await interaction.followup.send(part, wait=True))
+                    shown.append(part)
+
+        async for chunk in stream:
+            if not chunk.text:
+                continue
+            answer += chunk.text
+
+            now = time.perf_counter()
+            if not messages:
+                await sync_messages(split_message(header + answer))
+                ttft_ms = (now - started) * 1000
+                gemini_metrics['last_ttft_ms'] = ttft_ms
+                print(f"⚡ Time to first token: {ttft_ms:.0f} ms")
+                last_edit = now
+            elif now - last_edit >= STREAM_EDIT_INTERVAL:
+                await sync_messages(split_message(header + answer))
+                last_edit = now
+
+        # Final edit with whatever arrived since the last one
+        if answer:
+            await sync_messages(split_message(header + answer))
+        elif not messages:
+            await interaction.followup.send("🤔 No answer was generated.")
+
+        return answer
 
 @tree.command(name="ask", description="Ask any question in any language - I can help with anything!")
 async def ask(interaction: discord.Interaction, question: str, language: str = None):
@@ -62,29 +333,58 @@ async def ask(interaction: discord.Interaction, question: str, language: str = N
         
         print(f"Detected language: {lang_name} ({detected_lang}) for question: {question}")
         
-        knowledge = load_knowledge()
+        cache_key = make_cache_key(question, detected_lang, knowledge_store.version)
+        answer = await answer_cache.get(cache_key)
         
-        # Use multilingual prompt instead of the original build_prompt
-        prompt = create_multilingual_prompt(question, knowledge, detected_lang, lang_name)
-
-        # Generate response using Gemini
-        response = client_genai.models.generate_content(
-            model='gemini-2.5-flash',
-            contents=[{'parts': [{'text': prompt}]}]
-        )
+        if answer is None and SEMANTIC_CACHE_MAX_ENTRIES > 0:
+            answer, similarity = semantic_cache.lookup(question, detected_lang, knowledge_store.version)
+            if answer is not None:
+                # Not copied into the exact-match cache, so a wrong match can't outlive the semantic entry
+                print(f"♻️ Semantic cache hit (similarity {similarity:.2f})")
         
-        answer = response.candidates[0].content.parts[0].text
+        # Language indicator shown above non-English answers
+        header = f"{flag} **Responding in {lang_name}**\n\n" if detected_lang != 'en' else ""
         
-        # Add language indicator to the response
-        if detected_lang != 'en':
-            answer = f"{flag} **Responding in {lang_name}**\n\n{answer}"
+        if answer is None:
+            # Only requests that will actually call Gemini use up rate limit tokens
+            if cache_key not in ask_flights and await reject_if_rate_limited(interaction, 'ask'):
+                return
+
+            streamed = False
+
+            async def generate_once():
+                nonlocal streamed
+                # Fixed prefix (instructions + knowledge when small) as system instruction, question as a short prompt
+                system_instruction, prompt = prompt_builder.build(question, detected_lang, lang_name)
+                if ASK_STREAMING:
+                    # Streamed into this interaction; anyone who joined gets the finished answer
+                    streamed = True
+                    result = await stream_answer(interaction, prompt, header, system_instruction)
+                else:
+                    # Generate response using Gemini (async client, bounded concurrency)
+                    result = await generate_answer(prompt, system_instruction)
+                if result:
+                    # An empty generation must not be served again from either cache
+                    await answer_cache.put(cache_key, result)
+                    semantic_cache.add(question, detected_lang, knowledge_store.version, result)
+                return result
+
+            answer = await ask_flights.run(cache_key, generate_once)
+            if streamed:
+                # The answer was delivered by progressive edits, nothing left to send afterwards
+                return
+            if not answer:
+                await interaction.followup.send("🤔 No answer was generated.")
+                return
         
-        # Discord has a 2000 character limit for messages
-        if len(answer) > 2000:
-            answer = answer[:1997] + "..."
-            
+        answer = header + answer
+        
+        # Discord has a 2000 character limit for messages, so long answers are split up
         try:
-            await interaction.followup.send(answer)
+            if LONG_ANSWER_MODE == "pages" and len(answer) > 2000:
+                await send_paginated(interaction, answer)
+            else:
+                await send_long_message(interaction.followup.send, answer)
         except discord.errors.NotFound:
             # Interaction expired, can't send followup
             print("Interaction expired before sending response")
@@ -166,7 +466,8 @@ async def help_command(interaction: discord.Interaction):
             name="📊 `/poll [question] [options] [duration]`",
             value="Create a multi-option poll with voting\n"
                   "• Example: `/poll question:\"Favorite color?\" options:\"Red, Blue, Green\" duration:60`\n"
-                  "• Duration in minutes (10-1440)",
+                  "• Duration: minutes (`60`), `1h30m` or an end time like `17:00` (up to 24h)\n"
+                  "• Add `buttons:True` to vote with buttons instead of reactions",
             inline=False
         )
         
@@ -190,7 +491,22 @@ async def help_command(interaction: discord.Interaction):
             name="⏰ `/remind [time] [message]`",
             value="Set a personal reminder\n"
                   "• Example: `/remind time:5m message:\"Check the server\"`\n"
-                  "• Time: 5m, 2h, 30s, 1d (10s - 7 days)",
+                  "• Time: 5m, 1h30m, 14:30, tomorrow 9am (10s - 7 days)",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🕒 `/timezone [name]`",
+            value="Set your timezone for clock times\n"
+                  "• Example: `/timezone name:Europe/Berlin`",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🔁 `/remindevery [schedule] [message]`",
+            value="Set a recurring reminder\n"
+                  "• Example: `/remindevery schedule:weekdays 09:30 message:\"Standup\"`\n"
+                  "• Schedule: every 30m, daily 09:30, mon,wed 18:00, cron 30 9 * * 1-5 (UTC)",
             inline=False
         )
         
@@ -386,6 +702,71 @@ async def stats(interaction: discord.Interaction):
             inline=True
         )
         
+        embed.add_field(
+            name="🧠 Gemini Queue",
+            value=f"In flight: {gemini_metrics['in_flight']}/{GEMINI_MAX_CONCURRENCY}\n"
+                  f"Waiting: {gemini_metrics['queued']} (peak {gemini_metrics['max_queued']})\n"
+                  f"Completed: {gemini_metrics['completed']} • Failed: {gemini_metrics['failed']}"
+                  + (f"\nLast time to first token: {gemini_metrics['last_ttft_ms']:.0f} ms"
+                     if gemini_metrics['last_ttft_ms'] is not None else "")
+                  + f"\nCoalesced /ask calls: {ask_flights.coalesced} of {ask_flights.calls + ask_flights.coalesced} "
+                    f"({ask_flights.saved_rate():.1f}% saved, window {ASK_COALESCE_WINDOW:g}s)",
+            inline=False
+        )
+        
+        rejected = ", ".join(f"{rule} {count}" for rule, count in rate_limiter.rejected.items()) or "none"
+        embed.add_field(
+            name="🚦 Rate Limits",
+            value=f"Allowed: {rate_limiter.allowed} • Rejected: {rate_limiter.total_rejected()} ({rejected})\n"
+                  f"Buckets: {len(rate_limiter)} • Evicted idle: {rate_limiter.evicted}",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🗄️ Answer Cache",
+            value=f"Entries: {len(answer_cache)} ({answer_cache.size_bytes / 1024:.1f} KB)\n"
+                  f"Hits: {answer_cache.hits} (disk {answer_cache.disk_hits}) • Misses: {answer_cache.misses}\n"
+                  f"Hit rate: {answer_cache.hit_rate():.1f}%\n"
+                  f"Semantic: {len(semantic_cache)} entries • {semantic_cache.hits} hits "
+                  f"({semantic_cache.hit_rate():.1f}%, threshold {semantic_cache.threshold})",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="⏰ Scheduler",
+            value=f"Scheduled: {len(scheduler)} • Running: {scheduler.running} • "
+                  f"Cancelled awaiting cleanup: {scheduler.tombstones}\n"
+                  f"Fired: {scheduler.fired} • Cancelled: {scheduler.cancelled} • "
+                  f"Avg lateness: {scheduler.average_lateness() * 1000:.0f} ms\n"
+                  f"Delivered: {reminder_batcher.items} in {reminder_batcher.messages} message(s) • "
+                  f"Largest batch: {reminder_batcher.max_batch} • Queued: {reminder_batcher.queued}",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🌤️ Weather Cache",
+            value=f"Cities: {len(weather_cache)} • Hit rate: {weather_cache.hit_rate():.1f}%\n"
+                  f"Hits: {weather_cache.hits} • Not-found hits: {weather_cache.negative_hits} • "
+                  f"Misses: {weather_cache.misses} • Coalesced: {weather_cache.coalesced}",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="📊 Polls",
+            value=f"Active: {len(poll_store)} • Vote events: {poll_refresher.requested} • "
+                  f"Live edits: {poll_refresher.refreshed} • "
+                  f"Votes saved: {poll_store.votes_written} in {poll_store.flushes} write(s)",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="👤 User Cache",
+            value=f"Cached: {len(user_cache)} • Gateway hits: {user_cache.gateway_hits}\n"
+                  f"Hits: {user_cache.hits} • Not-found hits: {user_cache.negative_hits} • "
+                  f"REST calls: {user_cache.fetches} • Saved: {user_cache.saved}",
+            inline=False
+        )
+        
         embed.set_footer(text="Statistics updated in real-time")
         
         await interaction.followup.send(embed=embed)
@@ -394,7 +775,7 @@ async def stats(interaction: discord.Interaction):
         await interaction.followup.send(f"❌ Error showing stats: {str(e)}")
 
 @tree.command(name="poll", description="Create a poll with multiple options")
-async def create_poll(interaction: discord.Interaction, question: str, options: str, duration: int = 60):
+async def create_poll(interaction: discord.Interaction, question: str, options: str, duration: str = "60", buttons: bool = False):
     try:
         await interaction.response.defer()
     except discord.errors.NotFound:
@@ -413,95 +794,199 @@ async def create_poll(interaction: discord.Interaction, question: str, options:
             await interaction.followup.send("❌ **Error**: Maximum 10 options allowed per poll.")
             return
         
-        if duration < 10 or duration > 1440:  # 10 seconds to 24 hours
-            await interaction.followup.send("❌ **Error**: Duration must be between 10 seconds and 1440 minutes (24 hours).")
+        seconds = parse_time_input(duration, tz=user_timezone(interaction.user.id))
+        if seconds is None or seconds < 10 or seconds > 86400:  # 10 seconds to 24 hours
+            await interaction.followup.send("❌ **Error**: Duration must be between 10 seconds and 24 hours (e.g. `30`, `1h30m` or `17:00`).")
             return
         
         # Emoji numbers for options
         number_emojis = ['1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟']
         
-        # Create poll embed
-        embed = discord.Embed(
-            title="📊 Poll",
-            description=f"**{question}**",
-            color=0x00ff00,
-            timestamp=discord.utils.utcnow()
-        )
-        
-        # Add options to embed
-        options_text = ""
-        for i, option in enumerate(option_list):
-            options_text += f"{number_emojis[i]} {option}\n"
-        
-        embed.add_field(
-            name="Options:",
-            value=options_text,
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⏱️ Duration:",
-            value=f"{duration} minutes",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="👤 Created by:",
-            value=interaction.user.mention,
-            inline=True
-        )
-        
-        embed.set_footer(text="React with the corresponding emoji to vote!")
-        
-        # Send poll message
-        poll_message = await interaction.followup.send(embed=embed)
-        
-        # Add reaction emojis
-        for i in range(len(option_list)):
-            await poll_message.add_reaction(number_emojis[i])
-        
-        # Store poll data for later results
         poll_data = {
+            'kind': 'poll',
+            'mode': 'buttons' if buttons else 'reactions',
             'question': question,
             'options': option_list,
             'creator': interaction.user.id,
             'channel': interaction.channel.id,
-            'message_id': poll_message.id,
-            'duration': duration,
+            'created_at': time.time(),
+            'duration_seconds': seconds,
             'emojis': number_emojis[:len(option_list)]
         }
-        
-        # Schedule poll end (simplified - in production you'd use a database)
-        import asyncio
-        asyncio.create_task(end_poll_after_duration(poll_data, duration * 60))
+        await start_poll(interaction, poll_data)
         
     except Exception as e:
         await interaction.followup.send(f"❌ **Error creating poll**: {str(e)}")
 
-async def end_poll_after_duration(poll_data, duration_seconds):
-    """End poll after specified duration"""
-    await asyncio.sleep(duration_seconds)
+async def start_poll(interaction, poll_data):
+    """Send the poll, start tracking its votes and schedule its end"""
+    poll_data['tally'] = PollTally(poll_data['emojis'])
+    
+    view = None
+    if poll_data['mode'] == 'buttons':
+        # Votable as soon as it's sent: one request, no reactions to add.
+        # Clicks wait on the view until the poll is stored below.
+        view = PollView(poll_data, record_button_vote)
+        poll_message = await interaction.followup.send(embed=build_poll_embed(poll_data), view=view)
+    else:
+        poll_message = await interaction.followup.send(embed=build_poll_embed(poll_data))
+    poll_data['message_id'] = poll_message.id
+    
+    # Track before adding reactions so no early vote is missed
+    await poll_store.add(poll_data)
+    if view is not None:
+        poll_views[poll_data['message_id']] = view
+        view.mark_ready()
+    schedule_poll_end(poll_data)
+    
+    if poll_data['mode'] == 'reactions':
+        for emoji in poll_data['emojis']:
+            await poll_message.add_reaction(emoji)
+
+def build_poll_embed(poll_data):
+    """Poll message embed, including live results once votes come in"""
+    quick = poll_data['kind'] == 'quick'
+    embed = discord.Embed(
+        title="⚡ Quick Poll" if quick else "📊 Poll",
+        description=f"**{poll_data['question']}**",
+        color=0x0099ff if quick else 0x00ff00,
+        timestamp=datetime.fromtimestamp(poll_data['created_at'], UTC)
+    )
+    
+    embed.add_field(
+        name="Options:",
+        value="\n".join(f"{emoji} {option}" for emoji, option in zip(poll_data['emojis'], poll_data['options'])),
+        inline=False
+    )
+    
+    tally = poll_data['tally']
+    if tally.voters:
+        embed.add_field(
+            name="📊 Live Results:",
+            value=format_poll_results(poll_data),
+            inline=False
+        )
+    
+    embed.add_field(
+        name="⏱️ Duration:",
+        value=f"{format_time_remaining(poll_data['duration_seconds'])} "
+              f"(ends <t:{int(poll_ends_at(poll_data))}:R>)",
+        inline=True
+    )
+    
+    embed.add_field(
+        name="👤 Created by:",
+        value=f"<@{poll_data['creator']}>",
+        inline=True
+    )
+    
+    if poll_data['mode'] == 'buttons':
+        embed.set_footer(text="Click a button to vote (click again to take your vote back)!")
+    else:
+        embed.set_footer(text="React with ✅ for Yes or ❌ for No!" if quick else "React with the corresponding emoji to vote!")
+    return embed
+
+def format_poll_results(poll_data, medals=False):
+    """Bar chart of the poll's current tally, most votes first"""
+    tally = poll_data['tally']
+    total_votes = tally.total_votes
+    results_text = ""
+    
+    for i, (option, votes) in enumerate(tally.results(poll_data['options'])):
+        percentage = (votes / total_votes * 100) if total_votes > 0 else 0
+        bar_length = int(percentage / 10)
+        bar = "█" * bar_length + "░" * (10 - bar_length)
+        
+        medal = ""
+        if medals and votes > 0 and i < 3:
+            medal = ("🥇 ", "🥈 ", "🥉 ")[i]
+        
+        results_text += f"{medal}**{option}**\n{bar} {votes} votes ({percentage:.1f}%)\n\n"
+    
+    return results_text
+
+def schedule_poll_end(poll_data):
+    """Register the poll's end with the timer scheduler"""
+    scheduler.schedule(('poll', poll_data['message_id']), poll_ends_at(poll_data), end_poll, poll_data)
+
+async def refresh_poll_message(message_id):
+    """Edit a poll message to show its current tally (called at most once per POLL_EDIT_INTERVAL)"""
+    poll_data = poll_store.get(message_id)
+    if not poll_data:
+        return
+    channel = client.get_channel(poll_data['channel'])
+    if channel:
+        await channel.get_partial_message(message_id).edit(embed=build_poll_embed(poll_data))
+
+poll_refresher = ThrottledRefresher(refresh_poll_message, interval=POLL_EDIT_INTERVAL)
+
+def apply_poll_vote(poll_data, user_id, index, added):
+    """Update a poll's tally, queue the change for saving and schedule a live edit"""
+    tally = poll_data['tally']
+    changed = tally.add(user_id, index) if added else tally.remove(user_id, index)
+    if changed:
+        poll_store.record_vote(poll_data['message_id'], user_id, index, added)
+        poll_refresher.request(poll_data['message_id'])
+    return changed
+
+def record_poll_vote(payload, added):
+    """Apply a reaction event to the poll it belongs to (no message fetch needed)"""
+    if client.user and payload.user_id == client.user.id:
+        return
+    poll_data = poll_store.get(payload.message_id)
+    if not poll_data:
+        return
+    index = poll_data['tally'].option_index(str(payload.emoji))
+    if index is not None:
+        apply_poll_vote(poll_data, payload.user_id, index, added)
+
+async def record_button_vote(interaction: discord.Interaction, index):
+    """Toggle the clicking user's vote for one option of a button poll"""
+    poll_data = poll_store.get(interaction.message.id)
+    if not poll_data:
+        await interaction.response.send_message("⌛ This poll has ended.", ephemeral=True)
+        return
     
+    added = index not in poll_data['tally'].votes.get(interaction.user.id, ())
+    apply_poll_vote(poll_data, interaction.user.id, index, added)
+    option = poll_data['options'][index]
+    await interaction.response.send_message(
+        f"✅ Voted for **{option}**" if added else f"↩️ Removed your vote for **{option}**",
+        ephemeral=True
+    )
+
+@client.event
+async def on_raw_reaction_add(payload):
+    record_poll_vote(payload, added=True)
+
+@client.event
+async def on_raw_reaction_remove(payload):
+    record_poll_vote(payload, added=False)
+
+async def end_poll(poll_data):
+    """Post the results of a poll whose time is up, from the tally kept by reaction events"""
     try:
+        await poll_store.remove(poll_data['message_id'])
+        poll_refresher.forget(poll_data['message_id'])
+        
+        view = poll_views.pop(poll_data['message_id'], None)
+        if view is not None:
+            # Drop it from the client's view store so it doesn't outlive the poll
+            view.stop()
+        
         channel = client.get_channel(poll_data['channel'])
         if not channel:
             return
-            
-        message = await channel.fetch_message(poll_data['message_id'])
-        if not message:
-            return
         
-        # Count votes from reactions
-        results = {}
-        total_votes = 0
+        if poll_data['mode'] == 'buttons':
+            # Take the vote buttons off so nobody clicks on a closed poll
+            try:
+                await channel.get_partial_message(poll_data['message_id']).edit(embed=build_poll_embed(poll_data), view=None)
+            except discord.HTTPException as e:
+                print(f"⚠️ Could not remove buttons from poll {poll_data['message_id']}: {e}")
         
-        for reaction in message.reactions:
-            if str(reaction.emoji) in poll_data['emojis']:
-                emoji_index = poll_data['emojis'].index(str(reaction.emoji))
-                option = poll_data['options'][emoji_index]
-                vote_count = reaction.count - 1  # Subtract bot's reaction
-                results[option] = vote_count
-                total_votes += vote_count
+        tally = poll_data['tally']
+        total_votes = tally.total_votes
         
         # Create results embed
         embed = discord.Embed(
@@ -518,27 +1003,9 @@ async def end_poll_after_duration(poll_data, duration_seconds):
                 inline=False
             )
         else:
-            results_text = ""
-            sorted_results = sorted(results.items(), key=lambda x: x[1], reverse=True)
-            
-            for i, (option, votes) in enumerate(sorted_results):
-                percentage = (votes / total_votes * 100) if total_votes > 0 else 0
-                bar_length = int(percentage / 10)
-                bar = "█" * bar_length + "░" * (10 - bar_length)
-                
-                medal = ""
-                if i == 0 and votes > 0:
-                    medal = "🥇 "
-                elif i == 1 and votes > 0:
-                    medal = "🥈 "
-                elif i == 2 and votes > 0:
-                    medal = "🥉 "
-                
-                results_text += f"{medal}**{option}**\n{bar} {votes} votes ({percentage:.1f}%)\n\n"
-            
             embed.add_field(
                 name="Final Results:",
-                value=results_text,
+                value=format_poll_results(poll_data, medals=True),
                 inline=False
             )
         
@@ -548,6 +1015,12 @@ async def end_poll_after_duration(poll_data, duration_seconds):
             inline=True
         )
         
+        embed.add_field(
+            name="👥 Voters:",
+            value=str(tally.voters),
+            inline=True
+        )
+        
         embed.set_footer(text="Poll has ended!")
         
         await channel.send(embed=embed)
@@ -556,89 +1029,63 @@ async def end_poll_after_duration(poll_data, duration_seconds):
         print(f"Error ending poll: {e}")
 
 @tree.command(name="quickpoll", description="Create a simple Yes/No poll")
-async def quick_poll(interaction: discord.Interaction, question: str, duration: int = 30):
+async def quick_poll(interaction: discord.Interaction, question: str, duration: str = "30", buttons: bool = False):
     try:
         await interaction.response.defer()
     except discord.errors.NotFound:
         return
 
     try:
-        if duration < 10 or duration > 1440:
-            await interaction.followup.send("❌ **Error**: Duration must be between 10 seconds and 1440 minutes (24 hours).")
+        seconds = parse_time_input(duration, tz=user_timezone(interaction.user.id))
+        if seconds is None or seconds < 10 or seconds > 86400:  # 10 seconds to 24 hours
+            await interaction.followup.send("❌ **Error**: Duration must be between 10 seconds and 24 hours (e.g. `30`, `1h30m` or `17:00`).")
             return
         
-        embed = discord.Embed(
-            title="⚡ Quick Poll",
-            description=f"**{question}**",
-            color=0x0099ff,
-            timestamp=discord.utils.utcnow()
-        )
-        
-        embed.add_field(
-            name="Options:",
-            value="✅ Yes\n❌ No",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⏱️ Duration:",
-            value=f"{duration} minutes",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="👤 Created by:",
-            value=interaction.user.mention,
-            inline=True
-        )
-        
-        embed.set_footer(text="React with ✅ for Yes or ❌ for No!")
-        
-        poll_message = await interaction.followup.send(embed=embed)
-        
-        # Add reactions
-        await poll_message.add_reaction("✅")
-        await poll_message.add_reaction("❌")
-        
-        # Schedule poll end
         poll_data = {
+            'kind': 'quick',
+            'mode': 'buttons' if buttons else 'reactions',
             'question': question,
             'options': ['Yes', 'No'],
             'creator': interaction.user.id,
             'channel': interaction.channel.id,
-            'message_id': poll_message.id,
-            'duration': duration,
+            'created_at': time.time(),
+            'duration_seconds': seconds,
             'emojis': ['✅', '❌']
         }
-        
-        import asyncio
-        asyncio.create_task(end_poll_after_duration(poll_data, duration * 60))
+        await start_poll(interaction, poll_data)
         
     except Exception as e:
         await interaction.followup.send(f"❌ **Error creating quick poll**: {str(e)}")
 
-async def get_weather_data(city):
-    """Fetch weather data from OpenWeatherMap API"""
-    if not WEATHER_API_KEY or WEATHER_API_KEY == "your_openweathermap_api_key_here":
-        return None, "Weather API key not configured. Please add WEATHER_API_KEY to your .env file."
-    
+async def fetch_weather(location):
+    """Call OpenWeatherMap for a city name or (lat, lon) pair, returning (status, data)"""
     base_url = "http://api.openweathermap.org/data/2.5/weather"
     params = {
-        'q': city,
         'appid': WEATHER_API_KEY,
         'units': 'metric'  # Use Celsius
     }
+    if isinstance(location, tuple):
+        params['lat'], params['lon'] = location
+    else:
+        params['q'] = location
+    return await http_client.get_json(base_url, params=params)
+
+# Cached per normalized city; concurrent lookups for the same city share one request
+weather_cache = WeatherCache(fetch_weather, ttl=WEATHER_CACHE_TTL, negative_ttl=WEATHER_NEGATIVE_CACHE_TTL)
+
+async def get_weather_data(city):
+    """Fetch weather data from OpenWeatherMap API"""
+    if not WEATHER_API_KEY or WEATHER_API_KEY == "your_openweathermap_api_key_here":
+        return None, "Weather API key not configured. Please add WEATHER_API_KEY to your .env file."
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(base_url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data, None
-                elif response.status == 404:
-                    return None, f"City '{city}' not found. Please check the spelling and try again."
-                else:
-                    return None, f"Weather service error (Status: {response.status})"
+        status, data = await weather_cache.get(city)
+        if status == 200:
+            return data, None
+        elif status == 404:
+            return None, f"City '{city}' not found. Please check the spelling and try again."
+        else:
+            return None, f"Weather service error (Status: {status})"
     except Exception as e:
         return None, f"Failed to fetch weather data: {str(e)}"
 
@@ -688,6 +1135,10 @@ async def weather(interaction: discord.Interaction, city: str, unit: str = "cels
             await interaction.followup.send("❌ **Error**: Unit must be 'celsius', 'fahrenheit', 'c', or 'f'")
             return
         
+        # Cached cities and lookups already in flight don't reach OpenWeatherMap, so they're free
+        if weather_cache.needs_fetch(city) and await reject_if_rate_limited(interaction, 'weather'):
+            return
+
         # Fetch weather data
         weather_data, error = await get_weather_data(city)
         
@@ -805,37 +1256,9 @@ async def weather(interaction: discord.Interaction, city: str, unit: str = "cels
     except Exception as e:
         await interaction.followup.send(f"❌ **Error**: {str(e)}")
 
-def parse_time_input(time_str):
-    """Parse various time input formats into seconds"""
-    time_str = time_str.lower().strip()
-    
-    # Pattern for number + unit (e.g., "5m", "2h", "30s")
-    pattern = r'^(\d+)\s*(s|sec|second|seconds|m|min|minute|minutes|h|hr|hour|hours|d|day|days)$'
-    match = re.match(pattern, time_str)
-    
-    if match:
-        number = int(match.group(1))
-        unit = match.group(2)
-        
-        # Convert to seconds
-        if unit in ['s', 'sec', 'second', 'seconds']:
-            return number
-        elif unit in ['m', 'min', 'minute', 'minutes']:
-            return number * 60
-        elif unit in ['h', 'hr', 'hour', 'hours']:
-            return number * 3600
-        elif unit in ['d', 'day', 'days']:
-            return number * 86400
-    
-    # Try to parse as just minutes if it's a plain number
-    try:
-        minutes = int(time_str)
-        if 1 <= minutes <= 10080:  # 1 minute to 1 week
-            return minutes * 60
-    except ValueError:
-        pass
-    
-    return None
+def user_timezone(user_id):
+    """The timezone a user picked with /timezone (UTC if none)"""
+    return parse_timezone(reminder_store.get_timezone(user_id) or "UTC") or UTC
 
 def format_time_remaining(seconds):
     """Format seconds into human-readable time"""
@@ -857,31 +1280,59 @@ def format_time_remaining(seconds):
             return f"{days}d {hours}h"
         return f"{days}d"
 
+def format_reminder_time_left(remaining):
+    """Time left for a listed reminder; overdue ones are still waiting to be delivered"""
+    if remaining < 1:
+        return "⌛ Overdue (being delivered)"
+    return format_time_remaining(int(remaining))
+
+# Users fetched over REST are cached, since without the members intent the gateway cache misses often
+user_cache = UserCache(
+    client.get_user,
+    client.fetch_user,
+    ttl=USER_CACHE_TTL,
+    negative_ttl=USER_CACHE_NEGATIVE_TTL,
+    max_entries=USER_CACHE_MAX_ENTRIES,
+    not_found=discord.NotFound
+)
+
+async def lookup_user(user_id):
+    """Resolve a user ID through the user cache; None if unknown or the lookup failed"""
+    try:
+        return await user_cache.get(user_id)
+    except discord.HTTPException as e:
+        print(f"⚠️ Could not fetch user {user_id}: {e}")
+        return None
+
 async def send_reminder(user_id, channel_id, message, reminder_id):
-    """Send the reminder message"""
+    """Build the reminder embed and queue it for delivery with others due in the same channel"""
+    # Set when delivery can never succeed (channel gone, user gone, no access), so a
+    # recurring reminder is dropped instead of firing and failing forever
+    undeliverable = False
+    # Set when shutdown interrupts delivery: the reminder stays stored and goes out after the restart
+    interrupted = False
     try:
         print(f"🔔 Attempting to send reminder {reminder_id} to user {user_id} in channel {channel_id}")
         
         channel = client.get_channel(channel_id)
         if not channel:
             print(f"❌ Channel {channel_id} not found for reminder {reminder_id}")
+            undeliverable = True
             return
         
-        # Try to get user from cache first, then fetch if not found
-        user = client.get_user(user_id)
+        # Gateway cache first, then the user cache (which only calls the API on a miss)
+        try:
+            user = await user_cache.get(user_id)
+        except discord.HTTPException as e:
+            print(f"❌ Error fetching user {user_id}: {e}")
+            return
         if not user:
-            try:
-                user = await client.fetch_user(user_id)
-                print(f"✅ User {user_id} fetched from Discord API")
-            except discord.NotFound:
-                print(f"❌ User {user_id} not found on Discord for reminder {reminder_id}")
-                return
-            except discord.HTTPException as e:
-                print(f"❌ Error fetching user {user_id}: {e}")
-                return
+            print(f"❌ User {user_id} not found on Discord for reminder {reminder_id}")
+            undeliverable = True
+            return
         
         # Get reminder data to check if it's a group reminder
-        reminder_data = active_reminders.get(reminder_id, {})
+        reminder_data = reminder_store.get(reminder_id) or {}
         is_group_reminder = reminder_data.get('is_group_reminder', False)
         creator_id = reminder_data.get('creator_id')
         
@@ -900,13 +1351,7 @@ async def send_reminder(user_id, channel_id, message, reminder_id):
         
         # If it's a group reminder, show who set it
         if is_group_reminder and creator_id:
-            creator = client.get_user(creator_id)
-            if not creator:
-                try:
-                    creator = await client.fetch_user(creator_id)
-                except:
-                    creator = None
-            
+            creator = await lookup_user(creator_id)
             if creator:
                 embed.add_field(
                     name="👨‍💼 Set by:",
@@ -914,23 +1359,63 @@ async def send_reminder(user_id, channel_id, message, reminder_id):
                     inline=True
                 )
         
-        embed.set_footer(text=f"Reminder ID: {reminder_id}")
+        if reminder_data.get('recurrence'):
+            embed.add_field(
+                name="🔁 Repeats:",
+                value=describe_recurrence(reminder_data['recurrence']),
+                inline=True
+            )
         
-        # Send the reminder message
-        reminder_message = await channel.send(f"{user.mention}", embed=embed)
-        print(f"✅ Reminder {reminder_id} sent successfully! Message ID: {reminder_message.id}")
+        embed.set_footer(text=f"Reminder ID: {reminder_id}")
         
-        # Remove from active reminders
-        if reminder_id in active_reminders:
-            del active_reminders[reminder_id]
-            print(f"🗑️ Reminder {reminder_id} removed from active reminders")
+        # Queue the reminder; it is sent together with others due in the same channel
+        await reminder_batcher.submit(channel_id, (user.mention, embed))
+        print(f"✅ Reminder {reminder_id} sent successfully!")
             
+    except asyncio.CancelledError:
+        print(f"⏸️ Reminder {reminder_id} not sent before shutdown, keeping it for the restart")
+        interrupted = True
+        raise
     except discord.Forbidden:
         print(f"❌ No permission to send reminder {reminder_id} in channel {channel_id}")
+        undeliverable = True
+    except discord.NotFound as e:
+        print(f"❌ Channel {channel_id} is gone, can't send reminder {reminder_id}: {e}")
+        undeliverable = True
     except discord.HTTPException as e:
         print(f"❌ HTTP error sending reminder {reminder_id}: {e}")
     except Exception as e:
         print(f"❌ Error sending reminder {reminder_id}: {e}")
+    finally:
+        # Delivery is attempted once; recurring reminders move on to their next occurrence
+        # (after a success or a transient error), everything else is dropped so it isn't
+        # re-sent after a restart. Reminders interrupted by shutdown are left untouched.
+        if not interrupted and (undeliverable or not await reschedule_recurring(reminder_id)):
+            if await reminder_store.remove(reminder_id):
+                print(f"🗑️ Reminder {reminder_id} removed from active reminders")
+
+async def reschedule_recurring(reminder_id):
+    """Advance a recurring reminder to its next occurrence; False for one-off reminders"""
+    reminder_data = reminder_store.get(reminder_id)
+    if not reminder_data or not reminder_data.get('recurrence'):
+        return False
+    
+    # Only the rule and the next due time are stored; each delivery computes the one after it
+    reminder_data = dict(reminder_data)
+    reminder_data['due_at'] = next_fire(reminder_data['recurrence'], reminder_data['due_at'], datetime.now(UTC))
+    await reminder_store.add(reminder_id, reminder_data)
+    schedule_reminder(reminder_id, reminder_data['due_at'])
+    return True
+
+async def send_reminder_batch(channel_id, items):
+    """Send reminders due together in one channel as a single message"""
+    channel = client.get_channel(channel_id)
+    if not channel:
+        raise RuntimeError(f"Channel {channel_id} not found")
+    
+    mentions = " ".join(dict.fromkeys(mention for mention, _ in items))
+    reminder_message = await channel.send(mentions, embeds=[embed for _, embed in items])
+    print(f"📨 Sent {len(items)} reminder(s) to channel {channel_id} in one message (ID: {reminder_message.id})")
 
 @tree.command(name="remind", description="Set a reminder for yourself")
 async def remind_me(interaction: discord.Interaction, time: str, message: str):
@@ -941,17 +1426,18 @@ async def remind_me(interaction: discord.Interaction, time: str, message: str):
 
     try:
         # Parse the time input
-        seconds = parse_time_input(time)
+        seconds = parse_time_input(time, tz=user_timezone(interaction.user.id))
         
         if seconds is None:
             await interaction.followup.send(
                 "❌ **Invalid Time Format**\n\n"
                 "**Valid formats:**\n"
-                "• `5m` or `5 minutes`\n"
-                "• `2h` or `2 hours`\n"
-                "• `30s` or `30 seconds`\n"
-                "• `1d` or `1 day`\n"
+                "• `5m`, `2 hours`, `30s`, `1d`\n"
+                "• `1h30m` or `2d 4h`\n"
+                "• `14:30`, `9pm` or `tomorrow 9am`\n"
+                "• `2026-10-20 14:30` (optionally followed by a timezone like `Europe/Berlin`)\n"
                 "• `120` (plain number = minutes)\n\n"
+                "Clock times use your `/timezone` (UTC by default).\n\n"
                 "**Examples:**\n"
                 "• `/remind time:5m message:\"Check the server\"`\n"
                 "• `/remind time:2h message:\"Team meeting\"`"
@@ -977,13 +1463,14 @@ async def remind_me(interaction: discord.Interaction, time: str, message: str):
             'channel_id': interaction.channel.id,
             'message': message,
             'created_at': datetime.now(UTC),
+            'due_at': datetime.now(UTC) + timedelta(seconds=seconds),
             'duration_seconds': seconds
         }
         
-        active_reminders[reminder_id] = reminder_data
+        await reminder_store.add(reminder_id, reminder_data)
         
         # Schedule the reminder
-        asyncio.create_task(schedule_reminder(reminder_id, seconds))
+        schedule_reminder(reminder_id, due_at(reminder_data))
         
         # Create confirmation embed
         embed = discord.Embed(
@@ -1018,15 +1505,125 @@ async def remind_me(interaction: discord.Interaction, time: str, message: str):
     except Exception as e:
         await interaction.followup.send(f"❌ **Error setting reminder**: {str(e)}")
 
-async def schedule_reminder(reminder_id, delay_seconds):
-    """Schedule a reminder to be sent after delay"""
+@tree.command(name="timezone", description="Set your timezone for clock times in reminders and polls")
+async def set_user_timezone(interaction: discord.Interaction, name: str = None):
+    try:
+        await interaction.response.defer()
+    except discord.errors.NotFound:
+        return
+
+    try:
+        if name is None:
+            current = reminder_store.get_timezone(interaction.user.id) or "UTC"
+            local_time = datetime.now(user_timezone(interaction.user.id)).strftime("%H:%M")
+            await interaction.followup.send(f"🕒 Your timezone is **{current}** (local time {local_time}).")
+            return
+        
+        name = canonical_timezone_name(name.strip())
+        tz = parse_timezone(name)
+        if tz is None:
+            await interaction.followup.send(
+                "❌ **Unknown Timezone**\n\n"
+                "Use a name like `Europe/Berlin`, `America/New_York`, `Asia/Kolkata` or an offset like `+05:30`."
+            )
+            return
+        
+        await reminder_store.set_timezone(interaction.user.id, name)
+        await interaction.followup.send(
+            f"✅ Timezone set to **{name}** (local time {datetime.now(tz).strftime('%H:%M')}).\n"
+            "Clock times like `14:30` or `tomorrow 9am` in `/remind`, `/reminduser` and polls now use it, "
+            "and so do new `/remindevery` schedules (existing ones keep the timezone they were set in)."
+        )
+        
+    except Exception as e:
+        await interaction.followup.send(f"❌ **Error setting timezone**: {str(e)}")
+
+@tree.command(name="remindevery", description="Set a recurring reminder for yourself")
+async def remind_every(interaction: discord.Interaction, schedule: str, message: str):
+    try:
+        await interaction.response.defer()
+    except discord.errors.NotFound:
+        return
+
+    try:
+        rule = parse_recurrence(schedule, reminder_store.get_timezone(interaction.user.id))
+        
+        if rule is None:
+            await interaction.followup.send(
+                "❌ **Invalid Schedule**\n\n"
+                "**Valid formats:**\n"
+                "• `every 30m`, `every 2 hours`, `hourly`\n"
+                "• `daily 09:30` or `every day at 9:30`\n"
+                "• `weekdays 09:30`, `weekends 10:00`, `mon,wed 18:00`\n"
+                "• `cron 30 9 * * 1-5` (minute hour day month weekday)\n\n"
+                "Times use your `/timezone` (UTC if unset) and repeats must be at least 1 minute apart.\n\n"
+                "**Example:**\n"
+                "• `/remindevery schedule:weekdays 09:30 message:\"Standup\"`"
+            )
+            return
+        
+        import uuid
+        reminder_id = str(uuid.uuid4())[:8]
+        
+        now = datetime.now(UTC)
+        first_due = next_fire(rule, now)
+        reminder_data = {
+            'user_id': interaction.user.id,
+            'channel_id': interaction.channel.id,
+            'message': message,
+            'created_at': now,
+            'due_at': first_due,
+            'duration_seconds': round((first_due - now).total_seconds()),
+            'recurrence': rule
+        }
+        
+        await reminder_store.add(reminder_id, reminder_data)
+        schedule_reminder(reminder_id, first_due)
+        
+        embed = discord.Embed(
+            title="🔁 Recurring Reminder Set",
+            description=f"**{message}**",
+            color=0x00ff00,
+            timestamp=datetime.now(UTC)
+        )
+        
+        embed.add_field(
+            name="🔁 Repeats:",
+            value=describe_recurrence(rule),
+            inline=True
+        )
+        
+        embed.add_field(
+            name="⏱️ Next:",
+            value=f"in {format_time_remaining(reminder_data['duration_seconds'])}",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="🆔 ID:",
+            value=f"`{reminder_id}`",
+            inline=True
+        )
+        
+        embed.set_footer(text="Use /cancel reminder_id to stop it")
+        
+        await interaction.followup.send(embed=embed)
+        
+    except Exception as e:
+        await interaction.followup.send(f"❌ **Error setting reminder**: {str(e)}")
+
+def schedule_reminder(reminder_id, when):
+    """Register a reminder with the timer scheduler to be delivered at when"""
+    delay_seconds = max(0, round((when - datetime.now(UTC)).total_seconds()))
     print(f"⏰ Scheduling reminder {reminder_id} for {delay_seconds} seconds")
-    await asyncio.sleep(delay_seconds)
-    
+    scheduler.schedule(reminder_id, when.timestamp(), deliver_reminder, reminder_id)
+
+async def deliver_reminder(reminder_id):
+    """Called by the scheduler when a reminder is due"""
     print(f"⏰ Time's up! Processing reminder {reminder_id}")
     
-    if reminder_id in active_reminders:
-        reminder_data = active_reminders[reminder_id]
+    reminder_data = reminder_store.get(reminder_id)
+    if reminder_data:
         print(f"📋 Reminder data found for {reminder_id}: user={reminder_data['user_id']}, channel={reminder_data['channel_id']}")
         await send_reminder(
             reminder_data['user_id'],
@@ -1038,7 +1635,7 @@ async def schedule_reminder(reminder_id, delay_seconds):
         print(f"❌ Reminder {reminder_id} not found in active reminders when trying to send")
 
 @tree.command(name="reminders", description="View your active reminders")
-async def view_reminders(interaction: discord.Interaction):
+async def view_reminders(interaction: discord.Interaction, page: int = 1):
     try:
         await interaction.response.defer()
     except discord.errors.NotFound:
@@ -1047,21 +1644,20 @@ async def view_reminders(interaction: discord.Interaction):
     try:
         user_reminders = []
         current_time = datetime.now(UTC)
-        
-        # Find user's reminders
-        for reminder_id, data in active_reminders.items():
-            if data['user_id'] == interaction.user.id:
-                # Calculate remaining time
-                elapsed = (current_time - data['created_at']).total_seconds()
-                remaining = max(0, data['duration_seconds'] - elapsed)
-                
-                if remaining > 0:
-                    user_reminders.append({
-                        'id': reminder_id,
-                        'message': data['message'],
-                        'remaining': remaining,
-                        'channel_id': data['channel_id']
-                    })
+        total = reminder_store.count_for_user(interaction.user.id)
+        page_count = max(1, -(-total // REMINDERS_PER_PAGE))
+        page = min(max(1, page), page_count)
+        offset = (page - 1) * REMINDERS_PER_PAGE
+        
+        # One page of the user's reminders, soonest first, straight from the per-user index
+        for reminder_id, data in reminder_store.list_for_user(interaction.user.id, offset, REMINDERS_PER_PAGE):
+            user_reminders.append({
+                'id': reminder_id,
+                'message': data['message'],
+                'remaining': max(0, (due_at(data) - current_time).total_seconds()),
+                'channel_id': data['channel_id'],
+                'recurrence': data.get('recurrence')
+            })
         
         if not user_reminders:
             embed = discord.Embed(
@@ -1077,28 +1673,30 @@ async def view_reminders(interaction: discord.Interaction):
         else:
             embed = discord.Embed(
                 title="📝 Your Active Reminders",
-                description=f"You have {len(user_reminders)} active reminder(s)",
+                description=f"You have {total} active reminder(s)",
                 color=0x3498db,
                 timestamp=datetime.now(UTC)
             )
             
-            for i, reminder in enumerate(user_reminders[:10], 1):  # Show max 10
+            for i, reminder in enumerate(user_reminders, offset + 1):
                 channel = client.get_channel(reminder['channel_id'])
                 channel_name = channel.name if channel else "Unknown"
+                repeats = f"**Repeats:** {describe_recurrence(reminder['recurrence'])}\n" if reminder['recurrence'] else ""
                 
                 embed.add_field(
                     name=f"⏰ Reminder {i}",
                     value=f"**Message:** {reminder['message'][:50]}{'...' if len(reminder['message']) > 50 else ''}\n"
-                          f"**Time Left:** {format_time_remaining(int(reminder['remaining']))}\n"
+                          f"**Time Left:** {format_reminder_time_left(reminder['remaining'])}\n"
+                          f"{repeats}"
                           f"**Channel:** #{channel_name}\n"
                           f"**ID:** `{reminder['id']}`",
                     inline=False
                 )
             
-            if len(user_reminders) > 10:
+            if page_count > 1:
                 embed.add_field(
                     name="📊 Note",
-                    value=f"Showing first 10 of {len(user_reminders)} reminders",
+                    value=f"Page {page}/{page_count} • use `/reminders page:<number>` to see more",
                     inline=False
                 )
         
@@ -1119,11 +1717,11 @@ async def cancel_reminder(interaction: discord.Interaction, reminder_id: str):
         reminder_id = reminder_id.strip()
         
         # Check if reminder exists
-        if reminder_id not in active_reminders:
+        reminder_data = reminder_store.get(reminder_id)
+        if not reminder_data:
             await interaction.followup.send(f"❌ **Error**: Reminder `{reminder_id}` not found.")
             return
         
-        reminder_data = active_reminders[reminder_id]
         is_group_reminder = reminder_data.get('is_group_reminder', False)
         
         # Check permissions
@@ -1148,8 +1746,9 @@ async def cancel_reminder(interaction: discord.Interaction, reminder_id: str):
             await interaction.followup.send("❌ **Error**: You can only cancel your own reminders or reminders set for you.")
             return
         
-        # Cancel the reminder
-        del active_reminders[reminder_id]
+        # Cancel the reminder: drop its timer right away, then delete it from the store
+        scheduler.cancel(reminder_id)
+        await reminder_store.remove(reminder_id)
         
         # Create appropriate embed based on reminder type
         if is_group_reminder:
@@ -1160,8 +1759,10 @@ async def cancel_reminder(interaction: discord.Interaction, reminder_id: str):
                 timestamp=datetime.now(UTC)
             )
             
-            target_user = client.get_user(reminder_data['user_id'])
-            creator_user = client.get_user(reminder_data.get('creator_id'))
+            target_user, creator_user = await asyncio.gather(
+                lookup_user(reminder_data['user_id']),
+                lookup_user(reminder_data.get('creator_id'))
+            )
             
             embed.add_field(
                 name="👤 Was for:",
@@ -1188,6 +1789,13 @@ async def cancel_reminder(interaction: discord.Interaction, reminder_id: str):
                 color=0xe74c3c,
                 timestamp=datetime.now(UTC)
             )
+            
+            if reminder_data.get('recurrence'):
+                embed.add_field(
+                    name="🔁 Stopped:",
+                    value=f"No more reminders {describe_recurrence(reminder_data['recurrence'])}",
+                    inline=False
+                )
         
         embed.add_field(
             name="🆔 Cancelled ID:",
@@ -1209,17 +1817,18 @@ async def remind_user(interaction: discord.Interaction, user: discord.Member, ti
 
     try:
         # Parse the time input
-        seconds = parse_time_input(time)
+        seconds = parse_time_input(time, tz=user_timezone(interaction.user.id))
         
         if seconds is None:
             await interaction.followup.send(
                 "❌ **Invalid Time Format**\n\n"
                 "**Valid formats:**\n"
-                "• `5m` or `5 minutes`\n"
-                "• `2h` or `2 hours`\n"
-                "• `30s` or `30 seconds`\n"
-                "• `1d` or `1 day`\n"
+                "• `5m`, `2 hours`, `30s`, `1d`\n"
+                "• `1h30m` or `2d 4h`\n"
+                "• `14:30`, `9pm` or `tomorrow 9am`\n"
+                "• `2026-10-20 14:30` (optionally followed by a timezone like `Europe/Berlin`)\n"
                 "• `120` (plain number = minutes)\n\n"
+                "Clock times use your `/timezone` (UTC by default).\n\n"
                 "**Examples:**\n"
                 "• `/reminduser user:@john time:5m message:\"Check the server\"`\n"
                 "• `/reminduser user:@sarah time:2h message:\"Team meeting\"`"
@@ -1256,14 +1865,15 @@ async def remind_user(interaction: discord.Interaction, user: discord.Member, ti
             'channel_id': interaction.channel.id,
             'message': message,
             'created_at': datetime.now(UTC),
+            'due_at': datetime.now(UTC) + timedelta(seconds=seconds),
             'duration_seconds': seconds,
             'is_group_reminder': True
         }
         
-        active_reminders[reminder_id] = reminder_data
+        await reminder_store.add(reminder_id, reminder_data)
         
         # Schedule the reminder
-        asyncio.create_task(schedule_reminder(reminder_id, seconds))
+        schedule_reminder(reminder_id, due_at(reminder_data))
         
         # Create confirmation embed
         embed = discord.Embed(
@@ -1311,7 +1921,7 @@ async def remind_user(interaction: discord.Interaction, user: discord.Member, ti
         await interaction.followup.send(f"❌ **Error setting group reminder**: {str(e)}")
 
 @tree.command(name="groupreminders", description="View reminders you've set for others")
-async def view_group_reminders(interaction: discord.Interaction):
+async def view_group_reminders(interaction: discord.Interaction, page: int = 1):
     try:
         await interaction.response.defer()
     except discord.errors.NotFound:
@@ -1320,24 +1930,22 @@ async def view_group_reminders(interaction: discord.Interaction):
     try:
         user_group_reminders = []
         current_time = datetime.now(UTC)
-        
-        # Find reminders created by this user for others
-        for reminder_id, data in active_reminders.items():
-            if (data.get('creator_id') == interaction.user.id and 
-                data.get('is_group_reminder', False)):
-                # Calculate remaining time
-                elapsed = (current_time - data['created_at']).total_seconds()
-                remaining = max(0, data['duration_seconds'] - elapsed)
-                
-                if remaining > 0:
-                    target_user = client.get_user(data['user_id'])
-                    user_group_reminders.append({
-                        'id': reminder_id,
-                        'message': data['message'],
-                        'remaining': remaining,
-                        'channel_id': data['channel_id'],
-                        'target_user': target_user.display_name if target_user else "Unknown User"
-                    })
+        total = reminder_store.count_by_creator(interaction.user.id)
+        page_count = max(1, -(-total // REMINDERS_PER_PAGE))
+        page = min(max(1, page), page_count)
+        offset = (page - 1) * REMINDERS_PER_PAGE
+        
+        # One page of the reminders this user created for others, soonest first
+        page_reminders = reminder_store.list_by_creator(interaction.user.id, offset, REMINDERS_PER_PAGE)
+        target_users = await asyncio.gather(*(lookup_user(data['user_id']) for _, data in page_reminders))
+        for (reminder_id, data), target_user in zip(page_reminders, target_users):
+            user_group_reminders.append({
+                'id': reminder_id,
+                'message': data['message'],
+                'remaining': max(0, (due_at(data) - current_time).total_seconds()),
+                'channel_id': data['channel_id'],
+                'target_user': target_user.display_name if target_user else "Unknown User"
+            })
         
         if not user_group_reminders:
             embed = discord.Embed(
@@ -1353,12 +1961,12 @@ async def view_group_reminders(interaction: discord.Interaction):
         else:
             embed = discord.Embed(
                 title="👥 Your Group Reminders",
-                description=f"You have {len(user_group_reminders)} active group reminder(s)",
+                description=f"You have {total} active group reminder(s)",
                 color=0x9b59b6,
                 timestamp=datetime.now(UTC)
             )
             
-            for i, reminder in enumerate(user_group_reminders[:10], 1):  # Show max 10
+            for i, reminder in enumerate(user_group_reminders, offset + 1):
                 channel = client.get_channel(reminder['channel_id'])
                 channel_name = channel.name if channel else "Unknown"
                 
@@ -1366,16 +1974,16 @@ async def view_group_reminders(interaction: discord.Interaction):
                     name=f"⏰ Group Reminder {i}",
                     value=f"**For:** {reminder['target_user']}\n"
                           f"**Message:** {reminder['message'][:50]}{'...' if len(reminder['message']) > 50 else ''}\n"
-                          f"**Time Left:** {format_time_remaining(int(reminder['remaining']))}\n"
+                          f"**Time Left:** {format_reminder_time_left(reminder['remaining'])}\n"
                           f"**Channel:** #{channel_name}\n"
                           f"**ID:** `{reminder['id']}`",
                     inline=False
                 )
             
-            if len(user_group_reminders) > 10:
+            if page_count > 1:
                 embed.add_field(
                     name="📊 Note",
-                    value=f"Showing first 10 of {len(user_group_reminders)} group reminders",
+                    value=f"Page {page}/{page_count} • use `/groupreminders page:<number>` to see more",
                     inline=False
                 )
         
@@ -1403,11 +2011,12 @@ async def test_reminder(interaction: discord.Interaction, message: str = "Test r
             'channel_id': interaction.channel.id,
             'message': message,
             'created_at': datetime.now(UTC),
+            'due_at': datetime.now(UTC) + timedelta(seconds=1),
             'duration_seconds': 1,  # 1 second
             'is_group_reminder': False
         }
         
-        active_reminders[reminder_id] = reminder_data
+        await reminder_store.add(reminder_id, reminder_data)
         
         # Send confirmation
         embed = discord.Embed(
@@ -1446,7 +2055,7 @@ async def test_reminder(interaction: discord.Interaction, message: str = "Test r
         await interaction.followup.send(embed=embed)
         
         # Schedule immediate delivery for testing
-        asyncio.create_task(schedule_reminder(reminder_id, 1))
+        schedule_reminder(reminder_id, due_at(reminder_data))
         
         print(f"🧪 Test reminder {reminder_id} scheduled for user {interaction.user.id} in channel {interaction.channel.id}")
         
@@ -1473,6 +2082,82 @@ async def sync_commands(interaction: discord.Interaction):
     except Exception as e:
         await interaction.followup.send(f"❌ Error syncing commands: {str(e)}")
 
+# The event loop only keeps weak references to tasks, so long-lived ones are held here
+background_tasks = set()
+
+def _background_task_done(task):
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"❌ Background task '{task.get_name()}' failed: {task.exception()!r}")
+
+def start_background_task(coro, name):
+    """Run a coroutine for the life of the bot, keeping a reference and reporting its failure"""
+    task = asyncio.create_task(coro, name=name)
+    background_tasks.add(task)
+    task.add_done_callback(_background_task_done)
+    return task
+
+@client.event
+async def setup_hook():
+    # Runs once before connecting to the gateway
+    print("⏱️ Startup report:")
+    for name, elapsed_ms in import_timings.items():
+        print(f"   - import {name}: {elapsed_ms:.0f} ms")
+    print(f"   - ready to connect after {(time.perf_counter() - startup_started) * 1000:.0f} ms")
+    await http_client.start()
+    scheduler.start()
+    start_background_task(knowledge_store.watch(KNOWLEDGE_RELOAD_INTERVAL), "knowledge watcher")
+    await answer_cache.open()
+    loaded = await reminder_store.open()
+    print(f"💾 Loaded {loaded} pending reminder(s) from {REMINDER_DB_PATH}")
+    start_background_task(restore_reminders(), "reminder restore")
+    loaded = await poll_store.open()
+    print(f"💾 Loaded {loaded} running poll(s) from {POLL_DB_PATH}")
+    start_background_task(restore_polls(), "poll restore")
+
+async def restore_reminders():
+    """Fire overdue reminders and reschedule the rest once channels are cached"""
+    await client.wait_until_ready()
+    now = datetime.now(UTC)
+    overdue = 0
+    for reminder_id, data in list(reminder_store.reminders.items()):
+        when = due_at(data)
+        if when <= now:
+            overdue += 1
+        schedule_reminder(reminder_id, when)
+    print(f"⏰ Restored {len(reminder_store)} reminder(s), {overdue} overdue and firing now")
+
+async def restore_polls():
+    """Close overdue polls and re-arm the rest once channels are cached"""
+    # Button clicks on polls sent before the restart are routed to a fresh view for each message
+    for poll_data in poll_store.polls.values():
+        if poll_data['mode'] == 'buttons':
+            view = PollView(poll_data, record_button_vote)
+            view.mark_ready()
+            poll_views[poll_data['message_id']] = view
+            client.add_view(view, message_id=poll_data['message_id'])
+    
+    await client.wait_until_ready()
+    now = time.time()
+    overdue = 0
+    for poll_data in list(poll_store.polls.values()):
+        if poll_ends_at(poll_data) <= now:
+            overdue += 1
+        schedule_poll_end(poll_data)
+    print(f"📊 Restored {len(poll_store)} poll(s), {overdue} overdue and closing now")
+
+async def shutdown_resources():
+    """Close shared resources when the bot shuts down"""
+    for task in list(background_tasks):
+        task.cancel()
+    await scheduler.stop()
+    await poll_refresher.stop()
+    await reminder_batcher.stop()
+    await http_client.close()
+    await reminder_store.close()
+    await poll_store.close()
+    await answer_cache.close()
+
 @client.event
 async def on_ready():
     try:
@@ -0,0 +1,109 @@
+import asyncio
+import time
+from collections import deque
+
+class ChannelBatcher:
+    """Groups items bound for the same channel so a burst goes out as a few messages.
+
+    The first item for a channel starts a short collection window; when it closes,
+    one worker per channel sends the queued items in chunks of at most
+    max_per_message (and at most max_size by the size function), spacing its sends
+    min_interval apart so a burst stays under the channel's rate limit.
+    submit() returns a future that resolves once the item's chunk was sent, or
+    raises whatever the send raised. stop() sends whatever is still queued right
+    away instead of dropping it; only items it can't send in time are cancelled.
+    """
+
+    def __init__(self, send, window=0.5, max_per_message=10, min_interval=1.0, size=None, max_size=None):
+        self._send = send
+        self.window = window
+        self.max_per_message = max_per_message
+        self.min_interval = min_interval
+        self._size = size or (lambda item: 1)
+        self.max_size = max_size
+        self._pending = {}  # channel -> deque of (item, future)
+        self._workers = {}  # channel -> worker task
+        self._last_sent = {}  # channel -> monotonic time of the last send
+        self._flushing = asyncio.Event()  # set by stop(): skip windows and pacing
+        self.items = 0
+        self.messages = 0
+        self.max_batch = 0
+        self.failed = 0
+
+    @property
+    def queued(self):
+        return sum(len(pending) for pending in self._pending.values())
+
+    def submit(self, channel_id, item):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(channel_id, deque()).append((item, future))
+        if channel_id not in self._workers:
+            self._workers[channel_id] = asyncio.create_task(self._drain(channel_id))
+        return future
+
+    def _take(self, pending):
+        batch, total = [], 0
+        while pending and len(batch) < self.max_per_message:
+            cost = self._size(pending[0][0])
+            if batch and self.max_size is not None and total + cost > self.max_size:
+                break
+            total += cost
+            batch.append(pending.popleft())
+        return batch
+
+    async def _sleep(self, delay):
+        """Sleep for delay, or less if stop() wants everything sent now"""
+        try:
+            await asyncio.wait_for(self._flushing.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _drain(self, channel_id):
+        try:
+            await self._sleep(self.window)
+            pending = self._pending[channel_id]
+            while pending:
+                wait = self._last_sent.get(channel_id, 0.0) + self.min_interval - time.monotonic()
+                if wait > 0:
+                    await self._sleep(wait)  # items arriving meanwhile join the next chunk
+                batch = self._take(pending)
+                try:
+                    await self._send(channel_id, [item for item, _ in batch])
+                except asyncio.CancelledError:
+                    for _, future in batch:
+                        future.cancel()
+                    raise
+                except Exception as e:
+                    self.failed += len(batch)
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_result(True)
+                self._last_sent[channel_id] = time.monotonic()
+                self.items += len(batch)
+                self.messages += 1
+                self.max_batch = max(self.max_batch, len(batch))
+        finally:
+            self._workers.pop(channel_id, None)
+            for _, future in self._pending.pop(channel_id, ()):
+                future.cancel()
+            self._prune(time.monotonic())
+
+    def _prune(self, now):
+        """Forget send times old enough that they no longer delay anything"""
+        if len(self._last_sent) > 1024:
+            self._last_sent = {channel: sent for channel, sent in self._last_sent.items()
+                               if now - sent < self.min_interval}
+
+    async def stop(self, timeout=5.0):
+        """Flush queued items, cancelling whatever is still unsent after timeout seconds"""
+        self._flushing.set()
+        workers = list(self._workers.values())
+        if workers:
+            _, unfinished = await asyncio.wait(workers, timeout=timeout)
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,83 @@
+import asyncio
+import random
+from urllib.parse import urlsplit
+
+import aiohttp
+
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+class HttpClient:
+    """Application-wide aiohttp session with connection pooling, per-host timeouts and retries"""
+
+    def __init__(self, limit=100, limit_per_host=10, dns_ttl=300, keepalive_timeout=30,
+                 timeout=10.0, host_timeouts=None, max_retries=3, backoff_base=0.5, backoff_max=8.0):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.host_timeouts = dict(host_timeouts or {})
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.session = None
+        self.requests = 0
+        self.retries = 0
+
+    async def start(self):
+        """Create the shared session (must run inside the event loop)"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self.session
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    def _timeout_for(self, url):
+        host = urlsplit(url).hostname
+        return aiohttp.ClientTimeout(total=self.host_timeouts.get(host, self.timeout))
+
+    def _backoff(self, attempt, retry_after=None):
+        """Full-jitter exponential backoff, honouring Retry-After when the server sends one"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def get_json(self, url, params=None, headers=None):
+        """GET a URL and return (status, parsed JSON or None), retrying 5xx/429 and connection errors"""
+        session = await self.start()
+        timeout = self._timeout_for(url)
+
+        for attempt in range(self.max_retries + 1):
+            self.requests += 1
+            try:
+                async with session.get(url, params=params, headers=headers, timeout=timeout) as response:
+                    if response.status in RETRY_STATUSES and attempt < self.max_retries:
+                        delay = self._backoff(attempt, response.headers.get("Retry-After"))
+                    else:
+                        try:
+                            data = await response.json(content_type=None)
+                        except (aiohttp.ContentTypeError, ValueError):
+                            data = None
+                        return response.status, data
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+
+            self.retries += 1
+            await asyncio.sleep(delay)
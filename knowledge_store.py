@@ -0,0 +1,57 @@
+import asyncio
+import hashlib
+import os
+import re
+
+# Sections in knowledge_base.txt are separated by a line of dashes
+SECTION_SEPARATOR = re.compile(r'^\s*-{5,}\s*$', re.MULTILINE)
+
+class KnowledgeStore:
+    """In-memory copy of the knowledge base that reloads only when the file changes"""
+
+    def __init__(self, path="knowledge_base.txt"):
+        self.path = path
+        self.text = ""
+        self.sections = []
+        self.version = None
+        self.reload_count = 0
+        self._signature = None
+
+    def _stat_signature(self):
+        """Cheap change check based on file metadata (no read)"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self):
+        """Read the file, split it into sections and compute its version hash"""
+        signature = self._stat_signature()
+        with open(self.path, "r", encoding="utf-8") as f:
+            text = f.read()
+
+        self.text = text
+        self.sections = [section.strip() for section in SECTION_SEPARATOR.split(text) if section.strip()]
+        self.version = hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+        self._signature = signature
+        self.reload_count += 1
+        return self
+
+    def reload_if_changed(self):
+        """Reload the file if its mtime or size changed. Returns True if reloaded."""
+        signature = self._stat_signature()
+        if signature is None or signature == self._signature:
+            return False
+        self.load()
+        return True
+
+    async def watch(self, interval=5.0):
+        """Poll the file metadata in the background and reload on change"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if self.reload_if_changed():
+                    print(f"📚 Knowledge base reloaded ({len(self.sections)} sections, version {self.version})")
+            except Exception as e:
+                print(f"❌ Failed to reload knowledge base: {e}")
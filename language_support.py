@@ -1,9 +1,23 @@
-from langdetect import detect, DetectorFactory
+import functools
+import re
+import threading
+import time
+
+from langdetect import detect, detect_langs, DetectorFactory
+from langdetect import detector_factory
+from langdetect.detector_factory import init_factory
 import google.genai as genai
 
+from prompts import build_system_instruction, build_question_prompt
+
 # Set seed for consistent results
 DetectorFactory.seed = 0
 
+# langdetect publishes its factory before the profiles are loaded, so nothing may
+# detect until the loading thread says it has finished
+_detector_lock = threading.Lock()
+_detector_ready = threading.Event()
+
 # Language mappings
 LANGUAGE_NAMES = {
     'en': 'English',
@@ -77,107 +91,190 @@ LANGUAGE_NAMES = {
     'xh': 'Xhosa',
     'yo': 'Yoruba',
     'ig': 'Igbo',
-    'ha': 'Hausa'
+    'ha': 'Hausa',
+    'el': 'Greek',
+    'bo': 'Tibetan'
 }
 
+# Common English greetings and phrases that should always be treated as English
+ENGLISH_GREETINGS = [
+    'hi', 'hello', 'hey', 'help', 'thanks', 'thank you', 'yes', 'no', 
+    'ok', 'okay', 'sure', 'please', 'sorry', 'excuse me', 'good morning',
+    'good afternoon', 'good evening', 'good night', 'goodbye', 'bye',
+    'how are you', 'nice to meet you', 'see you later'
+]
+
+# One precompiled prefix match instead of a startswith() per greeting
+ENGLISH_GREETING_PREFIX = re.compile(
+    '|'.join(re.escape(greeting) for greeting in sorted(ENGLISH_GREETINGS, key=len, reverse=True))
+)
+
+# Common English words used to catch English text misdetected as Finnish
+ENGLISH_INDICATORS = frozenset([
+    'the', 'and', 'or', 'is', 'are', 'was', 'were', 'have', 'has', 'had', 'will', 'would',
+    'can', 'could', 'should', 'what', 'how', 'when', 'where', 'why', 'who'
+])
+
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# Scripts that identify a language on their own, once they make up most of the letters
+SCRIPT_LANGUAGES = [
+    (re.compile(r'[\uac00-\ud7af\u1100-\u11ff]'), 'ko'),  # Hangul
+    (re.compile(r'[\u0e00-\u0e7f]'), 'th'),            # Thai
+    (re.compile(r'[\u0590-\u05ff]'), 'he'),            # Hebrew
+    (re.compile(r'[\u0370-\u03ff]'), 'el'),            # Greek
+    (re.compile(r'[\u0980-\u09ff]'), 'bn'),            # Bengali
+    (re.compile(r'[\u0a00-\u0a7f]'), 'pa'),            # Gurmukhi
+    (re.compile(r'[\u0a80-\u0aff]'), 'gu'),            # Gujarati
+    (re.compile(r'[\u0b80-\u0bff]'), 'ta'),            # Tamil
+    (re.compile(r'[\u0c00-\u0c7f]'), 'te'),            # Telugu
+    (re.compile(r'[\u0c80-\u0cff]'), 'kn'),            # Kannada
+    (re.compile(r'[\u0d00-\u0d7f]'), 'ml'),            # Malayalam
+    (re.compile(r'[\u10a0-\u10ff]'), 'ka'),            # Georgian
+    (re.compile(r'[\u0f00-\u0fff]'), 'bo'),            # Tibetan
+    (re.compile(r'[\u0e80-\u0eff]'), 'lo'),            # Lao
+    (re.compile(r'[\u1780-\u17ff]'), 'km'),            # Khmer
+    (re.compile(r'[\u1000-\u109f]'), 'my'),            # Myanmar
+    (re.compile(r'[\u1200-\u137f]'), 'am'),            # Ethiopic
+    (re.compile(r'[\u0d80-\u0dff]'), 'si'),            # Sinhala
+]
+
+# Scripts shared by several languages, resolved by letters only one of them uses
+LETTER_PATTERN = re.compile(r'[^\W\d_]')
+KANA_PATTERN = re.compile(r'[\u3040-\u30ff]')
+CJK_PATTERN = re.compile(r'[\u3040-\u30ff\u4e00-\u9fff]')  # Japanese mixes kana with Han
+CYRILLIC = re.compile(r'[\u0400-\u04ff]')
+UKRAINIAN_LETTERS = re.compile(r'[їєґЇЄҐ]')
+URDU_LETTERS = re.compile(r'[ٹڈڑںےھ]')
+PERSIAN_LETTERS = re.compile(r'[پچژگ]')
+ARABIC_SCRIPT = re.compile(r'[\u0600-\u06ff]')
+
+def _script_language(text):
+    """Resolve the language from its writing system alone, or None if the script is ambiguous.
+
+    A script only decides when it makes up more than half of the letters, so an English
+    question quoting a word or two in another script is still left to langdetect.
+    """
+    if text.isascii():
+        return None
+    letters = "".join(LETTER_PATTERN.findall(text))
+
+    def dominant(pattern):
+        return pattern.search(letters) is not None and len(pattern.findall(letters)) * 2 > len(letters)
+
+    for pattern, lang in SCRIPT_LANGUAGES:
+        if dominant(pattern):
+            return lang
+    if dominant(CJK_PATTERN):
+        return 'ja' if KANA_PATTERN.search(letters) else 'zh'
+    if dominant(CYRILLIC) and UKRAINIAN_LETTERS.search(letters):
+        return 'uk'
+    if dominant(ARABIC_SCRIPT):
+        if URDU_LETTERS.search(letters):
+            return 'ur'
+        if PERSIAN_LETTERS.search(letters):
+            return 'fa'
+        return 'ar'
+    # Hindi, Marathi and Nepali share Devanagari; let langdetect decide
+    return None
+
+def _normalize_lang_code(lang):
+    """Map langdetect codes onto LANGUAGE_NAMES keys (zh-cn / zh-tw -> zh)"""
+    return 'zh' if lang.startswith('zh') else lang
+
+@functools.lru_cache(maxsize=4096)
+def _detect_normalized(text):
+    """Detect the language of whitespace-normalized text (cached).
+
+    Only results computed against fully loaded profiles reach the cache: langdetect is
+    used after _load_detector() returns, and a failed load raises, which lru_cache
+    never stores.
+    """
+    text_lower = text.lower()
+    
+    # Check if the text is (or starts with) a common English greeting/phrase
+    if ENGLISH_GREETING_PREFIX.match(text_lower):
+        return 'en'
+    
+    script_lang = _script_language(text)
+    if script_lang:
+        return script_lang
+    
+    # Blocks only while the start-up warm-up is still loading profiles
+    _load_detector()
+
+    # Get confidence scores for all detected languages
+    lang_probs = detect_langs(text)
+    
+    # Get the most likely language
+    detected_lang = _normalize_lang_code(lang_probs[0].lang)
+    confidence = lang_probs[0].prob
+    
+    # If confidence is low (< 0.7) or text is very short, default to English
+    if confidence < 0.7 or len(text.split()) < 3:
+        # Check if English is in the top 2 detected languages
+        for lang_prob in lang_probs[:2]:
+            if lang_prob.lang == 'en':
+                return 'en'
+        
+        # If no English detected but confidence is low, still default to English
+        if confidence < 0.5:
+            return 'en'
+    
+    # Additional check: if detected as Finnish but contains common English words
+    if detected_lang == 'fi':
+        words = set(WORD_PATTERN.findall(text_lower))
+        if len(words & ENGLISH_INDICATORS) >= 2:  # If 2+ common English words found
+            return 'en'
+    
+    return detected_lang
+
 def detect_language(text):
     """Detect the language of the input text with improved English detection"""
     try:
-        # Common English greetings and phrases that should always be treated as English
-        english_greetings = [
-            'hi', 'hello', 'hey', 'help', 'thanks', 'thank you', 'yes', 'no', 
-            'ok', 'okay', 'sure', 'please', 'sorry', 'excuse me', 'good morning',
-            'good afternoon', 'good evening', 'good night', 'goodbye', 'bye',
-            'how are you', 'nice to meet you', 'see you later'
-        ]
-        
-        text_lower = text.lower().strip()
-        
-        # Check if the text is a common English greeting/phrase
-        if text_lower in english_greetings:
-            return 'en', 'English'
-        
-        # Check if text starts with common English greetings
-        for greeting in english_greetings:
-            if text_lower.startswith(greeting):
-                return 'en', 'English'
-        
-        from langdetect import detect_langs
-        
-        # Get confidence scores for all detected languages
-        lang_probs = detect_langs(text)
-        
-        # Get the most likely language
-        detected_lang = lang_probs[0].lang
-        confidence = lang_probs[0].prob
-        
-        # If confidence is low (< 0.7) or text is very short, default to English
-        if confidence < 0.7 or len(text.split()) < 3:
-            # Check if English is in the top 2 detected languages
-            for lang_prob in lang_probs[:2]:
-                if lang_prob.lang == 'en':
-                    return 'en', 'English'
-            
-            # If no English detected but confidence is low, still default to English
-            if confidence < 0.5:
-                return 'en', 'English'
-        
-        # Additional check: if detected as Finnish but contains common English words
-        if detected_lang == 'fi':
-            english_indicators = ['the', 'and', 'or', 'is', 'are', 'was', 'were', 'have', 'has', 'had', 'will', 'would', 'can', 'could', 'should', 'what', 'how', 'when', 'where', 'why', 'who']
-            english_word_count = sum(1 for word in english_indicators if word in text_lower)
-            
-            if english_word_count >= 2:  # If 2+ common English words found
-                return 'en', 'English'
-        
+        detected_lang = _detect_normalized(" ".join(text.split()))
         return detected_lang, LANGUAGE_NAMES.get(detected_lang, detected_lang)
         
     except Exception as e:
         print(f"Language detection error: {e}")
         return 'en', 'English'  # Default to English if detection fails
 
-def create_multilingual_prompt(question, knowledge, detected_lang, lang_name):
-    """Create a prompt that instructs the AI to respond in the detected language"""
-    
-    if detected_lang == 'en':
-        # English prompt - now answers any question
-        return f"""You are CreoBot, a helpful AI assistant for CreoWis Technologies. You can answer any question the user asks.
-
-Company Knowledge (use when relevant):
-{knowledge}
-
-User Question: {question}
-
-Instructions:
-- Answer any question the user asks to the best of your ability
-- If the question is about CreoWis Technologies, use the company knowledge provided
-- For general questions, use your knowledge to provide helpful answers
-- Be professional, friendly, and helpful
-- Keep responses concise but informative
-- If you don't know something, say so honestly"""
-    
-    else:
-        # Multi-language prompt - now answers any question
-        return f"""You are CreoBot, a helpful AI assistant for CreoWis Technologies. You can answer any question the user asks.
-
-Company Knowledge (use when relevant):
-{knowledge}
+def _load_detector():
+    """Load langdetect's profiles once; later callers wait for the first load to finish"""
+    if _detector_ready.is_set():
+        return
+    with _detector_lock:
+        if _detector_ready.is_set():
+            return
+        try:
+            init_factory()
+        except Exception:
+            # Don't leave a half-loaded factory behind for the next attempt
+            detector_factory._factory = None
+            raise
+        _detector_ready.set()
 
-User Question: {question}
+def warm_up_detector():
+    """Load langdetect's language profiles now instead of on the first question"""
+    start = time.perf_counter()
+    try:
+        _load_detector()
+    except Exception as e:
+        print(f"❌ Language detector warm-up failed: {e}")
+        return None
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"🌍 Language detector warmed up in {elapsed_ms:.0f} ms")
+    return elapsed_ms
 
-IMPORTANT INSTRUCTIONS:
-- The user asked their question in {lang_name} ({detected_lang})
-- You MUST respond in {lang_name} ({detected_lang}) - the same language as the user's question
-- Answer any question the user asks to the best of your ability
-- If the question is about CreoWis Technologies, use the company knowledge provided
-- For general questions, use your knowledge to provide helpful answers in {lang_name}
-- Be professional, friendly, and helpful
-- Keep responses concise but informative
-- Maintain the same language throughout your entire response
-- If you don't know something, say so honestly in {lang_name}
+def start_detector_warm_up():
+    """Warm up the detector in a background thread so startup isn't delayed"""
+    thread = threading.Thread(target=warm_up_detector, name="langdetect-warm-up", daemon=True)
+    thread.start()
+    return thread
 
-Example response format in {lang_name}:
-[Your answer should be entirely in {lang_name}]"""
+def create_multilingual_prompt(question, knowledge, detected_lang, lang_name):
+    """Create a prompt that instructs the AI to respond in the detected language (as one string)"""
+    return f"{build_system_instruction(knowledge)}\n\n{build_question_prompt(question, detected_lang, lang_name)}"
 
 def get_language_flag(lang_code):
     """Get flag emoji for language"""
@@ -188,6 +285,7 @@ def get_language_flag(lang_code):
         'da': '🇩🇰', 'no': '🇳🇴', 'fi': '🇫🇮', 'pl': '🇵🇱', 'cs': '🇨🇿',
         'hu': '🇭🇺', 'ro': '🇷🇴', 'bg': '🇧🇬', 'hr': '🇭🇷', 'sk': '🇸🇰',
         'uk': '🇺🇦', 'th': '🇹🇭', 'vi': '🇻🇳', 'id': '🇮🇩', 'ms': '🇲🇾',
-        'he': '🇮🇱', 'fa': '🇮🇷', 'bn': '🇧🇩', 'ta': '🇱🇰', 'ne': '🇳🇵'
+        'he': '🇮🇱', 'fa': '🇮🇷', 'bn': '🇧🇩', 'ta': '🇱🇰', 'ne': '🇳🇵',
+        'el': '🇬🇷'
     }
     return flag_map.get(lang_code, '🌐')
\ No newline at end of file
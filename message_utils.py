@@ -0,0 +1,179 @@
+import re
+import unicodedata
+
+import discord
+
+DISCORD_MESSAGE_LIMIT = 2000
+EMBED_DESCRIPTION_LIMIT = 4096
+
+# A fenced code block, or an unclosed fence running to the end of the text
+CODE_FENCE = re.compile(r'```[^\n]*\n.*?(?:```|$)', re.DOTALL)
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+def _is_grapheme_boundary(text, index):
+    """True if cutting text at index does not split a user-perceived character"""
+    if index <= 0 or index >= len(text):
+        return True
+    char, prev = text[index], text[index - 1]
+    code = ord(char)
+    if unicodedata.category(char) in ('Mn', 'Mc', 'Me'):
+        return False  # combining mark belongs to the previous character
+    if char in '\u200d\ufe0e\ufe0f' or prev == '\u200d':
+        return False  # zero-width joiner sequences and variation selectors
+    if 0x1F3FB <= code <= 0x1F3FF or 0xE0020 <= code <= 0xE007F:
+        return False  # skin tone modifiers and flag tag sequences
+    if 0x1F1E6 <= code <= 0x1F1FF:
+        # Regional indicators pair up into flags; don't cut inside a pair
+        run = 0
+        i = index - 1
+        while i >= 0 and 0x1F1E6 <= ord(text[i]) <= 0x1F1FF:
+            run += 1
+            i -= 1
+        return run % 2 == 0
+    return True
+
+def _hard_split(text, limit):
+    """Split text into pieces of at most limit characters at grapheme boundaries"""
+    pieces = []
+    while len(text) > limit:
+        cut = limit
+        while cut > 0 and not _is_grapheme_boundary(text, cut):
+            cut -= 1
+        if cut == 0:
+            cut = limit
+        pieces.append(text[:cut])
+        text = text[cut:]
+    if text:
+        pieces.append(text)
+    return pieces
+
+def _pack(text, limit, separators):
+    """Greedily join pieces of text split on the first separator, recursing into finer ones"""
+    if len(text) <= limit:
+        return [text]
+    if not separators:
+        return _hard_split(text, limit)
+
+    sep, finer = separators[0], separators[1:]
+    pieces = []
+    current = None
+    for unit in text.split(sep):
+        for sub in (_pack(unit, limit, finer) if len(unit) > limit else [unit]):
+            if current is None:
+                current = sub
+            elif len(current) + len(sep) + len(sub) <= limit:
+                current = f"{current}{sep}{sub}"
+            else:
+                pieces.append(current)
+                current = sub
+    if current:
+        pieces.append(current)
+    return pieces
+
+def _split_code_block(block, limit):
+    """Split an oversized code block, closing and reopening the fence in every piece"""
+    lines = block.split("\n")
+    opening = lines[0]
+    body = lines[1:]
+    if body and body[-1].strip() == "```":
+        body = body[:-1]
+    budget = max(1, limit - len(opening) - len("\n\n```"))
+    return [f"{opening}\n{piece}\n```" for piece in _pack("\n".join(body), budget, ["\n", " "])]
+
+def _blocks(text):
+    """Paragraphs and whole code blocks, in order"""
+    blocks = []
+    position = 0
+    for match in CODE_FENCE.finditer(text):
+        blocks.extend(p.strip("\n") for p in PARAGRAPH_BREAK.split(text[position:match.start()]) if p.strip())
+        blocks.append(("code", match.group(0).strip("\n")))
+        position = match.end()
+    blocks.extend(p.strip("\n") for p in PARAGRAPH_BREAK.split(text[position:]) if p.strip())
+    return blocks
+
+def split_message(text, limit=DISCORD_MESSAGE_LIMIT):
+    """Split text into parts of at most limit characters.
+
+    Parts break on paragraph, then line, then word boundaries. Code blocks are kept
+    whole when they fit; larger ones are split with the fence re-opened in each part.
+    """
+    if len(text) <= limit:
+        return [text]
+
+    parts = []
+    current = ""
+    for block in _blocks(text):
+        if isinstance(block, tuple):
+            block = block[1]
+            pieces = [block] if len(block) <= limit else _split_code_block(block, limit)
+        else:
+            pieces = _pack(block, limit, ["\n", " "])
+
+        for piece in pieces:
+            candidate = f"{current}\n\n{piece}" if current else piece
+            if len(candidate) <= limit:
+                current = candidate
+            else:
+                parts.append(current)
+                current = piece
+    if current:
+        parts.append(current)
+    return parts
+
+async def send_long_message(send, text, limit=DISCORD_MESSAGE_LIMIT):
+    """Send text as consecutive messages via send (e.g. interaction.followup.send or channel.send)"""
+    messages = []
+    for part in split_message(text, limit):
+        messages.append(await send(part))
+    return messages
+
+class PaginatedView(discord.ui.View):
+    """Previous/next buttons that flip one embed through pages of long text"""
+
+    def __init__(self, pages, title=None, color=0x0099ff, timeout=600):
+        super().__init__(timeout=timeout)
+        self.pages = pages
+        self.title = title
+        self.color = color
+        self.index = 0
+        self.message = None  # set by send_paginated so the buttons can be removed on timeout
+        self._update_buttons()
+
+    def current_embed(self):
+        embed = discord.Embed(title=self.title, description=self.pages[self.index], color=self.color)
+        embed.set_footer(text=f"Page {self.index + 1}/{len(self.pages)}")
+        return embed
+
+    def _update_buttons(self):
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = self.index >= len(self.pages) - 1
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.index = max(0, self.index - 1)
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.current_embed(), view=self)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.index = min(len(self.pages) - 1, self.index + 1)
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.current_embed(), view=self)
+
+    async def on_timeout(self):
+        # Take the buttons off so nobody clicks on a view that no longer answers
+        if self.message is None:
+            return
+        try:
+            await self.message.edit(embed=self.current_embed(), view=None)
+        except discord.HTTPException as e:
+            print(f"⚠️ Could not remove page buttons from message {self.message.id}: {e}")
+
+async def send_paginated(interaction, text, title=None):
+    """Send long text as a single embed with page buttons"""
+    pages = split_message(text, EMBED_DESCRIPTION_LIMIT)
+    if len(pages) == 1:
+        return await interaction.followup.send(embed=discord.Embed(title=title, description=pages[0], color=0x0099ff))
+    view = PaginatedView(pages, title=title)
+    view.message = await interaction.followup.send(embed=view.current_embed(), view=view)
+    return view.message
@@ -0,0 +1,190 @@
+import asyncio
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+from poll_tally import PollTally
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS polls (
+    message_id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    question TEXT NOT NULL,
+    options TEXT NOT NULL,
+    emojis TEXT NOT NULL,
+    creator_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    ends_at REAL NOT NULL,
+    mode TEXT NOT NULL DEFAULT 'reactions'
+);
+CREATE INDEX IF NOT EXISTS idx_polls_ends ON polls (ends_at);
+CREATE TABLE IF NOT EXISTS poll_votes (
+    message_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    option INTEGER NOT NULL,
+    PRIMARY KEY (message_id, user_id, option)
+);
+"""
+
+COLUMNS = "message_id, kind, question, options, emojis, creator_id, channel_id, created_at, ends_at, mode"
+
+def poll_ends_at(poll_data):
+    """Timestamp at which a poll closes"""
+    return poll_data['created_at'] + poll_data['duration_seconds']
+
+def _row_to_poll(row):
+    message_id, kind, question, options, emojis, creator_id, channel_id, created_at, ends_at, mode = row
+    return {
+        'kind': kind,
+        'question': question,
+        'options': json.loads(options),
+        'emojis': json.loads(emojis),
+        'creator': creator_id,
+        'channel': channel_id,
+        'message_id': message_id,
+        'created_at': created_at,
+        'duration_seconds': round(ends_at - created_at),
+        'mode': mode
+    }
+
+def _poll_to_row(poll_data):
+    return (
+        poll_data['message_id'],
+        poll_data['kind'],
+        poll_data['question'],
+        json.dumps(poll_data['options']),
+        json.dumps(poll_data['emojis']),
+        poll_data['creator'],
+        poll_data['channel'],
+        poll_data['created_at'],
+        poll_ends_at(poll_data),
+        poll_data.get('mode', 'reactions')
+    )
+
+class PollStore:
+    """Durable poll storage: SQLite (WAL) on disk, running polls in a dict keyed by message ID.
+
+    Votes change far more often than polls, so they are buffered and written in one
+    transaction every flush_interval seconds instead of one commit per reaction.
+    """
+
+    def __init__(self, path="polls.db", flush_interval=1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.polls = {}
+        self._pending_votes = []  # (added, message_id, user_id, option)
+        self._flush_task = None
+        self._db = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="poll-db")
+        self.votes_written = 0
+        self.flushes = 0
+
+    def __contains__(self, message_id):
+        return message_id in self.polls
+
+    def __len__(self):
+        return len(self.polls)
+
+    def get(self, message_id):
+        return self.polls.get(message_id)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _open_sync(self):
+        db = sqlite3.connect(self.path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(SCHEMA)
+        columns = {row[1] for row in db.execute("PRAGMA table_info(polls)")}
+        if 'mode' not in columns:
+            # Databases created before button polls existed
+            db.execute("ALTER TABLE polls ADD COLUMN mode TEXT NOT NULL DEFAULT 'reactions'")
+        db.commit()
+        self._db = db
+        polls = db.execute(f"SELECT {COLUMNS} FROM polls ORDER BY ends_at").fetchall()
+        votes = db.execute("SELECT message_id, user_id, option FROM poll_votes").fetchall()
+        return polls, votes
+
+    async def open(self):
+        """Open the database and load every running poll, with its votes, into memory"""
+        rows, vote_rows = await self._run(self._open_sync)
+        votes = {}
+        for message_id, user_id, option in vote_rows:
+            votes.setdefault(message_id, {}).setdefault(user_id, []).append(option)
+        for row in rows:
+            poll_data = _row_to_poll(row)
+            poll_data['tally'] = PollTally(poll_data['emojis'], votes.get(poll_data['message_id']))
+            self.polls[poll_data['message_id']] = poll_data
+        return len(rows)
+
+    def _execute_sync(self, sql, params):
+        self._db.execute(sql, params)
+        self._db.commit()
+
+    async def add(self, poll_data):
+        """Store a new poll (visible in memory immediately, persisted before returning)"""
+        if 'tally' not in poll_data:
+            poll_data['tally'] = PollTally(poll_data['emojis'])
+        self.polls[poll_data['message_id']] = poll_data
+        await self._run(
+            self._execute_sync,
+            f"INSERT OR REPLACE INTO polls ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            _poll_to_row(poll_data)
+        )
+
+    def _remove_sync(self, message_id):
+        self._db.execute("DELETE FROM polls WHERE message_id = ?", (message_id,))
+        self._db.execute("DELETE FROM poll_votes WHERE message_id = ?", (message_id,))
+        self._db.commit()
+
+    async def remove(self, message_id):
+        """Delete a poll and its votes, returning its data (or None if it was already gone)"""
+        poll_data = self.polls.pop(message_id, None)
+        if poll_data is not None:
+            self._pending_votes = [vote for vote in self._pending_votes if vote[1] != message_id]
+            await self._run(self._remove_sync, message_id)
+        return poll_data
+
+    def record_vote(self, message_id, user_id, option, added):
+        """Queue a vote change for the next batched write"""
+        self._pending_votes.append((added, message_id, user_id, option))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    def _write_votes_sync(self, votes):
+        with self._db:
+            for added, message_id, user_id, option in votes:
+                if added:
+                    self._db.execute(
+                        "INSERT OR IGNORE INTO poll_votes (message_id, user_id, option) VALUES (?, ?, ?)",
+                        (message_id, user_id, option)
+                    )
+                else:
+                    self._db.execute(
+                        "DELETE FROM poll_votes WHERE message_id = ? AND user_id = ? AND option = ?",
+                        (message_id, user_id, option)
+                    )
+
+    async def flush(self):
+        """Write buffered vote changes in a single transaction"""
+        votes, self._pending_votes = self._pending_votes, []
+        if votes and self._db is not None:
+            await self._run(self._write_votes_sync, votes)
+            self.votes_written += len(votes)
+            self.flushes += 1
+
+    async def close(self):
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        if self._db is not None:
+            await self.flush()
+            await self._run(self._db.close)
+            self._db = None
+        self._executor.shutdown(wait=False)
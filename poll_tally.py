@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+class PollTally:
+    """Live vote counts for one poll: per-option counters plus the set of options each user picked.
+
+    Fed from reaction add/remove events, so results never need the message to be refetched.
+    A user counts once per option however many times an event repeats.
+    """
+
+    def __init__(self, emojis, votes=None):
+        self.emojis = list(emojis)
+        self._index = {emoji: i for i, emoji in enumerate(self.emojis)}
+        self.counts = [0] * len(self.emojis)
+        self.votes = {}  # user_id -> set of option indexes
+        for user_id, indexes in (votes or {}).items():
+            for index in indexes:
+                self.add(user_id, index)
+
+    def option_index(self, emoji):
+        """Index of the option an emoji stands for, or None"""
+        return self._index.get(emoji)
+
+    def add(self, user_id, index):
+        """Record a vote; False if the user had already picked this option"""
+        picked = self.votes.setdefault(user_id, set())
+        if index in picked:
+            return False
+        picked.add(index)
+        self.counts[index] += 1
+        return True
+
+    def remove(self, user_id, index):
+        """Withdraw a vote; False if the user hadn't picked this option"""
+        picked = self.votes.get(user_id)
+        if not picked or index not in picked:
+            return False
+        picked.discard(index)
+        if not picked:
+            del self.votes[user_id]
+        self.counts[index] -= 1
+        return True
+
+    @property
+    def total_votes(self):
+        return sum(self.counts)
+
+    @property
+    def voters(self):
+        return len(self.votes)
+
+    def results(self, options):
+        """(option, votes) pairs, most votes first (ties keep option order)"""
+        return sorted(zip(options, self.counts), key=lambda item: item[1], reverse=True)
+
+class ThrottledRefresher:
+    """Runs refresh(key) at most once per interval for each key.
+
+    Requests made while a refresh is already waiting are folded into it, so a burst
+    of votes costs one message edit per interval instead of one per vote.
+    """
+
+    def __init__(self, refresh, interval=2.0):
+        self._refresh = refresh
+        self.interval = interval
+        self._pending = {}  # key -> waiting task
+        self._last = {}  # key -> monotonic time of the last refresh
+        self.requested = 0
+        self.refreshed = 0
+
+    def request(self, key):
+        self.requested += 1
+        if key in self._pending:
+            return
+        delay = max(0.0, self._last.get(key, 0.0) + self.interval - time.monotonic())
+        self._pending[key] = asyncio.create_task(self._run(key, delay))
+
+    async def _run(self, key, delay):
+        await asyncio.sleep(delay)
+        # Leave the pending slot before refreshing so changes made during the edit get their own turn
+        self._pending.pop(key, None)
+        self._last[key] = time.monotonic()
+        try:
+            await self._refresh(key)
+            self.refreshed += 1
+        except Exception as e:
+            print(f"⚠️ Live update for {key} failed: {e}")
+
+    def forget(self, key):
+        """Drop any waiting refresh for key (e.g. when its poll ends)"""
+        task = self._pending.pop(key, None)
+        if task is not None:
+            task.cancel()
+        self._last.pop(key, None)
+
+    async def stop(self):
+        tasks = list(self._pending.values())
+        self._pending.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,46 @@
+import asyncio
+
+import discord
+
+BUTTON_LABEL_LIMIT = 80
+REGISTRATION_TIMEOUT = 2.0  # seconds a click waits for a just-sent poll to be stored
+
+class PollView(discord.ui.View):
+    """Persistent vote buttons for a poll, one per option.
+
+    The poll is votable as soon as the message is sent (no reactions to add), and
+    because the view never times out and every button has a fixed custom_id, it can
+    be re-registered for the poll's message after a restart with client.add_view.
+    on_vote(interaction, index) is called for every click, but only once mark_ready()
+    says the poll is stored: the buttons are live as soon as the message is sent,
+    before its message ID is known.
+    """
+
+    def __init__(self, poll_data, on_vote):
+        super().__init__(timeout=None)
+        self.on_vote = on_vote
+        self.ready = asyncio.Event()
+        for index, (emoji, option) in enumerate(zip(poll_data['emojis'], poll_data['options'])):
+            button = discord.ui.Button(
+                label=option[:BUTTON_LABEL_LIMIT],
+                emoji=emoji,
+                style=discord.ButtonStyle.secondary,
+                custom_id=f"poll:{index}",
+                row=index // 5
+            )
+            button.callback = self._make_callback(index)
+            self.add_item(button)
+
+    def mark_ready(self):
+        """Start passing clicks on to on_vote (the poll is now registered)"""
+        self.ready.set()
+
+    def _make_callback(self, index):
+        async def callback(interaction: discord.Interaction):
+            if not self.ready.is_set():
+                try:
+                    await asyncio.wait_for(self.ready.wait(), REGISTRATION_TIMEOUT)
+                except asyncio.TimeoutError:
+                    pass  # on_vote reports the poll as unavailable
+            await self.on_vote(interaction, index)
+        return callback
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 def build_prompt(question, knowledge):
     return f"""
 You are an internal AI assistant for a software company.
@@ -13,3 +15,68 @@ QUESTION:
 
 Answer clearly and concisely.
 """
+
+# Static part of the /ask prompt. It never changes per question, so it is sent as
+# Gemini's system instruction and stays byte-identical between requests. It is still sent
+# with every request; at its current size it is below Gemini's minimum for prefix caching.
+SYSTEM_INSTRUCTION = """You are CreoBot, a helpful AI assistant for CreoWis Technologies. You can answer any question the user asks.
+
+Instructions:
+- Answer any question the user asks to the best of your ability
+- If the question is about CreoWis Technologies, use the company knowledge provided
+- For general questions, use your knowledge to provide helpful answers
+- Be professional, friendly, and helpful
+- Keep responses concise but informative
+- Respond in the language named after the question, and keep to it for the entire response
+- If you don't know something, say so honestly"""
+
+KNOWLEDGE_HEADING = "Company Knowledge (use when relevant):\n"
+
+@lru_cache(maxsize=128)
+def language_instruction(lang_code, lang_name):
+    """The one line of the prompt that depends on the question's language"""
+    if lang_code == 'en':
+        return "Respond in English."
+    return (f"The user asked their question in {lang_name} ({lang_code}). "
+            f"You MUST respond in {lang_name} ({lang_code}) - the same language as the user's question.")
+
+def build_system_instruction(knowledge=None):
+    """Instructions, plus the knowledge base when it is sent whole"""
+    if not knowledge:
+        return SYSTEM_INSTRUCTION
+    return f"{SYSTEM_INSTRUCTION}\n\n{KNOWLEDGE_HEADING}{knowledge}"
+
+def build_question_prompt(question, lang_code, lang_name, knowledge=None):
+    """Per-question part: retrieved knowledge (if any), the question and the reply language"""
+    knowledge_part = f"{KNOWLEDGE_HEADING}{knowledge}\n\n" if knowledge else ""
+    return f"{knowledge_part}User Question: {question}\n\n{language_instruction(lang_code, lang_name)}"
+
+class PromptBuilder:
+    """Splits the /ask prompt into a prefix that only changes with the knowledge base and a small per-question suffix.
+
+    When the whole knowledge base fits the retrieval budget it is part of the prefix, built once
+    per knowledge base version; otherwise the prefix is just the instructions and the retrieved
+    chunks travel with the question.
+    """
+
+    def __init__(self, retriever):
+        self.retriever = retriever
+        self._version = None
+        self._prefix = None
+        self._whole_knowledge = False
+        self.prefix_builds = 0
+
+    def system_instruction(self):
+        store = self.retriever.store
+        if self._version != store.version:
+            self._whole_knowledge = self.retriever.sends_whole_knowledge()
+            self._prefix = build_system_instruction(store.text if self._whole_knowledge else None)
+            self._version = store.version
+            self.prefix_builds += 1
+        return self._prefix
+
+    def build(self, question, lang_code, lang_name):
+        """(system instruction, question prompt) for one /ask request"""
+        prefix = self.system_instruction()
+        knowledge = None if self._whole_knowledge else self.retriever.retrieve(question)
+        return prefix, build_question_prompt(question, lang_code, lang_name, knowledge)
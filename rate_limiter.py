@@ -0,0 +1,93 @@
+import time
+from collections import OrderedDict
+
+def parse_rate(spec):
+    """'5/60' → (5, 60.0): up to 5 requests per 60 seconds. Empty or '0' means unlimited (None)."""
+    spec = (spec or "").strip()
+    if not spec or spec == "0":
+        return None
+    count, _, seconds = spec.partition("/")
+    count, seconds = int(count), float(seconds or 1)
+    if count <= 0 or seconds <= 0:
+        raise ValueError(f"invalid rate limit {spec!r}, expected e.g. '5/60'")
+    return count, seconds
+
+class RateLimiter:
+    """In-process token buckets, one per (rule, key) such as ('ask_user', user_id).
+
+    Each rule allows `count` requests per `seconds`, with bursts of up to `count`. A check
+    touches a fixed number of buckets, so it is O(1). Buckets live in an LRU-ordered dict;
+    one left idle long enough to have refilled completely is indistinguishable from a new
+    one, so it is dropped, and max_buckets caps memory even under a flood of new keys.
+    """
+
+    def __init__(self, rules, max_buckets=10000, clock=time.monotonic):
+        # rule name -> (capacity, tokens per second, seconds to refill from empty)
+        self.rules = {}
+        for name, rate in rules.items():
+            if rate:
+                count, seconds = rate
+                self.rules[name] = (count, count / seconds, seconds)
+        self.max_buckets = max_buckets
+        self.clock = clock
+        self._buckets = OrderedDict()  # (rule, key) -> [tokens, updated]
+        self.allowed = 0
+        self.rejected = {}  # rule name -> rejections it caused
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def _tokens(self, rule, key, now):
+        """Current token count of a bucket, refilled up to now"""
+        capacity, rate, _ = self.rules[rule]
+        bucket = self._buckets.get((rule, key))
+        if bucket is None:
+            return capacity
+        tokens, updated = bucket
+        return min(capacity, tokens + (now - updated) * rate)
+
+    def _evict_idle(self, now):
+        while self._buckets:
+            (rule, _), (_, updated) = next(iter(self._buckets.items()))
+            if now - updated < self.rules[rule][2]:
+                break
+            self._buckets.popitem(last=False)
+            self.evicted += 1
+        while len(self._buckets) > self.max_buckets:
+            self._buckets.popitem(last=False)
+            self.evicted += 1
+
+    def acquire(self, *checks):
+        """Take one token from every (rule, key) bucket, all or nothing.
+
+        Returns 0.0 when the request may go ahead, otherwise the seconds to wait before
+        retrying. Checks for unconfigured rules or a None key (e.g. no guild in DMs) are skipped.
+        """
+        now = self.clock()
+        self._evict_idle(now)
+        checks = [(rule, key) for rule, key in checks if rule in self.rules and key is not None]
+
+        retry_after = 0.0
+        blocking_rule = None
+        levels = []
+        for rule, key in checks:
+            tokens = self._tokens(rule, key, now)
+            levels.append(tokens)
+            if tokens < 1:
+                wait = (1 - tokens) / self.rules[rule][1]
+                if wait > retry_after:
+                    retry_after, blocking_rule = wait, rule
+        if blocking_rule is not None:
+            self.rejected[blocking_rule] = self.rejected.get(blocking_rule, 0) + 1
+            return retry_after
+
+        for (rule, key), tokens in zip(checks, levels):
+            self._buckets[(rule, key)] = [tokens - 1, now]
+            self._buckets.move_to_end((rule, key))
+        self._evict_idle(now)
+        self.allowed += 1
+        return 0.0
+
+    def total_rejected(self):
+        return sum(self.rejected.values())
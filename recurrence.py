@@ -0,0 +1,206 @@
+import bisect
+import re
+from datetime import datetime, timedelta, UTC
+from functools import lru_cache
+
+from time_parser import UNIT_SECONDS, parse_duration, parse_timezone
+
+# Recurrence rules are stored in a canonical form:
+#   "every <seconds>"                 fixed interval, anchored on the previous due time
+#   "cron <min> <hour> <dom> <mon> <dow> [zone]"  standard 5-field cron expression, evaluated
+#                                     in the zone (as set with /timezone when created), else UTC
+
+MIN_INTERVAL = 60
+
+DAY_NAMES = {'sun': 0, 'mon': 1, 'tue': 2, 'wed': 3, 'thu': 4, 'fri': 5, 'sat': 6}
+DAY_GROUPS = {'day': '*', 'daily': '*', 'weekday': '1-5', 'weekdays': '1-5', 'weekend': '0,6', 'weekends': '0,6'}
+
+HOURLY_PATTERN = re.compile(r'^hourly$')
+AT_TIME_PATTERN = re.compile(r'^(?:every\s+)?([a-z,\s]+?)\s+(?:at\s+)?(\d{1,2}):(\d{2})$')
+
+# Any fixed starting point works for checking that an expression can ever fire
+VALIDATION_ANCHOR = datetime(2000, 1, 1, tzinfo=UTC)
+
+# (low, high) for minute, hour, day of month, month, day of week
+FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+def _parse_field(text, low, high, names=None):
+    def value(token):
+        token = token.strip()
+        if names and token[:3] in names:
+            return names[token[:3]]
+        return int(token)
+
+    values = set()
+    for part in text.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"bad step in {text!r}")
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            first, last = part.split('-', 1)
+            start, end = value(first), value(last)
+        else:
+            start = value(part)
+            end = high if step > 1 else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"{text!r} is out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return values
+
+class CronRule:
+    """A compiled 5-field cron expression that finds the next matching minute without scanning minute by minute.
+
+    An optional sixth field names the timezone the fields are read in (UTC if absent).
+    """
+
+    __slots__ = ('minutes', 'hours', 'days', 'months', 'weekdays', 'any_day', 'any_weekday', 'zone')
+
+    def __init__(self, expression):
+        fields = expression.split()
+        self.zone = None
+        if len(fields) == 6:
+            self.zone = parse_timezone(fields.pop())
+            if self.zone is None:
+                raise ValueError("unknown timezone in cron expression")
+        if len(fields) != 5:
+            raise ValueError("cron expressions need 5 fields: minute hour day month weekday")
+        parsed = [_parse_field(field, low, high, DAY_NAMES if i == 4 else None)
+                  for i, (field, (low, high)) in enumerate(zip(fields, FIELD_RANGES))]
+        if 7 in parsed[4]:
+            parsed[4] = (parsed[4] - {7}) | {0}  # 7 is Sunday too
+        self.minutes, self.hours = sorted(parsed[0]), sorted(parsed[1])
+        self.days, self.months, self.weekdays = parsed[2], sorted(parsed[3]), parsed[4]
+        self.any_day = fields[2] == '*'
+        self.any_weekday = fields[4] == '*'
+
+    def _day_matches(self, moment):
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok  # cron semantics when both are restricted
+
+    def next_after(self, after):
+        """First matching minute strictly after the given datetime"""
+        if self.zone is None:
+            return self._next_wall_time(after)
+        # Match on the local wall clock, then map back; a wall time repeated when clocks go
+        # back can land before `after`, so keep stepping until it is really later
+        local = after.astimezone(self.zone).replace(tzinfo=None)
+        while True:
+            local = self._next_wall_time(local)
+            moment = local.replace(tzinfo=self.zone).astimezone(after.tzinfo)
+            if moment > after:
+                return moment
+
+    def _next_wall_time(self, after):
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        for _ in range(5000):
+            if moment.month not in self.months:
+                i = bisect.bisect_right(self.months, moment.month)
+                year = moment.year if i < len(self.months) else moment.year + 1
+                month = self.months[i] if i < len(self.months) else self.months[0]
+                moment = moment.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(moment):
+                moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if moment.hour not in self.hours:
+                i = bisect.bisect_right(self.hours, moment.hour)
+                if i == len(self.hours):
+                    moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+                    continue
+                moment = moment.replace(hour=self.hours[i], minute=0)
+            i = bisect.bisect_left(self.minutes, moment.minute)
+            if i == len(self.minutes):
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            return moment.replace(minute=self.minutes[i])
+        raise ValueError("cron expression never matches")
+
+@lru_cache(maxsize=1024)
+def compile_rule(rule):
+    """Interval in seconds for "every" rules, CronRule for "cron" rules"""
+    kind, _, spec = rule.partition(' ')
+    if kind == 'every':
+        return int(spec)
+    if kind == 'cron':
+        return CronRule(spec)
+    raise ValueError(f"unknown recurrence rule {rule!r}")
+
+def next_fire(rule, previous, now=None):
+    """Next occurrence after now (default: previous), stepping on from the previous due time"""
+    now = previous if now is None else max(now, previous)
+    compiled = compile_rule(rule)
+    if isinstance(compiled, int):
+        skipped = int((now - previous).total_seconds() // compiled)
+        return previous + timedelta(seconds=compiled * (skipped + 1))
+    return compiled.next_after(now)
+
+def parse_recurrence(text, zone_name=None):
+    """Turn user input into a canonical rule, or None if it isn't a valid schedule.
+
+    Accepts "every 30m", "every 1h30m", "every day", "hourly", "daily 09:30",
+    "weekdays at 9:30", "mon,wed 18:00", "cron 30 9 * * 1-5" or a bare 5-field cron expression.
+    Clock-based schedules are read in zone_name (a /timezone name) when given.
+    """
+    text = ' '.join(text.lower().split())
+
+    if HOURLY_PATTERN.match(text):
+        return "every 3600"
+
+    if text.startswith('every '):
+        interval = text[6:]
+        seconds = UNIT_SECONDS.get(interval) or parse_duration(interval)
+        if seconds is not None:
+            return f"every {seconds}" if seconds >= MIN_INTERVAL else None
+
+    match = AT_TIME_PATTERN.match(text)
+    if match:
+        days, hour, minute = match.group(1).strip(), int(match.group(2)), int(match.group(3))
+        if days in DAY_GROUPS:
+            weekdays = DAY_GROUPS[days]
+        else:
+            names = [name.strip()[:3] for name in days.split(',')]
+            if not all(name in DAY_NAMES for name in names):
+                return None
+            weekdays = ','.join(str(DAY_NAMES[name]) for name in names)
+        text = f"cron {minute} {hour} * * {weekdays}"
+
+    expression = text[5:] if text.startswith('cron ') else text
+    if len(expression.split()) != 5:
+        return None
+    if zone_name and parse_timezone(zone_name) is not UTC:
+        expression = f"{expression} {zone_name}"
+    try:
+        rule = f"cron {' '.join(expression.split())}"
+        compile_rule(rule).next_after(VALIDATION_ANCHOR)  # rejects expressions that can never fire
+        return rule
+    except ValueError:
+        return None
+
+def describe_recurrence(rule):
+    """Short human-readable form of a canonical rule"""
+    compiled = compile_rule(rule)
+    if isinstance(compiled, int):
+        for unit, seconds in (('w', 604800), ('d', 86400), ('h', 3600), ('m', 60)):
+            if compiled % seconds == 0:
+                return f"every {compiled // seconds}{unit}"
+        return f"every {compiled}s"
+    minute, hour, day, month, weekday, *zone = rule.split()[1:]
+    zone_name = zone[0] if zone else "UTC"
+    if minute.isdigit() and hour.isdigit() and day == '*' and month == '*':
+        at = f"{int(hour):02d}:{int(minute):02d} {zone_name}"
+        if weekday == '*':
+            return f"daily at {at}"
+        if weekday == '1-5':
+            return f"weekdays at {at}"
+        names = {str(number): name.title() for name, number in DAY_NAMES.items()}
+        if all(part in names for part in weekday.split(',')):
+            return f"{', '.join(names[part] for part in weekday.split(','))} at {at}"
+    return f"cron `{' '.join([minute, hour, day, month, weekday])}` ({zone_name})"
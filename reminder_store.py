@@ -0,0 +1,223 @@
+import asyncio
+import bisect
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, UTC
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reminders (
+    id TEXT PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    creator_id INTEGER,
+    channel_id INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    due_at REAL NOT NULL,
+    is_group_reminder INTEGER NOT NULL DEFAULT 0,
+    recurrence TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reminders_due ON reminders (due_at);
+CREATE INDEX IF NOT EXISTS idx_reminders_user_due ON reminders (user_id, due_at);
+CREATE INDEX IF NOT EXISTS idx_reminders_creator_due ON reminders (creator_id, due_at);
+CREATE TABLE IF NOT EXISTS user_timezones (
+    user_id INTEGER PRIMARY KEY,
+    timezone TEXT NOT NULL
+);
+"""
+
+COLUMNS = "id, user_id, creator_id, channel_id, message, created_at, due_at, is_group_reminder, recurrence"
+
+def _row_to_reminder(row):
+    reminder_id, user_id, creator_id, channel_id, message, created_at, due_at, is_group, recurrence = row
+    data = {
+        'user_id': user_id,
+        'channel_id': channel_id,
+        'message': message,
+        'created_at': datetime.fromtimestamp(created_at, UTC),
+        'due_at': datetime.fromtimestamp(due_at, UTC),
+        'duration_seconds': round(due_at - created_at),
+        'is_group_reminder': bool(is_group)
+    }
+    if creator_id is not None:
+        data['creator_id'] = creator_id
+    if recurrence:
+        data['recurrence'] = recurrence
+    return reminder_id, data
+
+def _reminder_to_row(reminder_id, data):
+    return (
+        reminder_id,
+        data['user_id'],
+        data.get('creator_id'),
+        data['channel_id'],
+        data['message'],
+        data['created_at'].timestamp(),
+        due_at(data).timestamp(),
+        int(data.get('is_group_reminder', False)),
+        data.get('recurrence')
+    )
+
+def due_at(data):
+    """Absolute due time of a reminder"""
+    if 'due_at' not in data:
+        data['due_at'] = data['created_at'] + timedelta(seconds=data['duration_seconds'])
+    return data['due_at']
+
+class _DueIndex:
+    """Per-owner lists of (due timestamp, reminder ID), kept sorted for paging"""
+
+    def __init__(self):
+        self._lists = defaultdict(list)
+
+    def add(self, owner, due, reminder_id):
+        bisect.insort(self._lists[owner], (due, reminder_id))
+
+    def remove(self, owner, due, reminder_id):
+        items = self._lists.get(owner)
+        if not items:
+            return
+        i = bisect.bisect_left(items, (due, reminder_id))
+        if i < len(items) and items[i] == (due, reminder_id):
+            del items[i]
+        if not items:
+            del self._lists[owner]
+
+    def count(self, owner):
+        return len(self._lists.get(owner, ()))
+
+    def page(self, owner, offset=0, limit=None):
+        items = self._lists.get(owner, ())
+        end = None if limit is None else offset + limit
+        return [reminder_id for _, reminder_id in items[offset:end]]
+
+class ReminderStore:
+    """Durable reminder storage: SQLite (WAL) on disk, write-through dict in memory.
+
+    All database work runs on a single worker thread so the event loop never blocks on disk I/O.
+    """
+
+    def __init__(self, path="reminders.db"):
+        self.path = path
+        self.reminders = {}
+        self.timezones = {}
+        self._by_user = _DueIndex()
+        self._by_creator = _DueIndex()
+        self._db = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reminder-db")
+
+    def __contains__(self, reminder_id):
+        return reminder_id in self.reminders
+
+    def __len__(self):
+        return len(self.reminders)
+
+    def get(self, reminder_id):
+        return self.reminders.get(reminder_id)
+
+    def _index(self, reminder_id, data):
+        self.reminders[reminder_id] = data
+        due = due_at(data).timestamp()
+        self._by_user.add(data['user_id'], due, reminder_id)
+        if data.get('is_group_reminder') and data.get('creator_id') is not None:
+            self._by_creator.add(data['creator_id'], due, reminder_id)
+
+    def _unindex(self, reminder_id):
+        data = self.reminders.pop(reminder_id, None)
+        if data is not None:
+            due = due_at(data).timestamp()
+            self._by_user.remove(data['user_id'], due, reminder_id)
+            if data.get('is_group_reminder') and data.get('creator_id') is not None:
+                self._by_creator.remove(data['creator_id'], due, reminder_id)
+        return data
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _open_sync(self):
+        db = sqlite3.connect(self.path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(SCHEMA)
+        columns = {row[1] for row in db.execute("PRAGMA table_info(reminders)")}
+        if 'recurrence' not in columns:
+            # Databases created before recurring reminders existed
+            db.execute("ALTER TABLE reminders ADD COLUMN recurrence TEXT")
+        db.commit()
+        self._db = db
+        self.timezones = dict(db.execute("SELECT user_id, timezone FROM user_timezones").fetchall())
+        return db.execute(f"SELECT {COLUMNS} FROM reminders ORDER BY due_at").fetchall()
+
+    async def open(self):
+        """Open the database and load every pending reminder (and users' timezones) into memory"""
+        rows = await self._run(self._open_sync)
+        for row in rows:
+            self._index(*_row_to_reminder(row))
+        return len(rows)
+
+    def _execute_sync(self, sql, params):
+        self._db.execute(sql, params)
+        self._db.commit()
+
+    def _query_ids_sync(self, sql, params):
+        return [row[0] for row in self._db.execute(sql, params).fetchall()]
+
+    async def add(self, reminder_id, data):
+        """Store a new reminder (visible in memory immediately, persisted before returning)"""
+        self._unindex(reminder_id)
+        self._index(reminder_id, data)
+        await self._run(
+            self._execute_sync,
+            f"INSERT OR REPLACE INTO reminders ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            _reminder_to_row(reminder_id, data)
+        )
+
+    async def remove(self, reminder_id):
+        """Delete a reminder, returning its data (or None if it was already gone)"""
+        data = self._unindex(reminder_id)
+        if data is not None:
+            await self._run(self._execute_sync, "DELETE FROM reminders WHERE id = ?", (reminder_id,))
+        return data
+
+    def count_for_user(self, user_id):
+        return self._by_user.count(user_id)
+
+    def list_for_user(self, user_id, offset=0, limit=None):
+        """Reminders that will be delivered to user_id, soonest first (one page of them)"""
+        return [(reminder_id, self.reminders[reminder_id])
+                for reminder_id in self._by_user.page(user_id, offset, limit)]
+
+    def count_by_creator(self, creator_id):
+        return self._by_creator.count(creator_id)
+
+    def list_by_creator(self, creator_id, offset=0, limit=None):
+        """Group reminders created by creator_id, soonest first (one page of them)"""
+        return [(reminder_id, self.reminders[reminder_id])
+                for reminder_id in self._by_creator.page(creator_id, offset, limit)]
+
+    def get_timezone(self, user_id):
+        """The timezone name a user has chosen, or None"""
+        return self.timezones.get(user_id)
+
+    async def set_timezone(self, user_id, name):
+        self.timezones[user_id] = name
+        await self._run(
+            self._execute_sync,
+            "INSERT OR REPLACE INTO user_timezones (user_id, timezone) VALUES (?, ?)",
+            (user_id, name)
+        )
+
+    async def _lookup(self, sql, params):
+        ids = await self._run(self._query_ids_sync, sql, params)
+        return [(reminder_id, self.reminders[reminder_id]) for reminder_id in ids if reminder_id in self.reminders]
+
+    async def due_before(self, when):
+        """Reminders due at or before the given datetime, soonest first"""
+        return await self._lookup("SELECT id FROM reminders WHERE due_at <= ? ORDER BY due_at", (when.timestamp(),))
+
+    async def close(self):
+        if self._db is not None:
+            await self._run(self._db.close)
+            self._db = None
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,144 @@
+import math
+import re
+from collections import defaultdict
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# Very common English words carry no signal for ranking
+STOPWORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'do', 'does', 'for', 'from',
+    'how', 'i', 'in', 'is', 'it', 'of', 'on', 'or', 'the', 'to', 'what', 'when',
+    'where', 'which', 'who', 'why', 'with', 'we', 'you', 'our', 'your', 'can'
+])
+
+CHUNK_SEPARATOR = "\n\n--------------------------------------------------\n\n"
+
+def tokenize(text):
+    """Lowercase word tokens without stopwords"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+def estimate_tokens(text):
+    """Rough Gemini token estimate (~4 characters per token)"""
+    return (len(text) + 3) // 4
+
+def chunk_sections(sections, max_chars=1200):
+    """Split knowledge sections into chunks of at most max_chars, breaking on blank lines or lines"""
+    chunks = []
+    for section in sections:
+        if len(section) <= max_chars:
+            chunks.append(section)
+            continue
+
+        current = ""
+        for paragraph in re.split(r'\n\s*\n', section):
+            pieces = [paragraph] if len(paragraph) <= max_chars else paragraph.split("\n")
+            for piece in pieces:
+                candidate = f"{current}\n{piece}" if current else piece
+                if len(candidate) <= max_chars:
+                    current = candidate
+                    continue
+                if current:
+                    chunks.append(current.strip())
+                # A single line longer than max_chars is hard-split
+                while len(piece) > max_chars:
+                    chunks.append(piece[:max_chars])
+                    piece = piece[max_chars:]
+                current = piece
+        if current.strip():
+            chunks.append(current.strip())
+    return chunks
+
+class KnowledgeIndex:
+    """BM25 inverted index over knowledge base chunks"""
+
+    def __init__(self, chunks, k1=1.5, b=0.75):
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        self.chunk_tokens = [estimate_tokens(chunk) for chunk in chunks]
+        self.postings = defaultdict(list)  # term -> [(chunk index, term frequency)]
+        self.lengths = []
+
+        for chunk_id, chunk in enumerate(chunks):
+            terms = tokenize(chunk)
+            self.lengths.append(len(terms))
+            counts = defaultdict(int)
+            for term in terms:
+                counts[term] += 1
+            for term, tf in counts.items():
+                self.postings[term].append((chunk_id, tf))
+
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+        total = len(chunks)
+        self.idf = {
+            term: math.log(1 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+            for term, posting in self.postings.items()
+        }
+
+    def search(self, query, top_k=5):
+        """Return up to top_k (score, chunk index) pairs, best first"""
+        scores = defaultdict(float)
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = self.idf[term]
+            for chunk_id, tf in posting:
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[chunk_id] / self.avg_length)
+                scores[chunk_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return [(score, chunk_id) for chunk_id, score in ranked[:top_k]]
+
+    def select(self, query, top_k=4, token_budget=1500):
+        """Pick the best chunks that fit in the token budget, returned in document order"""
+        hits = [chunk_id for _, chunk_id in self.search(query, top_k)]
+        if not hits:
+            # Nothing matched (e.g. question in another language): fall back to the leading chunks
+            hits = range(len(self.chunks))
+
+        selected = []
+        used = 0
+        for chunk_id in hits:
+            cost = self.chunk_tokens[chunk_id]
+            if used + cost > token_budget:
+                continue
+            selected.append(chunk_id)
+            used += cost
+            if len(selected) >= top_k:
+                break
+        return [self.chunks[chunk_id] for chunk_id in sorted(selected)]
+
+class Retriever:
+    """Retrieval stage between the knowledge store and prompt building"""
+
+    def __init__(self, store, top_k=4, token_budget=1500, chunk_chars=1200):
+        self.store = store
+        self.top_k = top_k
+        self.token_budget = token_budget
+        self.chunk_chars = chunk_chars
+        self.index = None
+        self.version = None
+        self._whole = False
+        self._whole_version = None
+
+    def _current_index(self):
+        """Rebuild the index only when the knowledge base version changes"""
+        if self.index is None or self.version != self.store.version:
+            self.index = KnowledgeIndex(chunk_sections(self.store.sections, self.chunk_chars))
+            self.version = self.store.version
+        return self.index
+
+    def sends_whole_knowledge(self):
+        """Small knowledge bases are sent whole; retrieval only pays off once they outgrow the budget"""
+        if self._whole_version != self.store.version:
+            self._whole = estimate_tokens(self.store.text) <= self.token_budget
+            self._whole_version = self.store.version
+        return self._whole
+
+    def retrieve(self, question):
+        """Return the knowledge text to put in the prompt for this question"""
+        if self.sends_whole_knowledge():
+            return self.store.text
+        chunks = self._current_index().select(question, self.top_k, self.token_budget)
+        return CHUNK_SEPARATOR.join(chunks)
@@ -0,0 +1,151 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+class _Entry:
+    __slots__ = ('due', 'key', 'callback', 'args', 'cancelled')
+
+    def __init__(self, due, key, callback, args):
+        self.due = due
+        self.key = key
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+class TimerScheduler:
+    """One task that fires timed callbacks from a min-heap of deadlines.
+
+    Deadlines are wall-clock timestamps (time.time()). Inserting is O(log n);
+    cancelling marks the entry and leaves it to be skipped (or compacted away)
+    later. Due callbacks are started as tasks in batches so a slow delivery
+    never delays the next deadline.
+    """
+
+    def __init__(self, batch_size=100):
+        self.batch_size = batch_size
+        self._heap = []  # (due, sequence, entry)
+        self._entries = {}  # key -> live entry
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._running = set()
+        self._cancelled_in_heap = 0
+        self.fired = 0
+        self.cancelled = 0
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def tombstones(self):
+        """Cancelled entries still waiting in the heap to be skipped or compacted"""
+        return self._cancelled_in_heap
+
+    @property
+    def running(self):
+        """Callbacks that have fired and are still executing"""
+        return len(self._running)
+
+    def next_due(self):
+        return self._heap[0][0] if self._heap else None
+
+    def schedule(self, key, due, callback, *args):
+        """Run callback(*args) at timestamp due; replaces any entry already scheduled under key"""
+        self.cancel(key)
+        entry = _Entry(due, key, callback, args)
+        self._entries[key] = entry
+        earliest = self.next_due()
+        heapq.heappush(self._heap, (due, next(self._sequence), entry))
+        if earliest is None or due < earliest:
+            # New earliest deadline: wake the loop so it can shorten its sleep
+            self._wakeup.set()
+        return entry
+
+    def cancel(self, key):
+        """Cancel the entry for key. Returns True if something was cancelled."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry.cancelled = True
+        entry.args = ()  # release references straight away
+        self.cancelled += 1
+        self._cancelled_in_heap += 1
+        if self._cancelled_in_heap > 64 and self._cancelled_in_heap > len(self._heap) // 2:
+            self._compact()
+        return True
+
+    def _compact(self):
+        """Drop cancelled entries from the heap"""
+        self._heap = [item for item in self._heap if not item[2].cancelled]
+        heapq.heapify(self._heap)
+        self._cancelled_in_heap = 0
+
+    def _pop_due(self, now):
+        batch = []
+        while self._heap and len(batch) < self.batch_size:
+            due, _, entry = self._heap[0]
+            if entry.cancelled:
+                heapq.heappop(self._heap)
+                self._cancelled_in_heap -= 1
+                continue
+            if due > now:
+                break
+            heapq.heappop(self._heap)
+            del self._entries[entry.key]
+            batch.append(entry)
+        return batch
+
+    def _dispatch(self, entry, now):
+        lateness = max(0.0, now - entry.due)
+        self.max_lateness = max(self.max_lateness, lateness)
+        self.total_lateness += lateness
+        self.fired += 1
+        task = asyncio.create_task(entry.callback(*entry.args))
+        self._running.add(task)
+        task.add_done_callback(self._finished)
+
+    def _finished(self, task):
+        self._running.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"❌ Scheduled job failed: {task.exception()}")
+
+    async def run(self):
+        while True:
+            now = time.time()
+            batch = self._pop_due(now)
+            for entry in batch:
+                self._dispatch(entry, now)
+            if len(batch) == self.batch_size:
+                await asyncio.sleep(0)  # more may be due; let the dispatched jobs start first
+                continue
+
+            self._wakeup.clear()
+            next_due = self.next_due()
+            timeout = None if next_due is None else max(0.0, next_due - time.time())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def average_lateness(self):
+        return (self.total_lateness / self.fired) if self.fired else 0.0
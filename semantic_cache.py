@@ -0,0 +1,129 @@
+import time
+import zlib
+
+import numpy as np
+
+from answer_cache import normalize_question
+
+class QuestionVectorizer:
+    """Hashed character n-gram + word vectors (local, no network)"""
+
+    def __init__(self, dim=256, ngram=3):
+        self.dim = dim
+        self.ngram = ngram
+
+    def features(self, text):
+        text = normalize_question(text)
+        padded = f" {text} "
+        grams = [padded[i:i + self.ngram] for i in range(len(padded) - self.ngram + 1)]
+        return grams + [f"w:{word}" for word in text.split()]
+
+    def vectorize(self, text):
+        """Return an L2-normalized float32 vector for the text"""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature in self.features(text):
+            h = zlib.crc32(feature.encode("utf-8"))
+            # Signed hashing keeps collisions from only ever adding similarity
+            vector[h % self.dim] += 1.0 if (h >> 31) & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+class _Partition:
+    """Question vectors and answers for one language, stored as a ring buffer"""
+
+    def __init__(self, dim, max_entries):
+        self.max_entries = max_entries
+        self.matrix = np.zeros((min(64, max_entries), dim), dtype=np.float32)
+        self.stored_at = np.zeros(self.matrix.shape[0], dtype=np.float64)
+        self.answers = []
+        self.next_slot = 0
+
+    def __len__(self):
+        return len(self.answers)
+
+    def add(self, vector, answer, stored_at):
+        if len(self.answers) < self.max_entries:
+            if len(self.answers) == self.matrix.shape[0]:
+                size = min(self.matrix.shape[0] * 2, self.max_entries)
+                grown = np.zeros((size, self.matrix.shape[1]), dtype=np.float32)
+                grown[:len(self.answers)] = self.matrix[:len(self.answers)]
+                self.matrix = grown
+                self.stored_at = np.resize(self.stored_at, size)
+            self.matrix[len(self.answers)] = vector
+            self.stored_at[len(self.answers)] = stored_at
+            self.answers.append(answer)
+            return
+        # Full: overwrite the oldest entry
+        self.matrix[self.next_slot] = vector
+        self.stored_at[self.next_slot] = stored_at
+        self.answers[self.next_slot] = answer
+        self.next_slot = (self.next_slot + 1) % self.max_entries
+
+    def newest(self):
+        return float(self.stored_at[:len(self.answers)].max())
+
+    def best_match(self, vector, cutoff=None):
+        """(similarity, index) of the closest entry stored after cutoff; similarity is -inf if none"""
+        similarities = self.matrix[:len(self.answers)] @ vector
+        if cutoff is not None:
+            similarities[self.stored_at[:len(self.answers)] <= cutoff] = -np.inf
+        index = int(np.argmax(similarities))
+        return float(similarities[index]), index
+
+class SemanticCache:
+    """Reuse answers for near-duplicate questions in the same language, for up to ttl_seconds"""
+
+    def __init__(self, threshold=0.95, max_entries=5000, dim=256, ttl_seconds=86400):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.vectorizer = QuestionVectorizer(dim)
+        self.partitions = {}
+        self.kb_version = None
+        self.lookups = 0
+        self.hits = 0
+
+    def __len__(self):
+        return sum(len(partition) for partition in self.partitions.values())
+
+    def _check_version(self, kb_version):
+        # Answers from an older knowledge base are dropped wholesale
+        if kb_version != self.kb_version:
+            self.partitions.clear()
+            self.kb_version = kb_version
+
+    def lookup(self, question, lang_code, kb_version):
+        """Return (answer, similarity) for the closest cached question, or (None, similarity)"""
+        self.lookups += 1
+        self._check_version(kb_version)
+        partition = self.partitions.get(lang_code)
+        if not partition:
+            return None, 0.0
+        cutoff = time.time() - self.ttl_seconds
+        if partition.newest() <= cutoff:
+            # Every answer for this language has expired
+            del self.partitions[lang_code]
+            return None, 0.0
+        # Expired entries are skipped here and overwritten first, being the oldest in the ring
+        similarity, index = partition.best_match(self.vectorizer.vectorize(question), cutoff)
+        if similarity == -np.inf:
+            return None, 0.0
+        if similarity >= self.threshold:
+            self.hits += 1
+            return partition.answers[index], similarity
+        return None, similarity
+
+    def add(self, question, lang_code, kb_version, answer):
+        """Remember the answer to a question"""
+        if self.max_entries <= 0:
+            return
+        self._check_version(kb_version)
+        partition = self.partitions.get(lang_code)
+        if partition is None:
+            partition = self.partitions[lang_code] = _Partition(self.vectorizer.dim, self.max_entries)
+        partition.add(self.vectorizer.vectorize(question), answer, time.time())
+
+    def hit_rate(self):
+        return (self.hits / self.lookups * 100) if self.lookups else 0.0
@@ -0,0 +1,43 @@
+import asyncio
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers asking for the same key.
+
+    With a window, a new call waits that many seconds before starting so that identical
+    requests arriving just after it join the same call instead of starting their own.
+    Every call pays that delay, so it only helps where bursts of repeats are common.
+    """
+
+    def __init__(self, window=0.0):
+        self.window = window
+        self._inflight = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._inflight)
+
+    def __contains__(self, key):
+        return key in self._inflight
+
+    async def _start_after_window(self, factory):
+        await asyncio.sleep(self.window)
+        return await factory()
+
+    async def run(self, key, factory):
+        """Await factory() for key, or join the call already running for it"""
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(self._start_after_window(factory) if self.window > 0 else factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shield so one cancelled waiter doesn't cancel the shared call for everyone else
+        return await asyncio.shield(task)
+
+    def saved_rate(self):
+        """Percentage of requests answered by joining another caller's call"""
+        total = self.calls + self.coalesced
+        return (self.coalesced / total * 100) if total > 0 else 0.0
@@ -0,0 +1,29 @@
+"""Synthetic multi-page knowledge bases for tests and benchmarks of retrieval and prompts"""
+
+import random
+
+from knowledge_store import KnowledgeStore
+
+FILLER_WORDS = (
+    "deployment pipeline service client budget roadmap invoice vendor sprint metric "
+    "dashboard backup incident audit contract payroll hardware license training travel"
+).split()
+
+class StaticStore:
+    """Knowledge store stand-in holding synthetic text"""
+
+    def __init__(self, sections):
+        self.sections = sections
+        self.text = "\n\n--------------------------------------------------\n\n".join(sections)
+        self.version = str(hash(self.text))
+
+def build_corpus(pages, seed=0):
+    """Real sections plus synthetic ~3000-character pages"""
+    rng = random.Random(seed)
+    sections = list(KnowledgeStore("knowledge_base.txt").load().sections)
+    for page in range(pages):
+        lines = [f"Internal Policy {page}:"]
+        for _ in range(40):
+            lines.append("- " + " ".join(rng.choice(FILLER_WORDS) for _ in range(10)))
+        sections.append("\n".join(lines))
+    return sections
@@ -0,0 +1,87 @@
+"""
+Test the /ask answer cache (normalization, LRU/TTL eviction, SQLite tier)
+"""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+import time
+
+from answer_cache import AnswerCache, make_cache_key, normalize_question
+
+async def _run_memory_checks():
+    # LRU eviction by entry count
+    cache = AnswerCache(max_entries=2)
+    await cache.put("a", "1")
+    await cache.put("b", "2")
+    assert await cache.get("a") == "1"  # a is now most recently used
+    await cache.put("c", "3")
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "1" and await cache.get("c") == "3"
+    assert cache.evictions == 1
+    print("✅ LRU eviction")
+
+    # Memory cap
+    cache = AnswerCache(max_entries=100, max_bytes=50)
+    await cache.put("k1", "x" * 30)
+    await cache.put("k2", "y" * 30)
+    assert len(cache) == 1 and cache.size_bytes <= 50
+    print("✅ Memory cap enforced")
+
+    # TTL
+    cache = AnswerCache(ttl_seconds=0.05)
+    await cache.put("k", "answer")
+    assert await cache.get("k") == "answer"
+    await asyncio.sleep(0.1)
+    assert await cache.get("k") is None
+    print("✅ TTL expiry")
+    print(f"📊 Hit rate example: {cache.hit_rate():.1f}%")
+
+async def _run_disk_checks(db_path):
+    # SQLite tier survives a restart
+    cache = await AnswerCache(db_path=db_path).open()
+    await cache.put("k", "persisted answer")
+    await cache.close()
+
+    restarted = await AnswerCache(db_path=db_path).open()
+    assert await restarted.get("k") == "persisted answer"
+    assert restarted.disk_hits == 1
+    assert await restarted.get("k") == "persisted answer"
+    assert restarted.disk_hits == 1  # second read served from memory
+    await restarted.close()
+    print("✅ SQLite tier survives restart")
+
+    # Rows left behind (e.g. for an old knowledge base version) are purged once expired
+    db = sqlite3.connect(db_path)
+    db.execute("INSERT INTO answers (key, answer, stored_at) VALUES ('old', 'stale', ?)", (time.time() - 100,))
+    db.commit()
+    db.close()
+    purged = await AnswerCache(db_path=db_path, ttl_seconds=50, purge_interval=0.05).open()
+    assert await purged.get("old") is None
+    await purged.put("fresh", "new answer")
+    purged.ttl_seconds = 0.01
+    await asyncio.sleep(0.1)  # a periodic purge runs
+    await purged.close()
+    db = sqlite3.connect(db_path)
+    assert db.execute("SELECT COUNT(*) FROM answers").fetchone()[0] == 0
+    db.close()
+    print("✅ Expired rows purged on open and periodically")
+
+def test_answer_cache():
+    print("🧪 Testing Answer Cache\n")
+
+    # Normalization
+    assert normalize_question("  What are the   office hours?? ") == "what are the office hours"
+    assert normalize_question("¿Cuáles son las horas?") == "cuáles son las horas"
+    assert make_cache_key("Office hours?", "en", "v1") == make_cache_key("office HOURS", "en", "v1")
+    assert make_cache_key("Office hours?", "en", "v1") != make_cache_key("Office hours?", "es", "v1")
+    assert make_cache_key("Office hours?", "en", "v1") != make_cache_key("Office hours?", "en", "v2")
+    print("✅ Keys normalize questions and include language + knowledge version")
+
+    asyncio.run(_run_memory_checks())
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_run_disk_checks(os.path.join(tmp, "answers.db")))
+
+if __name__ == "__main__":
+    test_answer_cache()
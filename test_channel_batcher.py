@@ -0,0 +1,80 @@
+"""
+Test per-channel batching of outbound messages (coalescing, chunking, pacing)
+"""
+
+import asyncio
+import time
+
+from channel_batcher import ChannelBatcher
+
+async def _run_checks():
+    sent = []
+
+    async def fake_send(channel_id, items):
+        sent.append((channel_id, list(items), time.monotonic()))
+
+    batcher = ChannelBatcher(fake_send, window=0.05, max_per_message=10, min_interval=0.1)
+
+    # 25 reminders due at once in one channel, 2 in another
+    futures = [batcher.submit(1, f"r{i}") for i in range(25)]
+    futures += [batcher.submit(2, "a"), batcher.submit(2, "b")]
+    await asyncio.gather(*futures)
+
+    channel_one = [items for channel_id, items, _ in sent if channel_id == 1]
+    assert [len(items) for items in channel_one] == [10, 10, 5]
+    assert [item for items in channel_one for item in items] == [f"r{i}" for i in range(25)]
+    assert [items for channel_id, items, _ in sent if channel_id == 2] == [["a", "b"]]
+    assert batcher.items == 27 and batcher.messages == 4 and batcher.max_batch == 10
+    print(f"✅ 27 items → {batcher.messages} messages")
+
+    # Sends to the same channel are spaced by min_interval
+    times = [at for channel_id, _, at in sent if channel_id == 1]
+    assert all(later - earlier >= 0.09 for earlier, later in zip(times, times[1:]))
+    print("✅ Sends to one channel are paced")
+
+    # The size cap splits a chunk before the count cap does
+    sized = ChannelBatcher(fake_send, window=0.01, min_interval=0, size=len, max_size=10)
+    sent.clear()
+    await asyncio.gather(*(sized.submit(3, "x" * 4) for _ in range(5)))
+    assert [len(items) for _, items, _ in sent] == [2, 2, 1]
+    print("✅ Size cap respected")
+
+    # A failed send fails every item in its chunk
+    async def failing_send(channel_id, items):
+        raise RuntimeError("forbidden")
+
+    failing = ChannelBatcher(failing_send, window=0.01)
+    results = await asyncio.gather(failing.submit(4, "x"), failing.submit(4, "y"), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results) and failing.failed == 2
+    print("✅ Send errors reach every waiter")
+
+async def _run_stop_checks():
+    sent = []
+
+    async def fake_send(channel_id, items):
+        sent.append(list(items))
+
+    batcher = ChannelBatcher(fake_send, window=10, min_interval=10, max_per_message=2)
+    futures = [batcher.submit(1, f"r{i}") for i in range(3)]
+    await asyncio.sleep(0.01)
+    await asyncio.wait_for(batcher.stop(), 1)
+    assert sent == [["r0", "r1"], ["r2"]] and all(future.result() for future in futures)
+    print("✅ Stopping sends items still waiting in the window")
+
+    async def stuck_send(channel_id, items):
+        await asyncio.sleep(10)
+
+    stuck = ChannelBatcher(stuck_send, window=0)
+    future = stuck.submit(1, "x")
+    await asyncio.sleep(0.01)
+    await stuck.stop(timeout=0.05)
+    assert future.cancelled()
+    print("✅ Items that can't be sent before the timeout are cancelled")
+
+def test_channel_batcher():
+    print("🧪 Testing Channel Batcher\n")
+    asyncio.run(_run_checks())
+    asyncio.run(_run_stop_checks())
+
+if __name__ == "__main__":
+    test_channel_batcher()
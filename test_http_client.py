@@ -0,0 +1,58 @@
+"""
+Test the shared HTTP client against a local aiohttp server
+"""
+
+import asyncio
+
+from aiohttp import web
+
+from http_client import HttpClient
+
+async def _run_checks():
+    calls = {'flaky': 0}
+
+    async def flaky(request):
+        calls['flaky'] += 1
+        if calls['flaky'] < 3:
+            return web.json_response({'error': 'busy'}, status=503)
+        return web.json_response({'ok': True, 'city': request.query.get('q')})
+
+    async def missing(request):
+        return web.json_response({'message': 'city not found'}, status=404)
+
+    app = web.Application()
+    app.router.add_get('/flaky', flaky)
+    app.router.add_get('/missing', missing)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base = f"http://127.0.0.1:{port}"
+
+    client = HttpClient(max_retries=3, backoff_base=0.01)
+    try:
+        status, data = await client.get_json(f"{base}/flaky", params={'q': 'Paris'})
+        assert status == 200 and data == {'ok': True, 'city': 'Paris'}
+        assert client.retries == 2
+        print(f"✅ 5xx retried with backoff ({client.retries} retries)")
+
+        status, data = await client.get_json(f"{base}/missing")
+        assert status == 404 and data['message'] == 'city not found'
+        assert client.retries == 2
+        print("✅ 404 returned without retrying")
+
+        session = client.session
+        await client.get_json(f"{base}/missing")
+        assert client.session is session
+        print("✅ Session reused across requests")
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+def test_http_client():
+    print("🧪 Testing Shared HTTP Client\n")
+    asyncio.run(_run_checks())
+
+if __name__ == "__main__":
+    test_http_client()
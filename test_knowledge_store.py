@@ -0,0 +1,57 @@
+"""
+Test the in-memory knowledge store and its reload-on-change behaviour
+"""
+
+import os
+import tempfile
+
+from knowledge_store import KnowledgeStore
+
+SAMPLE = """Company Name: Example Corp
+
+--------------------------------------------------
+
+Office Hours:
+Monday to Friday, 9 AM to 6 PM
+
+--------------------------------------------------
+
+Tools:
+- GitHub
+"""
+
+def test_knowledge_store():
+    print("🧪 Testing Knowledge Store\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "knowledge_base.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(SAMPLE)
+
+        store = KnowledgeStore(path).load()
+        print(f"✅ Loaded {len(store.sections)} sections (version {store.version})")
+        assert store.text == SAMPLE
+        assert len(store.sections) == 3
+        assert store.sections[1].startswith("Office Hours:")
+
+        # Unchanged file must not be re-read
+        assert store.reload_if_changed() is False
+        assert store.reload_count == 1
+        print("✅ Unchanged file is not reloaded")
+
+        old_version = store.version
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n--------------------------------------------------\n\nNew Section\n")
+
+        assert store.reload_if_changed() is True
+        assert len(store.sections) == 4
+        assert store.version != old_version
+        print(f"✅ Changed file reloaded ({len(store.sections)} sections, version {store.version})")
+
+    # The real knowledge base should split into several sections
+    store = KnowledgeStore("knowledge_base.txt").load()
+    assert len(store.sections) > 1
+    print(f"✅ knowledge_base.txt has {len(store.sections)} sections")
+
+if __name__ == "__main__":
+    test_knowledge_store()
@@ -0,0 +1,59 @@
+"""
+Test language detection (start-up warm-up, caching, script fast paths)
+"""
+
+import threading
+
+import language_support
+from langdetect import detector_factory
+from language_support import detect_language, start_detector_warm_up
+
+FRENCH = "Bonjour, pouvez-vous m'expliquer comment fonctionne la facturation mensuelle?"
+
+def test_detection_waits_for_warm_up():
+    print("🧪 Testing Detection During Warm-Up\n")
+    # Start from a cold detector, as at bot start-up
+    detector_factory._factory = None
+    language_support._detector_ready.clear()
+    language_support._detect_normalized.cache_clear()
+
+    results = []
+    warm_up = start_detector_warm_up()
+    threads = [threading.Thread(target=lambda: results.append(detect_language(FRENCH))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads + [warm_up]:
+        thread.join()
+    assert results == [('fr', 'French')] * 8
+    print("✅ Questions arriving mid warm-up wait for the full profiles")
+
+def test_failed_load_is_not_cached():
+    print("🧪 Testing Detection Cache After a Failed Load\n")
+    detector_factory._factory = None
+    language_support._detector_ready.clear()
+    language_support._detect_normalized.cache_clear()
+
+    original = language_support.init_factory
+    language_support.init_factory = lambda: (_ for _ in ()).throw(OSError("profiles missing"))
+    try:
+        assert detect_language(FRENCH) == ('en', 'English')  # fallback, not cached
+    finally:
+        language_support.init_factory = original
+    assert detect_language(FRENCH) == ('fr', 'French')
+    print("✅ Fallback answers from an unready detector are not cached")
+
+def test_script_must_dominate():
+    print("🧪 Testing Script Fast Paths\n")
+    assert detect_language("How do I say 東京 in a sentence for the meeting notes?") == ('en', 'English')
+    assert detect_language("東京都庁の住所") == ('ja', 'Japanese')
+    assert detect_language("你好，请问办公室几点开门？") == ('zh', 'Chinese')
+    print("✅ A few words in another script don't override the question's language")
+
+    assert detect_language("Γεια σου, τι κάνεις σήμερα;") == ('el', 'Greek')
+    assert detect_language("བཀྲ་ཤིས་བདེ་ལེགས།") == ('bo', 'Tibetan')
+    print("✅ Every script fast-path language has a display name")
+
+if __name__ == "__main__":
+    test_detection_waits_for_warm_up()
+    test_failed_load_is_not_cached()
+    test_script_must_dominate()
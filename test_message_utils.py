@@ -0,0 +1,76 @@
+"""
+Test splitting long answers into Discord-sized messages
+"""
+
+import asyncio
+
+from message_utils import split_message, PaginatedView
+
+def test_split_message():
+    print("🧪 Testing Message Splitting\n")
+
+    assert split_message("short answer") == ["short answer"]
+    print("✅ Short text is left alone")
+
+    # Paragraph boundaries are preferred and no text is lost
+    paragraphs = [f"Paragraph {i}: " + "word " * 60 for i in range(20)]
+    text = "\n\n".join(paragraphs)
+    parts = split_message(text)
+    assert all(len(part) <= 2000 for part in parts)
+    assert all(part.startswith("Paragraph") for part in parts)
+    assert sum(part.count("Paragraph") for part in parts) == 20
+    print(f"✅ {len(text)} chars split into {len(parts)} parts on paragraph boundaries")
+
+    # Small code blocks are never split
+    code = "```python\n" + "\n".join(f"print({i})" for i in range(30)) + "\n```"
+    text = "Intro " * 300 + "\n\n" + code + "\n\nOutro"
+    parts = split_message(text)
+    assert any(code == part or code in part for part in parts)
+    assert all(part.count("```") % 2 == 0 for part in parts)
+    print("✅ Code block kept whole")
+
+    # Oversized code blocks are re-fenced in every part
+    big_code = "```js\n" + "\n".join(f"console.log({i});" for i in range(400)) + "\n```"
+    parts = split_message(big_code)
+    assert len(parts) > 1
+    assert all(len(part) <= 2000 for part in parts)
+    assert all(part.startswith("```js\n") and part.endswith("\n```") for part in parts)
+    print(f"✅ Oversized code block split into {len(parts)} fenced parts")
+
+    # Hard splits never cut inside combining sequences or emoji
+    family = "\U0001F468\u200d\U0001F469\u200d\U0001F467"
+    text = ("e\u0301" * 333) + family * 200
+    parts = split_message(text, limit=100)
+    assert "".join(parts) == text
+    for left, right in zip(parts, parts[1:]):
+        assert right[0] not in "\u0301\u200d" and left[-1] != "\u200d"
+    print("✅ Grapheme clusters are not split")
+
+class FakeMessage:
+    id = 1
+
+    def __init__(self):
+        self.edits = []
+
+    async def edit(self, **kwargs):
+        self.edits.append(kwargs)
+
+def test_paginated_view_timeout():
+    print("🧪 Testing Page Buttons On Timeout\n")
+
+    async def run():
+        view = PaginatedView(["one", "two", "three"], title="Answer")
+        await view.on_timeout()  # never sent: nothing to edit
+        view.message = FakeMessage()
+        view.index = 1
+        await view.on_timeout()
+        return view.message.edits
+
+    edits = asyncio.run(run())
+    assert len(edits) == 1 and edits[0]['view'] is None
+    assert edits[0]['embed'].description == "two"
+    print("✅ Buttons removed and the current page kept when the view times out")
+
+if __name__ == "__main__":
+    test_split_message()
+    test_paginated_view_timeout()
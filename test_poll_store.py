@@ -0,0 +1,73 @@
+"""
+Test the SQLite-backed poll store (persistence, batched vote writes, lookup by message ID)
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+from poll_store import PollStore, poll_ends_at
+
+def make_poll(message_id, duration_seconds=600, kind='poll', mode='reactions'):
+    return {
+        'kind': kind,
+        'mode': mode,
+        'question': "Favorite color?",
+        'options': ["Red", "Blue", "Green"],
+        'creator': 1,
+        'channel': 42,
+        'message_id': message_id,
+        'created_at': time.time(),
+        'duration_seconds': duration_seconds,
+        'emojis': ['1️⃣', '2️⃣', '3️⃣']
+    }
+
+def vote(store, message_id, user_id, option, added=True):
+    """Apply a vote the way the bot does: tally first, then queue the write"""
+    tally = store.get(message_id)['tally']
+    if tally.add(user_id, option) if added else tally.remove(user_id, option):
+        store.record_vote(message_id, user_id, option, added)
+
+async def _run_checks(db_path):
+    store = PollStore(db_path, flush_interval=0.05)
+    await store.open()
+    await store.add(make_poll(1001))
+    await store.add(make_poll(1002, duration_seconds=60, kind='quick', mode='buttons'))
+    await store.add(make_poll(1003))
+    for user_id in range(20):
+        vote(store, 1001, user_id, user_id % 3)
+    vote(store, 1001, 0, 0, added=False)
+    vote(store, 1001, 0, 2)
+    vote(store, 1003, 7, 1)
+    await store.remove(1003)
+    assert store.get(1001)['tally'].counts == [6, 7, 7]
+    print("✅ Polls and votes recorded in memory")
+
+    await asyncio.sleep(0.1)
+    assert store.flushes == 1 and store.votes_written == 22
+    print(f"✅ {store.votes_written} vote changes written in {store.flushes} transaction")
+
+    vote(store, 1002, 5, 0)  # still buffered when the bot shuts down
+    await store.close()
+
+    # Reopen as if the bot restarted
+    store = PollStore(db_path)
+    loaded = await store.open()
+    assert loaded == 2 and 1003 not in store
+    poll = store.get(1001)
+    assert poll['options'] == ["Red", "Blue", "Green"] and poll['kind'] == 'poll'
+    assert poll['tally'].counts == [6, 7, 7] and poll['tally'].voters == 20
+    assert store.get(1002)['tally'].counts == [1, 0, 0] and store.get(1002)['mode'] == 'buttons'
+    assert poll['mode'] == 'reactions'
+    assert abs(poll_ends_at(store.get(1002)) - (time.time() + 60)) < 5
+    print("✅ Polls and running tallies survived a restart")
+    await store.close()
+
+def test_poll_store():
+    print("🧪 Testing Poll Store\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_run_checks(os.path.join(tmp, "polls.db")))
+
+if __name__ == "__main__":
+    test_poll_store()
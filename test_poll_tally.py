@@ -0,0 +1,63 @@
+"""
+Test live poll tallies (per-user votes, duplicate events) and throttled live edits
+"""
+
+import asyncio
+
+from poll_tally import PollTally, ThrottledRefresher
+
+def test_poll_tally():
+    print("🧪 Testing Poll Tally\n")
+    tally = PollTally(['1️⃣', '2️⃣', '3️⃣'])
+    assert tally.option_index('2️⃣') == 1 and tally.option_index('🍕') is None
+
+    assert tally.add(10, 0) and tally.add(11, 0) and tally.add(11, 2)
+    assert not tally.add(10, 0)  # a repeated event doesn't double count
+    assert tally.counts == [2, 0, 1] and tally.total_votes == 3 and tally.voters == 2
+    print("✅ Votes counted once per user and option")
+
+    assert tally.remove(11, 0) and not tally.remove(11, 0) and not tally.remove(99, 1)
+    assert tally.remove(11, 2) and tally.voters == 1 and tally.counts == [1, 0, 0]
+    print("✅ Removing reactions withdraws votes")
+
+    assert tally.results(["Red", "Blue", "Green"]) == [("Red", 1), ("Blue", 0), ("Green", 0)]
+    restored = PollTally(['✅', '❌'], votes={1: [0], 2: [0, 1]})
+    assert restored.counts == [2, 1] and restored.voters == 2
+    print("✅ Results sorted and tallies rebuilt from saved votes")
+
+async def _run_refresher_checks():
+    edits = []
+
+    async def refresh(key):
+        edits.append(key)
+
+    refresher = ThrottledRefresher(refresh, interval=0.1)
+    for _ in range(50):
+        refresher.request("poll")
+    refresher.request("other")
+    await asyncio.sleep(0.05)
+    assert edits == ["poll", "other"]
+    print("✅ A burst of 50 votes → 1 edit")
+
+    refresher.request("poll")
+    refresher.request("poll")
+    await asyncio.sleep(0.02)
+    assert edits.count("poll") == 1  # still inside the interval
+    await asyncio.sleep(0.12)
+    assert edits.count("poll") == 2
+    print("✅ Later votes wait for the interval and share one edit")
+
+    refresher.request("poll")
+    refresher.forget("poll")
+    await asyncio.sleep(0.15)
+    assert edits.count("poll") == 2 and refresher.refreshed == 3
+    await refresher.stop()
+    print("✅ Forgotten polls are not edited")
+
+def test_throttled_refresher():
+    print("🧪 Testing Throttled Live Edits\n")
+    asyncio.run(_run_refresher_checks())
+
+if __name__ == "__main__":
+    test_poll_tally()
+    test_throttled_refresher()
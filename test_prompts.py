@@ -0,0 +1,37 @@
+"""
+Test the /ask prompt split (stable system-instruction prefix, small per-question suffix)
+"""
+
+from knowledge_store import KnowledgeStore
+from prompts import PromptBuilder
+from retrieval import Retriever
+from synthetic_corpus import StaticStore, build_corpus
+
+def test_prompt_prefix():
+    print("🧪 Testing Prompt Prefix/Suffix Split\n")
+    store = KnowledgeStore("knowledge_base.txt").load()
+    builder = PromptBuilder(Retriever(store))
+    en_prefix, en_suffix = builder.build("What are the office hours?", 'en', 'English')
+    es_prefix, es_suffix = builder.build("¿Cuáles son las horas de oficina?", 'es', 'Spanish')
+    assert en_prefix is es_prefix and store.text in en_prefix
+    assert builder.prefix_builds == 1
+    print("✅ Small knowledge base lives in one prefix shared by every question and language")
+
+    assert "User Question: What are the office hours?" in en_suffix and "Respond in English." in en_suffix
+    assert "Spanish (es)" in es_suffix and store.text not in es_suffix
+    print("✅ Suffix carries only the question and the reply language")
+
+    store.version = "edited"
+    builder.build("What are the office hours?", 'en', 'English')
+    assert builder.prefix_builds == 2
+    print("✅ Prefix rebuilt when the knowledge base version changes")
+
+    large = StaticStore(build_corpus(50))
+    builder = PromptBuilder(Retriever(large))
+    prefix, suffix = builder.build("What are the office hours?", 'en', 'English')
+    assert large.text not in prefix and "Company Knowledge" in suffix
+    assert len(suffix) < len(large.text) // 10
+    print("✅ Large knowledge bases send retrieved chunks with the question")
+
+if __name__ == "__main__":
+    test_prompt_prefix()
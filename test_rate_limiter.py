@@ -0,0 +1,59 @@
+"""
+Test token-bucket rate limiting (bursts, refill, shared API buckets, idle eviction)
+"""
+
+from rate_limiter import RateLimiter, parse_rate
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_rate_limiter():
+    print("🧪 Testing Rate Limiter\n")
+    assert parse_rate("5/60") == (5, 60.0) and parse_rate("") is None and parse_rate("0") is None
+
+    clock = FakeClock()
+    limiter = RateLimiter({
+        'ask_user': parse_rate("3/60"),
+        'ask_guild': parse_rate("5/60"),
+        'gemini_api': parse_rate("6/60"),
+        'weather_user': None
+    }, clock=clock)
+
+    def ask(user, guild=1):
+        return limiter.acquire(('ask_user', user), ('ask_guild', guild), ('gemini_api', 'ask'))
+
+    assert [ask(1) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert abs(ask(1) - 20.0) < 1e-9  # one token every 20 seconds
+    print("✅ Burst of 3 allowed, 4th told to retry in 20s")
+
+    assert ask(2) == 0.0 and ask(2) == 0.0
+    assert ask(3) > 0 and limiter.rejected['ask_guild'] == 1
+    print("✅ Other users share the guild's bucket")
+
+    assert ask(4, guild=2) == 0.0
+    assert ask(5, guild=3) > 0 and limiter.rejected['gemini_api'] == 1
+    print("✅ All guilds share the API bucket")
+
+    # Rejected requests take nothing, so user 5's own bucket is still full
+    clock.now += 10
+    assert ask(5, guild=3) == 0.0
+    assert limiter.acquire(('weather_user', 1), ('ask_guild', None)) == 0.0
+    print("✅ Rejections are free; unconfigured rules and DMs are skipped")
+
+    clock.now += 60
+    assert ask(1) == 0.0 and len(limiter) == 3  # everything else refilled and was dropped
+    assert limiter.evicted == 8
+    print(f"✅ Idle buckets evicted once refilled ({len(limiter)} left)")
+
+    capped = RateLimiter({'ask_user': (1, 60)}, max_buckets=100, clock=clock)
+    for user in range(1000):
+        capped.acquire(('ask_user', user))
+    assert len(capped) == 100
+    print("✅ Bucket count capped under a flood of new users")
+
+if __name__ == "__main__":
+    test_rate_limiter()
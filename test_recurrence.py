@@ -0,0 +1,90 @@
+"""
+Test recurring reminder rules (parsing, cron matching, next-fire computation)
+"""
+
+from datetime import datetime, timedelta, UTC
+
+from recurrence import parse_recurrence, next_fire, describe_recurrence, CronRule
+
+def at(*args):
+    return datetime(*args, tzinfo=UTC)
+
+def test_parse_recurrence():
+    print("🧪 Testing Recurrence Parsing\n")
+    cases = {
+        "every 30m": "every 1800",
+        "Every 2 Hours": "every 7200",
+        "every day": "every 86400",
+        "hourly": "every 3600",
+        "daily 09:30": "cron 30 9 * * *",
+        "weekdays at 9:30": "cron 30 9 * * 1-5",
+        "mon,wed 18:00": "cron 0 18 * * 1,3",
+        "every friday at 17:00": "cron 0 17 * * 5",
+        "cron 0 9 1 * *": "cron 0 9 1 * *",
+        "*/15  * * * *": "cron */15 * * * *",
+    }
+    for text, rule in cases.items():
+        assert parse_recurrence(text) == rule, (text, parse_recurrence(text))
+        print(f"✅ '{text}' → {rule} ({describe_recurrence(rule)})")
+
+    for text in ["every 10s", "weekdays 25:00", "0 0 31 2 *", "someday 09:00", "every blue moon", "1 2 3"]:
+        assert parse_recurrence(text) is None, text
+    print("✅ Invalid schedules rejected")
+
+    # Clock schedules remember the user's timezone; intervals don't need one
+    assert parse_recurrence("weekdays 09:30", "Europe/Berlin") == "cron 30 9 * * 1-5 Europe/Berlin"
+    assert parse_recurrence("daily 09:30", "UTC") == "cron 30 9 * * *"
+    assert parse_recurrence("every 30m", "Europe/Berlin") == "every 1800"
+    assert describe_recurrence("cron 30 9 * * 1-5 Europe/Berlin") == "weekdays at 09:30 Europe/Berlin"
+    assert parse_recurrence("cron 0 9 * * * Mars/Olympus") is None
+    print("✅ Schedules keep the user's timezone")
+
+def test_next_fire():
+    print("🧪 Testing Next Fire Times\n")
+    # Intervals step on from the previous due time and skip occurrences missed while offline
+    assert next_fire("every 1800", at(2026, 1, 1, 9, 0)) == at(2026, 1, 1, 9, 30)
+    assert next_fire("every 1800", at(2026, 1, 1, 9, 0), at(2026, 1, 1, 10, 10)) == at(2026, 1, 1, 10, 30)
+    print("✅ Interval rules stay on their grid")
+
+    # Friday evening → Monday morning for a weekday rule
+    assert next_fire("cron 30 9 * * 1-5", at(2026, 10, 16, 18, 0)) == at(2026, 10, 19, 9, 30)
+    # Same day when the time hasn't passed yet
+    assert next_fire("cron 30 9 * * *", at(2026, 10, 16, 9, 29, 59)) == at(2026, 10, 16, 9, 30)
+    # Strictly after: firing at 09:30 moves on to the next day
+    assert next_fire("cron 30 9 * * *", at(2026, 10, 16, 9, 30)) == at(2026, 10, 17, 9, 30)
+    # Leap days and year rollover
+    assert next_fire("cron 0 0 29 2 *", at(2026, 3, 1)) == at(2028, 2, 29)
+    assert next_fire("cron */15 * * * *", at(2026, 12, 31, 23, 50)) == at(2027, 1, 1, 0, 0)
+    # Day-of-month OR day-of-week when both are restricted
+    assert next_fire("cron 0 12 13 * 5", at(2026, 10, 10)) == at(2026, 10, 13, 12, 0)
+    print("✅ Cron rules jump straight to the next match")
+
+    # Zoned rules fire at the local wall time, across daylight saving changes
+    assert next_fire("cron 30 9 * * 1-5 Europe/Berlin", at(2026, 10, 16, 18, 0)) == at(2026, 10, 19, 7, 30)
+    assert next_fire("cron 30 9 * * * Europe/Berlin", at(2026, 10, 24, 8, 0)) == at(2026, 10, 25, 8, 30)
+    assert next_fire("cron 30 9 * * * Asia/Kolkata", at(2026, 10, 16, 5, 0)) == at(2026, 10, 17, 4, 0)
+    # 01:30 happens twice when New York falls back; each firing moves strictly forward
+    first = next_fire("cron 30 1 * * * America/New_York", at(2026, 11, 1, 0, 0))
+    assert first == at(2026, 11, 1, 5, 30)
+    assert next_fire("cron 30 1 * * * America/New_York", first) == at(2026, 11, 2, 6, 30)
+    print("✅ Zoned cron rules follow the local clock")
+
+    # Brute-force cross-check against minute-by-minute scanning
+    rule = CronRule("5,35 */6 1-10 * 1,3,5")
+    start = at(2026, 1, 1)
+    moment, expected = start, []
+    while len(expected) < 20:
+        moment += timedelta(minutes=1)
+        if (moment.minute in rule.minutes and moment.hour in rule.hours and rule._day_matches(moment)
+                and moment.month in rule.months):
+            expected.append(moment)
+    found, previous = [], start
+    for _ in range(20):
+        previous = rule.next_after(previous)
+        found.append(previous)
+    assert found == expected
+    print("✅ Matches a minute-by-minute scan")
+
+if __name__ == "__main__":
+    test_parse_recurrence()
+    test_next_fire()
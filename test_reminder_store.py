@@ -0,0 +1,86 @@
+"""
+Test the SQLite-backed reminder store (persistence, indexed and paged lookups)
+"""
+
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta, UTC
+
+from reminder_store import ReminderStore, due_at
+
+def make_reminder(user_id, seconds, creator_id=None, message="Check the server"):
+    data = {
+        'user_id': user_id,
+        'channel_id': 42,
+        'message': message,
+        'created_at': datetime.now(UTC),
+        'duration_seconds': seconds
+    }
+    if creator_id:
+        data['creator_id'] = creator_id
+        data['is_group_reminder'] = True
+    return data
+
+async def _run_checks(db_path):
+    store = ReminderStore(db_path)
+    await store.open()
+    await store.add("late", make_reminder(1, 3600))
+    await store.add("soon", make_reminder(1, 60))
+    await store.add("other", make_reminder(2, 120, creator_id=1, message="Team meeting"))
+    await store.add("gone", make_reminder(1, 30))
+    await store.remove("gone")
+    await store.close()
+    print("✅ Reminders written")
+
+    # Reopen as if the bot restarted
+    store = ReminderStore(db_path)
+    loaded = await store.open()
+    assert loaded == 3 and "gone" not in store
+    print(f"✅ {loaded} reminders survived a restart")
+
+    mine = [reminder_id for reminder_id, _ in store.list_for_user(1)]
+    assert mine == ["soon", "late"] and store.count_for_user(1) == 2
+    print("✅ Lookup by user, soonest first")
+
+    created = [reminder_id for reminder_id, _ in store.list_by_creator(1)]
+    assert created == ["other"] and store.count_by_creator(1) == 1
+    assert store.get("other")['is_group_reminder'] is True
+    print("✅ Lookup by creator")
+
+    due = [reminder_id for reminder_id, _ in await store.due_before(datetime.now(UTC) + timedelta(minutes=5))]
+    assert due == ["soon", "other"]
+    print("✅ Lookup by due time")
+
+    assert abs((due_at(store.get("late")) - datetime.now(UTC)).total_seconds() - 3600) < 5
+
+    # Paging through a user's index, soonest first
+    for i in range(25):
+        await store.add(f"bulk-{i:02d}", make_reminder(3, 1000 - i))
+    first = [reminder_id for reminder_id, _ in store.list_for_user(3, offset=0, limit=10)]
+    last = [reminder_id for reminder_id, _ in store.list_for_user(3, offset=20, limit=10)]
+    assert first[0] == "bulk-24" and len(first) == 10
+    assert last[-1] == "bulk-00" and len(last) == 5 and store.count_for_user(3) == 25
+    await store.remove("bulk-24")
+    assert store.list_for_user(3, limit=1)[0][0] == "bulk-23" and store.count_for_user(3) == 24
+    print("✅ Paged lookup stays sorted through adds and removes")
+
+    # Recurring reminders keep only their rule and next due time
+    recurring = make_reminder(4, 600)
+    recurring['recurrence'] = "cron 30 9 * * 1-5"
+    await store.add("standup", recurring)
+    await store.close()
+    store = ReminderStore(db_path)
+    await store.open()
+    assert store.get("standup")['recurrence'] == "cron 30 9 * * 1-5"
+    assert 'recurrence' not in store.get("late")
+    print("✅ Recurrence rule persisted")
+    await store.close()
+
+def test_reminder_store():
+    print("🧪 Testing Reminder Store\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_run_checks(os.path.join(tmp, "reminders.db")))
+
+if __name__ == "__main__":
+    test_reminder_store()
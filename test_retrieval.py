@@ -0,0 +1,58 @@
+"""
+Test the BM25 retrieval stage used to build /ask prompts
+"""
+
+from retrieval import KnowledgeIndex, Retriever, chunk_sections, estimate_tokens
+
+SECTIONS = [
+    "Office Hours:\nMonday to Friday, 9 AM to 6 PM IST",
+    "Engineering Process:\nAll work happens on feature branches and pull requests need a review",
+    "Core Technology Stack:\nReact, Next.js, Node.js and PostgreSQL",
+    "Holidays:\nThe office is closed on national holidays",
+]
+
+class FakeStore:
+    def __init__(self, sections):
+        self.sections = sections
+        self.text = "\n\n-----\n\n".join(sections)
+        self.version = "v1"
+
+def test_retrieval():
+    print("🧪 Testing Knowledge Retrieval\n")
+
+    index = KnowledgeIndex(SECTIONS)
+    cases = [
+        ("What are the office hours?", 0),
+        ("How do pull requests get reviewed?", 1),
+        ("Do we use PostgreSQL?", 2),
+    ]
+    for question, expected in cases:
+        best = index.search(question, top_k=1)[0][1]
+        status = "✅" if best == expected else "❌"
+        print(f"{status} '{question}' → section {best} (expected: {expected})")
+        assert best == expected
+
+    # Token budget limits how much is selected
+    selected = index.select("office hours holidays", top_k=4, token_budget=estimate_tokens(SECTIONS[0]))
+    assert selected == [SECTIONS[0]]
+    print("✅ Token budget respected")
+
+    # Unmatched questions fall back to the leading chunks
+    assert index.select("xyzzy", top_k=1, token_budget=1000) == [SECTIONS[0]]
+    print("✅ Fallback to leading chunks")
+
+    # Long sections are chunked without losing text
+    long_section = "\n".join(f"- line {i} " + "word " * 20 for i in range(50))
+    chunks = chunk_sections([long_section], max_chars=300)
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    assert sum(chunk.count("- line") for chunk in chunks) == 50
+    print(f"✅ Long section split into {len(chunks)} chunks")
+
+    # Small knowledge bases are passed through whole
+    store = FakeStore(SECTIONS)
+    assert Retriever(store, token_budget=10000).retrieve("office hours") == store.text
+    assert "Office Hours" in Retriever(store, top_k=1, token_budget=20).retrieve("office hours")
+    print("✅ Retriever respects budget and passes small bases through")
+
+if __name__ == "__main__":
+    test_retrieval()
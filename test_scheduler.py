@@ -0,0 +1,66 @@
+"""
+Test the heap-based timer scheduler used for reminders and poll endings
+"""
+
+import asyncio
+import time
+
+from scheduler import TimerScheduler
+
+async def _run_checks():
+    scheduler = TimerScheduler(batch_size=10)
+    scheduler.start()
+    fired = []
+
+    async def job(name):
+        fired.append((name, time.time()))
+
+    now = time.time()
+    scheduler.schedule("late", now + 0.30, job, "late")
+    scheduler.schedule("early", now + 0.10, job, "early")
+    scheduler.schedule("cancelled", now + 0.05, job, "cancelled")
+    assert scheduler.cancel("cancelled") is True
+    assert scheduler.cancel("cancelled") is False
+
+    # Inserting an earlier deadline wakes the sleeping loop
+    scheduler.schedule("earliest", now + 0.02, job, "earliest")
+
+    # Rescheduling a key replaces the old entry
+    scheduler.schedule("moved", now + 0.01, job, "moved-old")
+    scheduler.schedule("moved", now + 0.20, job, "moved")
+
+    await asyncio.sleep(0.45)
+    names = [name for name, _ in fired]
+    assert names == ["earliest", "early", "moved", "late"], names
+    assert len(scheduler) == 0
+    print(f"✅ Fired in deadline order: {names}")
+    print(f"✅ Max lateness {scheduler.max_lateness * 1000:.1f} ms")
+    assert scheduler.max_lateness < 0.1
+
+    # Many items due at once are dispatched in batches
+    fired.clear()
+    due = time.time() + 0.05
+    for i in range(250):
+        scheduler.schedule(i, due, job, i)
+    await asyncio.sleep(0.2)
+    assert len(fired) == 250
+    print("✅ 250 simultaneous deadlines dispatched in batches")
+
+    # Cancelling releases the job's arguments immediately and compacts the heap
+    payload = object()
+    for i in range(200):
+        scheduler.schedule(("bulk", i), time.time() + 3600, job, payload)
+    for i in range(200):
+        scheduler.cancel(("bulk", i))
+    assert len(scheduler) == 0
+    assert scheduler.tombstones < 100 and len(scheduler._heap) < 100
+    print(f"✅ Cancelled timers freed ({scheduler.tombstones} tombstones left)")
+
+    await scheduler.stop()
+
+def test_scheduler():
+    print("🧪 Testing Timer Scheduler\n")
+    asyncio.run(_run_checks())
+
+if __name__ == "__main__":
+    test_scheduler()
@@ -0,0 +1,84 @@
+"""
+Test the semantic near-duplicate question cache
+"""
+
+import time
+
+from semantic_cache import SemanticCache
+
+def test_semantic_cache():
+    print("🧪 Testing Semantic Cache\n")
+
+    # One-word changes of meaning must miss at the default threshold
+    strict = SemanticCache(max_entries=100)
+    for question, answer in [
+        ("Can you explain how the staging environment works?", "staging"),
+        ("What benefits do full-time employees get?", "full-time"),
+        ("How do I connect to the prod database?", "prod"),
+    ]:
+        strict.add(question, "en", "v1", answer)
+    for question in [
+        "Can you explain how the production environment works?",
+        "What benefits do part-time employees get?",
+        "How do I connect to the dev database?",
+    ]:
+        answer, similarity = strict.lookup(question, "en", "v1")
+        assert answer is None, (question, similarity)
+    assert strict.lookup("  can you explain how the STAGING environment works", "en", "v1")[0] == "staging"
+    print("✅ Swapping one word misses; only near-identical wording hits")
+
+    # The remaining checks exercise the cache mechanics with a looser threshold
+    cache = SemanticCache(threshold=0.85, max_entries=100)
+    cache.add("What are the office hours?", "en", "v1", "9 to 6")
+
+    answer, similarity = cache.lookup("what are the office hours today", "en", "v1")
+    print(f"✅ Near-duplicate hit with similarity {similarity:.2f}")
+    assert answer == "9 to 6"
+
+    answer, similarity = cache.lookup("What is the tech stack?", "en", "v1")
+    print(f"✅ Unrelated question missed with similarity {similarity:.2f}")
+    assert answer is None
+
+    answer, _ = cache.lookup("What are the office hours?", "es", "v1")
+    assert answer is None
+    print("✅ Other languages do not share answers")
+
+    answer, _ = cache.lookup("What are the office hours?", "en", "v2")
+    assert answer is None and len(cache) == 0
+    print("✅ New knowledge base version clears the cache")
+
+    # Answers expire like the exact-match cache's
+    expiring = SemanticCache(max_entries=10, ttl_seconds=0.05)
+    expiring.add("What are the office hours?", "en", "v1", "9 to 6")
+    time.sleep(0.06)
+    expiring.add("What is the tech stack?", "en", "v1", "Python")
+    assert expiring.lookup("What are the office hours?", "en", "v1")[0] is None
+    assert expiring.lookup("What is the tech stack?", "en", "v1")[0] == "Python"
+    time.sleep(0.06)
+    assert expiring.lookup("What is the tech stack?", "en", "v1")[0] is None and len(expiring) == 0
+    print("✅ Expired answers are not served")
+
+    # Ring buffer keeps the partition bounded
+    small = SemanticCache(max_entries=3)
+    for i in range(5):
+        small.add(f"question number {i}", "en", "v1", str(i))
+    assert len(small) == 3
+    assert small.lookup("question number 4", "en", "v1")[0] == "4"
+    assert small.lookup("question number 0", "en", "v1")[0] != "0"
+    print("✅ Oldest entries are overwritten when full")
+
+    # Vectorized search over thousands of entries stays fast
+    big = SemanticCache(max_entries=5000)
+    for i in range(5000):
+        big.add(f"how do I configure service {i} for project {i * 7}", "en", "v1", str(i))
+    vector = big.vectorizer.vectorize("how do I configure service 42")
+    partition = big.partitions["en"]
+    start = time.perf_counter()
+    for _ in range(100):
+        partition.best_match(vector)
+    per_search_ms = (time.perf_counter() - start) * 1000 / 100
+    print(f"⚡ Similarity search over 5000 entries: {per_search_ms:.3f} ms")
+    print(f"📊 Hit rate: {cache.hit_rate():.1f}%")
+
+if __name__ == "__main__":
+    test_semantic_cache()
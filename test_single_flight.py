@@ -0,0 +1,59 @@
+"""
+Test request coalescing (shared in-flight calls, micro-batching window, failures)
+"""
+
+import asyncio
+
+from single_flight import SingleFlight
+
+async def _run_checks():
+    calls = []
+
+    async def generate(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        if key == "boom":
+            raise RuntimeError("quota")
+        return f"answer to {key}"
+
+    flights = SingleFlight()
+    results = await asyncio.gather(*(flights.run("q", lambda: generate("q")) for _ in range(5)))
+    assert results == ["answer to q"] * 5 and calls == ["q"]
+    assert flights.calls == 1 and flights.coalesced == 4 and len(flights) == 0
+    print("✅ 5 concurrent identical requests → 1 call")
+
+    # Once the call has finished, the next request starts a fresh one
+    first = asyncio.ensure_future(flights.run("late", lambda: generate("late")))
+    await asyncio.sleep(0.06)
+    await flights.run("late", lambda: generate("late"))
+    await first
+    assert calls.count("late") == 2
+    print("✅ Requests after the call finished start a new one")
+
+    # With a window, stragglers arriving shortly after the first request share its call
+    windowed = SingleFlight(window=0.05)
+    first = asyncio.ensure_future(windowed.run("q", lambda: generate("windowed")))
+    await asyncio.sleep(0.03)
+    assert calls.count("windowed") == 0  # still collecting
+    second = await windowed.run("q", lambda: generate("windowed"))
+    assert await first == second and calls.count("windowed") == 1 and windowed.coalesced == 1
+    assert windowed.saved_rate() == 50.0
+    print("✅ Window lets stragglers join before the upstream call starts")
+
+    # A failure reaches every waiter, and a cancelled waiter doesn't cancel the others
+    outcomes = await asyncio.gather(*(flights.run("boom", lambda: generate("boom")) for _ in range(3)),
+                                    return_exceptions=True)
+    assert all(isinstance(o, RuntimeError) for o in outcomes) and calls.count("boom") == 1
+    waiter = asyncio.ensure_future(flights.run("x", lambda: generate("x")))
+    other = asyncio.ensure_future(flights.run("x", lambda: generate("x")))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    assert await other == "answer to x"
+    print("✅ Errors fan out; cancelling one waiter keeps the shared call alive")
+
+def test_single_flight():
+    print("🧪 Testing Single Flight\n")
+    asyncio.run(_run_checks())
+
+if __name__ == "__main__":
+    test_single_flight()
@@ -0,0 +1,96 @@
+"""
+Test the time parser (compound durations, absolute times, timezones) plus a randomized property check
+"""
+
+import random
+from datetime import datetime, timedelta, timezone, UTC
+from zoneinfo import ZoneInfo
+
+from time_parser import parse_duration, parse_absolute, parse_time_input, parse_timezone, canonical_timezone_name, UNIT_SECONDS
+
+NOW = datetime(2026, 10, 18, 10, 0, tzinfo=UTC)  # a Sunday
+
+def test_durations():
+    print("🧪 Testing Durations\n")
+    cases = {
+        "5m": 300, "30s": 30, "2h": 7200, "1d": 86400, "5 minutes": 300, "2 Hours": 7200,
+        "1h30m": 5400, "2d 4h": 187200, "1 hour and 5 minutes": 3900, "1h, 15m, 10s": 4510,
+        "1.5h": 5400, "1w": 604800, "120": 7200, " 45 ": 2700,
+    }
+    for text, seconds in cases.items():
+        assert parse_duration(text) == seconds, (text, parse_duration(text))
+    for text in ["", "m", "5x", "0", "10081", "h5", "5m 3", "tomorrow", "14:30", "5 am"]:
+        assert parse_duration(text) is None, text
+    print("✅ Single, compound and bare-minute durations")
+
+def test_absolute_times():
+    print("🧪 Testing Absolute Times\n")
+    assert parse_time_input("14:30", NOW) == 4.5 * 3600
+    assert parse_time_input("9am", NOW) == 23 * 3600  # already past today → tomorrow
+    assert parse_time_input("tomorrow 9am", NOW) == 23 * 3600
+    assert parse_time_input("today at 5:15pm", NOW) == 7 * 3600 + 15 * 60
+    assert parse_time_input("tonight 9", NOW) == 11 * 3600
+    assert parse_time_input("2026-10-20", NOW) == 38 * 3600
+    assert parse_time_input("2026-10-18T12:00:30Z", NOW) == 2 * 3600 + 30
+    print("✅ Clock times and ISO dates")
+
+    # Per-user timezones and zones written in the text
+    berlin = ZoneInfo("Europe/Berlin")  # UTC+2 on this date
+    assert parse_time_input("14:30", NOW, tz=berlin) == 2.5 * 3600
+    assert parse_time_input("14:30 UTC", NOW, tz=berlin) == 4.5 * 3600
+    assert parse_time_input("2026-10-18 14:30 America/New_York", NOW) == 8.5 * 3600
+    assert parse_time_input("13:00 +02:00", NOW) == 3600
+    assert parse_timezone("utc-5") == timezone(timedelta(hours=-5))
+    assert parse_timezone("Mars/Olympus") is None and parse_timezone("+15:00") is None
+    assert parse_timezone("europe/berlin") == berlin and canonical_timezone_name("AMERICA/NEW_YORK") == "America/New_York"
+    assert parse_time_input("14:30 europe/berlin", NOW) == 2.5 * 3600
+    # DST: 9am in Berlin after the clocks change (25 Oct 2026) is 08:00 UTC
+    assert parse_absolute("2026-10-26 09:00", NOW, berlin).astimezone(UTC).hour == 8
+    print("✅ Timezones and offsets")
+
+    for text in ["yesterday 9am", "25:00", "13pm", "2026-02-30", "2020-01-01", "14:30 Nowhere/Land", "today 9am"]:
+        assert parse_time_input(text, NOW) is None, text
+    print("✅ Invalid and past times rejected")
+
+def test_random_inputs():
+    print("🧪 Randomized Property Checks\n")
+    rng = random.Random(1234)
+    spellings = {}
+    for name, seconds in UNIT_SECONDS.items():
+        spellings.setdefault(seconds, []).append(name)
+
+    # Any compound duration, however it is written, adds up to the sum of its parts
+    for _ in range(2000):
+        parts = [(rng.randint(1, 99), rng.choice(list(spellings))) for _ in range(rng.randint(1, 4))]
+        separators = ["", " ", ", ", " and "]
+        text = ""
+        for i, (number, unit) in enumerate(parts):
+            name = rng.choice(spellings[unit])
+            name = name.upper() if rng.random() < 0.2 else name
+            text += (rng.choice(separators) if i else "") + f"{number}{rng.choice(['', ' '])}{name}"
+        expected = sum(number * unit for number, unit in parts)
+        assert parse_duration(text) == expected, (text, parse_duration(text), expected)
+    print("✅ 2000 random compound durations")
+
+    # Formatting any future moment as an ISO time in any zone parses back to the exact delay
+    zones = ["UTC", "Europe/Berlin", "America/New_York", "Asia/Kolkata", "Australia/Sydney", "+05:45"]
+    for _ in range(500):
+        seconds = rng.randint(60, 7 * 86400) // 60 * 60
+        zone = rng.choice(zones)
+        target = (NOW + timedelta(seconds=seconds)).astimezone(parse_timezone(zone))
+        text = f"{target:%Y-%m-%d %H:%M} {zone}"
+        assert parse_time_input(text, NOW) == seconds, text
+    print("✅ 500 random absolute times round-trip")
+
+    # Garbage never raises, and anything accepted is a positive number of seconds
+    alphabet = "0123456789 :-+/.,tTzZamphdswuAPMtomrowEurpeBlin"
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+        result = parse_time_input(text, NOW)
+        assert result is None or result >= 0, (text, result)
+    print("✅ 5000 random strings parsed without errors")
+
+if __name__ == "__main__":
+    test_durations()
+    test_absolute_times()
+    test_random_inputs()
@@ -0,0 +1,72 @@
+"""
+Test the user cache in front of fetch_user (gateway hits, TTL, not-found caching, coalescing)
+"""
+
+import asyncio
+
+from user_cache import UserCache
+
+class UserNotFound(Exception):
+    pass
+
+async def _run_checks():
+    gateway = {1: "alice"}
+    calls = []
+
+    async def fake_fetch(user_id):
+        calls.append(user_id)
+        await asyncio.sleep(0.05)
+        if user_id == 404:
+            raise UserNotFound(user_id)
+        if user_id == 500:
+            raise RuntimeError("server error")
+        return f"user-{user_id}"
+
+    cache = UserCache(gateway.get, fake_fetch, ttl=60, negative_ttl=60, not_found=UserNotFound)
+
+    # Gateway-cached users never touch the API
+    assert await cache.get(1) == "alice" and cache.gateway_hits == 1 and not calls
+    assert await cache.get(None) is None
+    print("✅ Gateway cache used first")
+
+    # Concurrent lookups for one user share a single fetch; later lookups are cache hits
+    users = await asyncio.gather(*(cache.get(2) for _ in range(5)))
+    assert users == ["user-2"] * 5 and calls == [2] and cache.coalesced == 4
+    assert await cache.get(2) == "user-2" and cache.hits == 1 and cache.fetches == 1
+    print(f"✅ 6 lookups → {cache.fetches} REST call")
+
+    # Unknown users are cached as None
+    assert await cache.get(404) is None
+    assert await cache.get(404) is None
+    assert calls.count(404) == 1 and cache.negative_hits == 1
+    print("✅ Not-found users cached")
+
+    # Other errors propagate and are not cached
+    for _ in range(2):
+        try:
+            await cache.get(500)
+            assert False, "expected an error"
+        except RuntimeError:
+            pass
+    assert calls.count(500) == 2
+    print("✅ Transient errors not cached")
+
+    # TTL expiry and LRU bound
+    short = UserCache(lambda _: None, fake_fetch, ttl=0.01, max_entries=2)
+    await short.get(3)
+    await asyncio.sleep(0.02)
+    await short.get(3)
+    assert short.fetches == 2
+    await short.get(4)
+    await short.get(5)
+    assert len(short) == 2
+    print("✅ Entries expire and the cache stays bounded")
+
+    print(f"📊 REST calls saved: {cache.saved}")
+
+def test_user_cache():
+    print("🧪 Testing User Cache\n")
+    asyncio.run(_run_checks())
+
+if __name__ == "__main__":
+    test_user_cache()
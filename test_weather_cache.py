@@ -0,0 +1,72 @@
+"""
+Test the weather cache (TTL, request coalescing, negative caching)
+"""
+
+import asyncio
+
+from weather_cache import WeatherCache, normalize_location
+
+async def _run_checks():
+    calls = []
+
+    async def fake_fetch(location):
+        calls.append(location)
+        await asyncio.sleep(0.05)
+        if location.lower().startswith("atlantis"):
+            return 404, {'message': 'city not found'}
+        if location.lower().startswith("flaky"):
+            return 503, None
+        return 200, {'name': location}
+
+    cache = WeatherCache(fake_fetch, ttl=60, negative_ttl=60)
+
+    # Ten concurrent lookups for the same city share one request
+    results = await asyncio.gather(*(cache.get("London") for _ in range(10)))
+    assert all(status == 200 for status, _ in results)
+    assert len(calls) == 1 and cache.coalesced == 9 and cache.misses == 1
+    assert cache.hit_rate() == 90.0
+    print(f"✅ 10 concurrent lookups → {len(calls)} request ({cache.coalesced} coalesced)")
+
+    # Normalized city names hit the cache
+    status, _ = await cache.get("  london ")
+    assert status == 200 and len(calls) == 1 and cache.hits == 1
+    print("✅ Normalized city served from cache")
+
+    # 404s are cached too
+    await cache.get("Atlantis")
+    status, _ = await cache.get("atlantis")
+    assert status == 404 and cache.negative_hits == 1 and len(calls) == 2
+    print("✅ City-not-found cached")
+
+    # Transient errors are not cached
+    await cache.get("Flaky")
+    await cache.get("Flaky")
+    assert len(calls) == 4
+    print("✅ 5xx responses not cached")
+
+    # Expired entries are refetched
+    short = WeatherCache(fake_fetch, ttl=0.01)
+    await short.get("Paris")
+    await asyncio.sleep(0.02)
+    await short.get("Paris")
+    assert short.misses == 2
+    print("✅ Entries expire after TTL")
+
+    # Only lookups that would reach the API need a rate limit token
+    assert not cache.needs_fetch(" LONDON") and cache.needs_fetch("Berlin")
+    pending = asyncio.ensure_future(cache.get("Berlin"))
+    await asyncio.sleep(0)
+    assert not cache.needs_fetch("berlin")
+    await pending
+    print("✅ Cached and in-flight cities don't need a fresh request")
+
+    print(f"📊 Hit rate: {cache.hit_rate():.1f}%")
+
+def test_weather_cache():
+    print("🧪 Testing Weather Cache\n")
+    assert normalize_location("  New  York , US") == "new york,us"
+    assert normalize_location((51.5074, -0.1278)) == "51.51,-0.13"
+    asyncio.run(_run_checks())
+
+if __name__ == "__main__":
+    test_weather_cache()
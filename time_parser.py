@@ -0,0 +1,146 @@
+import re
+from datetime import datetime, timedelta, timezone, UTC
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+
+UNIT_SECONDS = {
+    's': 1, 'sec': 1, 'secs': 1, 'second': 1, 'seconds': 1,
+    'm': 60, 'min': 60, 'mins': 60, 'minute': 60, 'minutes': 60,
+    'h': 3600, 'hr': 3600, 'hrs': 3600, 'hour': 3600, 'hours': 3600,
+    'd': 86400, 'day': 86400, 'days': 86400,
+    'w': 604800, 'wk': 604800, 'week': 604800, 'weeks': 604800
+}
+
+# Grammar (case-insensitive, surrounding whitespace ignored):
+#   duration := part (("," | "and")? part)*   part := number unit     e.g. "1h30m", "2d 4h", "1 hour and 5 minutes"
+#   minutes  := number                        a bare number is minutes, as before
+#   clock    := [today|tomorrow] [at] H[:MM] [am|pm] [zone]          e.g. "14:30", "tomorrow 9am", "9:15pm utc"
+#   date     := YYYY-MM-DD [(T|space) HH:MM[:SS]] [zone]             e.g. "2026-10-20", "2026-10-20T14:30+02:00"
+#   zone     := "utc" | "z" | "gmt" | (+|-)HH[:MM] | utc(+|-)H | IANA name ("Europe/Berlin")
+DURATION_PART = re.compile(r'\s*(\d{1,9}(?:\.\d{1,6})?)\s*([a-z]+)\s*(?:,|and\b)?', re.IGNORECASE)
+SIMPLE_DURATION = re.compile(r'\s*(\d{1,9})\s*([a-z]+)?\s*', re.IGNORECASE)
+ZONE = r'(?:\s*(z|[+-]\d{2}:?\d{2}|(?:utc|gmt)(?:[+-]\d{1,2}(?::?\d{2})?)?|[a-z]+(?:/[a-z0-9_+-]+)+))?'
+CLOCK_PATTERN = re.compile(
+    r'\s*(?:(today|tonight|tomorrow)\s+)?(?:at\s+)?(\d{1,2})(?::(\d{2}))?\s*(am|pm)?' + ZONE + r'\s*',
+    re.IGNORECASE
+)
+DATE_PATTERN = re.compile(
+    r'\s*(\d{4})-(\d{2})-(\d{2})(?:[t\s]+(\d{1,2}):(\d{2})(?::(\d{2}))?)?' + ZONE + r'\s*',
+    re.IGNORECASE
+)
+OFFSET_PATTERN = re.compile(r'(?:utc|gmt)?([+-])(\d{1,2}):?(\d{2})?', re.IGNORECASE)
+
+def parse_duration(text):
+    """Seconds in a (possibly compound) duration such as "5m", "1h30m" or "2d 4h", or None"""
+    # Fast path for the common single "<number><unit>" or bare-minutes input
+    match = SIMPLE_DURATION.fullmatch(text)
+    if match:
+        number, unit = match.groups()
+        if unit is None:
+            minutes = int(number)
+            return minutes * 60 if 1 <= minutes <= 10080 else None  # 1 minute to 1 week
+        seconds = UNIT_SECONDS.get(unit.lower())
+        return int(number) * seconds if seconds else None
+
+    total, position, end = 0.0, 0, len(text.rstrip())
+    while position < end:
+        match = DURATION_PART.match(text, position)
+        if not match:
+            return None
+        unit = UNIT_SECONDS.get(match.group(2).lower())
+        if unit is None:
+            return None
+        total += float(match.group(1)) * unit
+        position = match.end()
+    return round(total) if position else None
+
+@lru_cache(maxsize=1)
+def _zone_names():
+    """Lower-cased IANA zone name -> its canonical spelling (read from the tz database once)"""
+    return {zone.lower(): zone for zone in available_timezones()}
+
+def canonical_timezone_name(name):
+    """Canonical IANA spelling of a zone name in any case ("europe/berlin" -> "Europe/Berlin"), else unchanged"""
+    return _zone_names().get(name.lower(), name)
+
+@lru_cache(maxsize=256)
+def parse_timezone(name):
+    """tzinfo for a zone name or UTC offset, or None if it isn't one"""
+    lowered = name.lower()
+    if lowered in ('utc', 'z', 'gmt'):
+        return UTC
+    match = OFFSET_PATTERN.fullmatch(name)
+    if match:
+        sign, hours, minutes = match.groups()
+        offset = timedelta(hours=int(hours), minutes=int(minutes or 0))
+        if offset > timedelta(hours=14):
+            return None
+        return timezone(-offset if sign == '-' else offset)
+    try:
+        return ZoneInfo(canonical_timezone_name(name))
+    except (ZoneInfoNotFoundError, ValueError, OSError):
+        return None
+
+def _zone(name, default):
+    if name is None:
+        return default
+    return parse_timezone(name)
+
+def parse_absolute(text, now, tz=UTC):
+    """Aware datetime for an absolute time ("14:30", "tomorrow 9am", "2026-10-20 14:30"), or None.
+
+    Times without a date are the next such time in tz; an explicit zone in the text overrides tz.
+    """
+    match = DATE_PATTERN.fullmatch(text)
+    if match:
+        year, month, day, hour, minute, second, zone = match.groups()
+        tzinfo = _zone(zone, tz)
+        if tzinfo is None:
+            return None
+        try:
+            return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0),
+                            int(second or 0), tzinfo=tzinfo)
+        except ValueError:
+            return None
+
+    match = CLOCK_PATTERN.fullmatch(text)
+    if not match:
+        return None
+    day_word, hour, minute, meridiem, zone = match.groups()
+    if minute is None and meridiem is None and day_word is None:
+        return None  # a bare number is a duration in minutes, not an hour of the day
+    hour = int(hour)
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem.lower() == 'pm' else 0)
+    elif day_word and day_word.lower() == 'tonight' and hour < 12:
+        hour += 12
+    tzinfo = _zone(zone, tz)
+    if tzinfo is None or hour > 23 or int(minute or 0) > 59:
+        return None
+
+    local_now = now.astimezone(tzinfo)
+    when = local_now.replace(hour=hour, minute=int(minute or 0), second=0, microsecond=0)
+    if day_word and day_word.lower() == 'tomorrow':
+        when += timedelta(days=1)
+    elif when <= local_now and not day_word:
+        when += timedelta(days=1)  # "9:00" after nine o'clock means tomorrow
+    return when  # wall-clock arithmetic, so ZoneInfo resolves DST for the target day
+
+def parse_time_input(text, now=None, tz=UTC):
+    """Seconds from now until the time described by text, or None if it can't be parsed or is in the past.
+
+    Accepts durations ("5m", "1h30m", "2d 4h", "90" = minutes) and absolute times
+    ("14:30", "tomorrow 9am", "2026-10-20 14:30 Europe/Berlin"), read in timezone tz.
+    """
+    seconds = parse_duration(text)
+    if seconds is not None:
+        return seconds
+
+    now = now or datetime.now(UTC)
+    when = parse_absolute(text, now, tz)
+    if when is None:
+        return None
+    seconds = round((when - now).total_seconds())
+    return seconds if seconds > 0 else None
@@ -0,0 +1,83 @@
+import time
+from collections import OrderedDict
+
+from single_flight import SingleFlight
+
+class UserCache:
+    """LRU/TTL cache of fetched user objects in front of a REST fetch, with not-found caching.
+
+    get_cached(user_id) is the free lookup (the gateway cache); fetch(user_id) is the
+    HTTP call it falls back to. A fetch raising not_found is cached as None for
+    negative_ttl; any other error propagates and is not cached.
+    """
+
+    def __init__(self, get_cached, fetch, ttl=3600, negative_ttl=300, max_entries=5000, not_found=LookupError):
+        self.get_cached = get_cached
+        self.fetch = fetch
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.not_found = not_found
+        self._entries = OrderedDict()  # user_id -> (expires_at, user or None)
+        self._flights = SingleFlight()
+        self.gateway_hits = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def fetches(self):
+        """REST calls actually made"""
+        return self._flights.calls
+
+    @property
+    def coalesced(self):
+        return self._flights.coalesced
+
+    @property
+    def saved(self):
+        """REST calls avoided by this cache (gateway hits would not have needed one anyway)"""
+        return self.hits + self.negative_hits + self.coalesced
+
+    def _store(self, user_id, user):
+        ttl = self.ttl if user is not None else self.negative_ttl
+        self._entries[user_id] = (time.monotonic() + ttl, user)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, user_id):
+        """Return the user for user_id, or None if it doesn't exist"""
+        if user_id is None:
+            return None
+        user = self.get_cached(user_id)
+        if user is not None:
+            self.gateway_hits += 1
+            return user
+
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            expires_at, user = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(user_id)
+                if user is None:
+                    self.negative_hits += 1
+                else:
+                    self.hits += 1
+                return user
+            del self._entries[user_id]
+
+        self.misses += 1
+
+        async def fetch_and_store():
+            try:
+                user = await self.fetch(user_id)
+            except self.not_found:
+                user = None
+            self._store(user_id, user)
+            return user
+
+        return await self._flights.run(user_id, fetch_and_store)
@@ -0,0 +1,91 @@
+import re
+import time
+from collections import OrderedDict
+
+from single_flight import SingleFlight
+
+WHITESPACE = re.compile(r'\s+')
+COMMA_SPACING = re.compile(r'\s*,\s*')
+
+def normalize_location(location):
+    """Cache key for a city name ("  New  York , US" -> "new york,us") or (lat, lon) pair"""
+    if isinstance(location, tuple):
+        lat, lon = location
+        return f"{lat:.2f},{lon:.2f}"
+    text = WHITESPACE.sub(" ", location.casefold().strip())
+    return COMMA_SPACING.sub(",", text)
+
+class WeatherCache:
+    """TTL cache in front of a weather fetcher, with request coalescing and 404 caching.
+
+    fetch(location) must return (status, data) as HttpClient.get_json does.
+    """
+
+    def __init__(self, fetch, ttl=600, negative_ttl=300, max_entries=1000):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, status, data)
+        self._flights = SingleFlight()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def coalesced(self):
+        return self._flights.coalesced
+
+    def _store(self, key, status, data):
+        if status == 200:
+            ttl = self.ttl
+        elif status == 404:
+            ttl = self.negative_ttl
+        else:
+            return  # transient errors are never cached
+        self._entries[key] = (time.monotonic() + ttl, status, data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def needs_fetch(self, location):
+        """True if get(location) would call the API (not fresh in cache, no request in flight)"""
+        key = normalize_location(location)
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return False
+        return key not in self._flights
+
+    async def get(self, location):
+        """Return (status, data) for a location, from cache when fresh"""
+        key = normalize_location(location)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, status, data = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                if status == 404:
+                    self.negative_hits += 1
+                else:
+                    self.hits += 1
+                return status, data
+            del self._entries[key]
+
+        # Callers joining a request already in flight are counted as coalesced, not as misses
+        if key not in self._flights:
+            self.misses += 1
+
+        async def fetch_and_store():
+            status, data = await self.fetch(location)
+            self._store(key, status, data)
+            return status, data
+
+        return await self._flights.run(key, fetch_and_store)
+
+    def hit_rate(self):
+        served = self.hits + self.negative_hits + self.coalesced
+        total = served + self.misses
+        return (served / total * 100) if total else 0.0